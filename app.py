@@ -1,13 +1,21 @@
+import io
+import time
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Import custom modules
-from data_utils import load_data, create_input_data
+from data_utils import load_data_cached, create_input_data
+from encoders import CategoricalEncoder
+import explanations
 import model as model_module
 from financial_utils import perform_financial_checks, calculate_affordable_loan
+from prediction_cache import PredictionCache, normalize_applicant
+import instrumentation
+from scorer import LinearScorer
+import what_if
+from training_worker import start_background_training
 
 # Set page configuration
 st.set_page_config(
@@ -154,26 +162,163 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-# Load data (cache to avoid reloading)
-@st.cache_data
+# Load data (cache to avoid reloading). The processed frame is memory-mapped from an
+# on-disk cache shared by every worker; cache_resource hands each session that same
+# read-only frame instead of copying it the way cache_data does.
+@st.cache_resource
 def get_processed_data():
-    return load_data()
+    return load_data_cached()
 
 
-df, raw_df, label_encoders, original_categorical_values = get_processed_data()
+# Fingerprinting hashes the whole frame, so it runs once per loaded frame rather than on every rerun.
+@st.cache_resource
+def get_data_fingerprint():
+    return model_module.compute_model_fingerprint(get_processed_data()[0])
 
 
-# Train model (cache to avoid retraining)
+df, raw_df, label_encoders, original_categorical_values = get_processed_data()
+categorical_encoder = CategoricalEncoder.from_label_encoders(label_encoders)
+
+
+# Load the trained model. Training never runs inside a request: when the current
+# data/config has no published model yet, a background worker trains it while the
+# previous model (if any) keeps serving.
+@st.cache_resource(max_entries=2)
+def load_model_bundle(artifact_path):
+    # Bundle paths embed the model fingerprint, so a path always maps to the same model.
+    # Map its arrays copy-on-write (libsvm needs writable buffers) so worker processes share the pages.
+    return model_module.load_model_artifact(artifact_path, mmap_mode="c")
+
+
+# The Model Insights charts only change with the model, so they are drawn once per model
+# version and every rerun serves the cached PNG bytes. Figures are closed as soon as they
+# are rendered so pyplot does not hold on to them for the life of the server.
+def figure_to_png(fig):
+    import matplotlib.pyplot as plt
+
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+@st.cache_data(max_entries=2)
+def render_insight_figures(model_fingerprint, _feature_names, _feature_importance, _conf_matrix):
+    # matplotlib and seaborn take longer to import than the rest of the app, so they are
+    # only loaded when a model's figures are first drawn.
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    feature_importance_df = pd.DataFrame({
+        'Feature': _feature_names,
+        'Importance': np.abs(_feature_importance)
+    }).sort_values(by='Importance', ascending=False)
+
+    fig, ax = plt.subplots(figsize=(12, 5))
+    sns.barplot(x='Importance', y='Feature', data=feature_importance_df, palette='viridis', ax=ax)
+    ax.set_title('Feature Importance for Loan Approval')
+    ax.set_xlabel('Absolute Importance')
+    importance_png = figure_to_png(fig)
+
+    fig, ax = plt.subplots(figsize=(4, 3))
+    sns.heatmap(_conf_matrix, annot=True, fmt='d', cmap='Blues', ax=ax)
+    ax.set_xlabel('Predicted Label')
+    ax.set_ylabel('True Label')
+    ax.set_title('Confusion Matrix')
+    ax.set_xticklabels(['Rejected', 'Approved'])
+    ax.set_yticklabels(['Rejected', 'Approved'])
+    confusion_png = figure_to_png(fig)
+    return importance_png, confusion_png
+
+
+# The what-if heatmaps depend only on the applicant, the policy inputs and the model, so a
+# resubmitted form reuses its PNG. The sweep itself takes a few milliseconds.
+@st.cache_data(max_entries=64)
+def render_sweep_heatmaps(sweep_key, _sweep, amount_index, tenure_index, rate_index):
+    import matplotlib.pyplot as plt
+
+    amounts = _sweep["loan_amounts"] / 1000
+    loan_amount = amounts[amount_index]
+    loan_term = _sweep["tenures"][tenure_index]
+    interest_rate = _sweep["rates"][rate_index]
+    # Only approvable cells are coloured (by model confidence); everything else shows the grey background.
+    region = np.where(_sweep["approvable"], _sweep["approval_probability"], np.nan)
+
+    fig, (tenure_ax, rate_ax) = plt.subplots(1, 2, figsize=(12, 4), sharey=True)
+    panels = (
+        (tenure_ax, _sweep["tenures"], region[:, :, rate_index], loan_term, "Loan Tenure (months)",
+         f"Amount x tenure at {interest_rate:.1f}%"),
+        (rate_ax, _sweep["rates"], region[:, tenure_index, :], interest_rate, "Interest Rate (%)",
+         f"Amount x rate over {loan_term:.0f} months"),
+    )
+    for ax, x_values, values, x_current, x_label, title in panels:
+        ax.set_facecolor("#D1D5DB")
+        mesh = ax.pcolormesh(x_values, amounts, values, cmap="RdYlGn", vmin=0, vmax=1, shading="nearest")
+        ax.plot(x_current, loan_amount, marker="*", markersize=14, color="#1E3A8A")
+        ax.set_xlabel(x_label)
+        ax.set_title(title)
+    tenure_ax.set_ylabel("Loan Amount (Rs thousands)")
+    fig.colorbar(mesh, ax=[tenure_ax, rate_ax], label="ML approval probability")
+    return figure_to_png(fig)
+
+
+# Launch at most one trainer per process and data version, however many sessions are open. The TTL
+# lets a crashed trainer be relaunched later.
+@st.cache_resource(ttl=600)
+def launch_background_training(model_fingerprint):
+    return start_background_training()
+
+
+def resolve_serving_model():
+    artifact_path, is_current_model = model_module.find_serving_artifact(df, fingerprint=get_data_fingerprint())
+    if not is_current_model:
+        launch_background_training(get_data_fingerprint())
+    model_bundle = load_model_bundle(str(artifact_path)) if artifact_path is not None else None
+    if model_bundle is not None and list(model_bundle[-1]) != df.drop("Loan_Status", axis=1).columns.tolist():
+        model_bundle = None
+    return artifact_path, is_current_model, model_bundle
+
+
+artifact_path, is_current_model, model_bundle = resolve_serving_model()
+if model_bundle is None:
+    # Only this fragment reruns while waiting, without blocking the script thread; the whole
+    # page reruns once a model has been published.
+    @st.fragment(run_every=5)
+    def wait_for_model():
+        if resolve_serving_model()[2] is not None:
+            st.rerun()
+        st.info("⏳ The model is warming up. This page refreshes automatically once training finishes.")
+
+    wait_for_model()
+    st.stop()
+
+if not is_current_model:
+    st.caption("Serving the previous model while an updated version is trained in the background.")
+
+model, scaler, X_test, y_test, y_pred, accuracy, precision, recall, f1, conf_matrix, feature_importance, feature_names = model_bundle
+
+model_version = model_module.fingerprint_from_artifact_path(artifact_path)
+
+
+# One prediction cache per server process, shared by every session. Lookups pass the
+# model version, so a newly published model empties it on first use.
 @st.cache_resource
-def get_trained_model(df):
-    # Support both newer and older model module versions in deployment.
-    if hasattr(model_module, "get_or_train_model"):
-        return model_module.get_or_train_model(df)
-    return model_module.train_model(df)
+def get_prediction_cache():
+    return PredictionCache()
+
+
+prediction_cache = get_prediction_cache()
+
+
+# The what-if sweep scores a whole grid at once with the folded scorer of the serving model.
+@st.cache_resource(max_entries=2)
+def get_sweep_scorer(model_fingerprint, _model, _scaler, _feature_names):
+    return LinearScorer.from_estimator(_model, _scaler, _feature_names, categorical_encoder)
 
 
-model, scaler, X_test, y_test, y_pred, accuracy, precision, recall, f1, conf_matrix, feature_importance, feature_names = get_trained_model(
-    df)
+sweep_scorer = get_sweep_scorer(model_version, model, scaler, feature_names)
 
 # Create tabs for different sections
 tab1, tab2 = st.tabs([ "🧮 Prediction", "🔍 Model Insights"])
@@ -226,258 +371,248 @@ with tab1:
         predict_button = st.button("Predict Loan Approval", use_container_width=True)
 
     if predict_button:
-        # Create applicant data dictionary
-        applicant_data = {
-            "Gender": gender,
-            "Married": married,
-            "Dependents": dependents,
-            "Education": education,
-            "Self_Employed": self_employed,
-            "ApplicantIncome": applicant_income,
-            "CoapplicantIncome": coapplicant_income,
-            "LoanAmount": loan_amount,
-            "Loan_Amount_Term": loan_amount_term,
-            "Credit_History": credit_history,
-            "Property_Area": property_area
-        }
-
-        # Create input data for prediction
-        input_data = create_input_data(applicant_data, label_encoders, feature_names)
-
-        # Get prediction from model
-        model_prediction, probability, scaled_input = model_module.predict_loan_approval(model, scaler, input_data)
-
-        # Conduct financial checks
-        financial_checks = perform_financial_checks(
-            loan_amount,
-            loan_amount_term,
-            applicant_income,
-            coapplicant_income,
-            existing_monthly_debt,
-            interest_rate
-        )
-
-        # Make final decision
-        final_approval = model_prediction == 1 and financial_checks["financially_feasible"]
-
-        # Display financial assessment in a cleaner format
-        st.markdown('<div class="dashboard-container">', unsafe_allow_html=True)
-        st.markdown("### Financial Assessment")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Monthly EMI", f"Rs {financial_checks['monthly_emi']:.2f}")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            lti_status = "✅" if financial_checks["loan_to_income_ok"] else "❌"
-            st.metric("Loan-to-Income Ratio", f"{financial_checks['loan_to_income_ratio']:.3f} {lti_status}",
-                      delta=f"{'Below' if financial_checks['loan_to_income_ok'] else 'Above'} 0.4 threshold")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        with col2:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            affordable_status = "✅" if financial_checks["affordable"] else "❌"
-            total_income = applicant_income + coapplicant_income
-            income_percentage = (financial_checks["monthly_emi"] / total_income) * 100 if total_income > 0 else 0
-            st.metric("Affordability", f"{income_percentage:.2f}% of Income {affordable_status}")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            dti_status = "✅" if financial_checks["debt_to_income_ok"] else "❌"
-            st.metric("Debt-to-Income Ratio", f"{financial_checks['debt_to_income_ratio']:.3f} {dti_status}",
-                      delta=f"{'Below' if financial_checks['debt_to_income_ok'] else 'Above'} 0.43 threshold")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-
-        # Financial feasibility warnings
-        if not financial_checks["loan_to_income_ok"]:
-            st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-            st.markdown("⚠ *Loan-to-Income ratio is too high.* Monthly EMI exceeds 40% of your monthly income.")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        if not financial_checks["debt_to_income_ok"]:
-            st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-            st.markdown("⚠ *Debt-to-Income ratio is too high.* Total debt payments exceed 43% of your monthly income.")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        if not financial_checks["affordable"]:
-            st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-            st.markdown("⚠ *Monthly EMI is too high relative to income.* The loan may not be affordable.")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        # Determine model confidence and decision labels in a consistent way.
-        approval_prob = probability[1]
-        rejection_prob = probability[0]
-        model_confidence = approval_prob if model_prediction == 1 else rejection_prob
-
-        # Display prediction with enhanced UI
-        st.markdown("### Final Prediction Result")
-
-        if final_approval:
-            st.markdown('<div class="prediction-box" style="background-color: #DCEDC8;">', unsafe_allow_html=True)
-            st.markdown(f"### ✅ Loan is likely to be *APPROVED*!")
-            st.markdown("**Final Outcome:** Approved (ML + Financial Policy)")
-            st.markdown(f"**ML Assessment:** {model_confidence:.2%} confidence")
-            st.markdown("**Financial Assessment:** Passed")
-            st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="prediction-box" style="background-color: #FFCDD2;">', unsafe_allow_html=True)
-            st.markdown(f"### ❌ Loan is likely to be *REJECTED*.")
-            st.markdown("**Final Outcome:** Rejected (Policy-based override)")
-            st.markdown(f"**ML Assessment:** {model_confidence:.2%} confidence")
-            st.markdown(
-                f"**Financial Assessment:** {'Passed' if financial_checks['financially_feasible'] else 'Failed'}"
-            )
-            if model_prediction == 1 and not financial_checks["financially_feasible"]:
-                st.markdown("**Reason:** Applicant passed ML screening but failed affordability and debt policy checks.")
-            elif model_prediction == 0:
-                st.markdown("**Reason:** Rejected by the predictive model.")
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        # Show factors in business-friendly language
-        st.markdown("### Key Assessment Drivers (ML)")
-
-        # Create a simplified feature importance for this specific case
-        input_features = pd.DataFrame(scaled_input, columns=feature_names)
-        feature_impact = input_features.iloc[0] * feature_importance
-        feature_impact_df = pd.DataFrame({
-            'Feature': feature_names,
-            'Impact': feature_impact,
-            'Absolute Impact': np.abs(feature_impact)
-        }).sort_values(by='Absolute Impact', ascending=False)
-
-        # User-friendly labels for report-style display
-        feature_display_names = {
-            "Credit_History": "Credit History",
-            "LoanAmount": "Requested Loan Amount",
-            "EMI": "Estimated EMI",
-            "TotalIncome": "Total Monthly Income",
-            "EMIToIncomeRatio": "EMI to Income Ratio",
-            "Self_Employed": "Employment Type",
-            "CoapplicantIncome": "Co-applicant Income",
-            "Dependents": "Number of Dependents",
-            "ApplicantIncome": "Applicant Income",
-            "Loan_Amount_Term": "Loan Tenure",
-            "Property_Area": "Property Location",
-            "Education": "Education",
-            "Married": "Marital Status",
-            "Gender": "Gender"
-        }
-
-        # Apply business-direction overrides so affordability indicators read sensibly.
-        adjusted_feature_impact_df = feature_impact_df.copy()
-        total_income = applicant_income + coapplicant_income
-        monthly_emi = financial_checks["monthly_emi"]
-
-        # "Very low EMI" means <= 30% of monthly income -> strength, else risk.
-        emi_is_strength = total_income > 0 and (monthly_emi / total_income) <= 0.30
-        # "Very high income vs EMI" means income is at least 3x EMI -> strength, else risk.
-        total_income_is_strength = monthly_emi > 0 and (total_income / monthly_emi) >= 3.0
-
-        for feature_name, is_strength in {
-            "EMI": emi_is_strength,
-            "TotalIncome": total_income_is_strength,
-        }.items():
-            feature_rows = adjusted_feature_impact_df["Feature"] == feature_name
-            if feature_rows.any():
-                base_abs_impact = adjusted_feature_impact_df.loc[feature_rows, "Absolute Impact"]
-                adjusted_feature_impact_df.loc[feature_rows, "Impact"] = np.where(
-                    is_strength, base_abs_impact, -base_abs_impact
+        # One timed (and, in profiling mode, profiled) request per prediction; see instrumentation.py.
+        with instrumentation.profile_request("prediction_request"):
+            # Create applicant data dictionary
+            applicant_data = {
+                "Gender": gender,
+                "Married": married,
+                "Dependents": dependents,
+                "Education": education,
+                "Self_Employed": self_employed,
+                "ApplicantIncome": applicant_income,
+                "CoapplicantIncome": coapplicant_income,
+                "LoanAmount": loan_amount,
+                "Loan_Amount_Term": loan_amount_term,
+                "Credit_History": credit_history,
+                "Property_Area": property_area
+            }
+
+            def assess_applicant():
+                # Create input data for prediction
+                input_data = create_input_data(applicant_data, categorical_encoder, feature_names)
+
+                # Get prediction from model
+                model_prediction, probability, scaled_input = model_module.predict_loan_approval(
+                    model, scaler, input_data
                 )
 
-        # Split into supporting and risk drivers for clearer reporting.
-        positive_drivers = adjusted_feature_impact_df[adjusted_feature_impact_df["Impact"] > 0].head(3)
-        negative_drivers = adjusted_feature_impact_df[adjusted_feature_impact_df["Impact"] < 0].head(3)
-
-        def format_feature_value(name, raw_value):
-            """Return human-readable values for report display."""
-            if name == "Credit_History":
-                return "Good" if raw_value == 1.0 else "Poor/Unknown"
-            if name in {"ApplicantIncome", "CoapplicantIncome", "LoanAmount", "EMI", "TotalIncome"}:
-                return f"Rs {raw_value:,.2f}"
-            if name == "Loan_Amount_Term":
-                return f"{int(raw_value)} months"
-            if name == "Dependents":
-                return str(int(raw_value)) if float(raw_value).is_integer() else str(raw_value)
-            return raw_value
-
-        def render_driver_rows(drivers_df, is_positive):
-            for _, row in drivers_df.iterrows():
-                factor_name = row["Feature"]
-                display_name = feature_display_names.get(factor_name, factor_name.replace("_", " "))
-                direction_text = "supports approval" if is_positive else "indicates higher risk"
-                icon = "✅" if is_positive else "⚠️"
+                # Conduct financial checks
+                financial_checks = perform_financial_checks(
+                    loan_amount,
+                    loan_amount_term,
+                    applicant_income,
+                    coapplicant_income,
+                    existing_monthly_debt,
+                    interest_rate
+                )
 
-                if factor_name in label_encoders:
-                    value_to_show = None
-                    for original, encoded in zip(
-                        label_encoders[factor_name].classes_,
-                        range(len(label_encoders[factor_name].classes_))
-                    ):
-                        if encoded == input_data[0][list(feature_names).index(factor_name)]:
-                            value_to_show = original
-                            break
-                else:
-                    raw_value = input_data[0][list(feature_names).index(factor_name)]
-                    value_to_show = format_feature_value(factor_name, raw_value)
+                # Per-feature contributions, with EMI and TotalIncome signed by the affordability rules
+                # so they read sensibly in the report.
+                contributions = explanations.apply_direction_overrides(
+                    explanations.feature_contributions(scaled_input, feature_importance),
+                    feature_names,
+                    applicant_income + coapplicant_income,
+                    financial_checks["monthly_emi"],
+                )
+                # Split into supporting and risk drivers for clearer reporting.
+                drivers = dict(zip(("positive", "negative"), explanations.top_drivers(contributions)))
+                driver_values = {
+                    side: explanations.display_values(input_data, side_drivers, feature_names, categorical_encoder)
+                    for side, side_drivers in drivers.items()
+                }
+                return model_prediction, probability, financial_checks, contributions, drivers, driver_values
+
+            # Resubmitting the same form (in any session) reuses the assessment for the serving model.
+            with instrumentation.stage("assessment"):
+                assessment = prediction_cache.get_or_compute(
+                    normalize_applicant(applicant_data, existing_monthly_debt=existing_monthly_debt,
+                                        interest_rate=interest_rate),
+                    model_version,
+                    assess_applicant,
+                )
+            model_prediction, probability, financial_checks, contributions, drivers, driver_values = assessment
+            render_start = time.perf_counter()
 
-                st.write(f"{icon} **{display_name}:** {value_to_show} and {direction_text}.")
+            # Make final decision
+            final_approval = model_prediction == 1 and financial_checks["financially_feasible"]
 
-        col_pos, col_neg = st.columns(2)
+            # Display financial assessment in a cleaner format
+            st.markdown('<div class="dashboard-container">', unsafe_allow_html=True)
+            st.markdown("### Financial Assessment")
 
-        with col_pos:
-            st.markdown("#### Strengths in this Application")
-            if positive_drivers.empty:
-                st.write("No strong supporting ML drivers identified for this profile.")
-            else:
-                render_driver_rows(positive_drivers, is_positive=True)
+            col1, col2 = st.columns(2)
 
-        with col_neg:
-            st.markdown("#### Risk Indicators to Improve")
-            if negative_drivers.empty:
-                st.write("No major risk indicators were flagged by the ML model for this profile.")
-            else:
-                render_driver_rows(negative_drivers, is_positive=False)
+            with col1:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                st.metric("Monthly EMI", f"Rs {financial_checks['monthly_emi']:.2f}")
+                st.markdown('</div>', unsafe_allow_html=True)
 
-        st.caption(
-            "Note: ML assessment reflects historical approval patterns. "
-            "Final lending outcome also applies financial policy checks."
-        )
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                lti_status = "✅" if financial_checks["loan_to_income_ok"] else "❌"
+                st.metric("Loan-to-Income Ratio", f"{financial_checks['loan_to_income_ratio']:.3f} {lti_status}",
+                          delta=f"{'Below' if financial_checks['loan_to_income_ok'] else 'Above'} 0.4 threshold")
+                st.markdown('</div>', unsafe_allow_html=True)
 
-        # Suggestions for improvement if rejected
-        if not final_approval:
-            st.markdown("### Suggestions for Improvement")
+            with col2:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                affordable_status = "✅" if financial_checks["affordable"] else "❌"
+                total_income = applicant_income + coapplicant_income
+                income_percentage = (financial_checks["monthly_emi"] / total_income) * 100 if total_income > 0 else 0
+                st.metric("Affordability", f"{income_percentage:.2f}% of Income {affordable_status}")
+                st.markdown('</div>', unsafe_allow_html=True)
 
-            if credit_history == 0.0:
-                st.write("✨ Improving your credit history could significantly increase approval chances")
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                dti_status = "✅" if financial_checks["debt_to_income_ok"] else "❌"
+                st.metric("Debt-to-Income Ratio", f"{financial_checks['debt_to_income_ratio']:.3f} {dti_status}",
+                          delta=f"{'Below' if financial_checks['debt_to_income_ok'] else 'Above'} 0.43 threshold")
+                st.markdown('</div>', unsafe_allow_html=True)
 
-            if income_loan_ratio < 0.01:
-                st.write("✨ Consider increasing your monthly income or applying for a smaller loan amount")
 
+            # Financial feasibility warnings
             if not financial_checks["loan_to_income_ok"]:
-                st.write("✨ Consider a longer loan tenure to reduce your monthly EMI")
+                st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+                st.markdown("⚠ *Loan-to-Income ratio is too high.* Monthly EMI exceeds 40% of your monthly income.")
+                st.markdown('</div>', unsafe_allow_html=True)
 
             if not financial_checks["debt_to_income_ok"]:
-                st.write("✨ Work on reducing your existing debt before applying for this loan")
+                st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+                st.markdown(
+                    "⚠ *Debt-to-Income ratio is too high.* Total debt payments exceed 43% of your monthly income."
+                )
+                st.markdown('</div>', unsafe_allow_html=True)
 
             if not financial_checks["affordable"]:
-                reduced_loan = calculate_affordable_loan(
-                    monthly_income=applicant_income + coapplicant_income,
-                    interest_rate=interest_rate,
-                    tenure_months=loan_amount_term,
-                    max_emi_percent=0.3
+                st.markdown('<div class="warning-box">', unsafe_allow_html=True)
+                st.markdown("⚠ *Monthly EMI is too high relative to income.* The loan may not be affordable.")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            # Determine model confidence and decision labels in a consistent way.
+            approval_prob = probability[1]
+            rejection_prob = probability[0]
+            model_confidence = approval_prob if model_prediction == 1 else rejection_prob
+
+            # Display prediction with enhanced UI
+            st.markdown("### Final Prediction Result")
+
+            if final_approval:
+                st.markdown('<div class="prediction-box" style="background-color: #DCEDC8;">', unsafe_allow_html=True)
+                st.markdown(f"### ✅ Loan is likely to be *APPROVED*!")
+                st.markdown("**Final Outcome:** Approved (ML + Financial Policy)")
+                st.markdown(f"**ML Assessment:** {model_confidence:.2%} confidence")
+                st.markdown("**Financial Assessment:** Passed")
+                st.markdown('</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="prediction-box" style="background-color: #FFCDD2;">', unsafe_allow_html=True)
+                st.markdown(f"### ❌ Loan is likely to be *REJECTED*.")
+                st.markdown("**Final Outcome:** Rejected (Policy-based override)")
+                st.markdown(f"**ML Assessment:** {model_confidence:.2%} confidence")
+                st.markdown(
+                    f"**Financial Assessment:** {'Passed' if financial_checks['financially_feasible'] else 'Failed'}"
                 )
-                st.write(f"✨ A loan amount of approximately Rs {reduced_loan:,.2f} may be more affordable")
+                if model_prediction == 1 and not financial_checks["financially_feasible"]:
+                    st.markdown(
+                        "**Reason:** Applicant passed ML screening but failed affordability and debt policy checks."
+                    )
+                elif model_prediction == 0:
+                    st.markdown("**Reason:** Rejected by the predictive model.")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            # Show factors in business-friendly language
+            st.markdown("### Key Assessment Drivers (ML)")
+
+            def render_driver_rows(side, is_positive):
+                direction_text = "supports approval" if is_positive else "indicates higher risk"
+                icon = "✅" if is_positive else "⚠️"
+                for position, value_to_show in zip(drivers[side][0].tolist(), driver_values[side][0].tolist()):
+                    if position < 0:
+                        break
+                    display_name = explanations.display_name(feature_names[position])
+                    st.write(f"{icon} **{display_name}:** {value_to_show} and {direction_text}.")
+
+            col_pos, col_neg = st.columns(2)
+
+            with col_pos:
+                st.markdown("#### Strengths in this Application")
+                if drivers["positive"][0, 0] < 0:
+                    st.write("No strong supporting ML drivers identified for this profile.")
+                else:
+                    render_driver_rows("positive", is_positive=True)
+
+            with col_neg:
+                st.markdown("#### Risk Indicators to Improve")
+                if drivers["negative"][0, 0] < 0:
+                    st.write("No major risk indicators were flagged by the ML model for this profile.")
+                else:
+                    render_driver_rows("negative", is_positive=False)
 
-            # Look at negative feature impacts for suggestions
-            negative_impacts = feature_impact_df[feature_impact_df['Impact'] < 0].sort_values(by='Impact')
+            st.caption(
+                "Note: ML assessment reflects historical approval patterns. "
+                "Final lending outcome also applies financial policy checks."
+            )
+
+            # Suggestions for improvement if rejected
+            if not final_approval:
+                st.markdown("### Suggestions for Improvement")
+
+                if credit_history == 0.0:
+                    st.write("✨ Improving your credit history could significantly increase approval chances")
+
+                if income_loan_ratio < 0.01:
+                    st.write("✨ Consider increasing your monthly income or applying for a smaller loan amount")
+
+                if not financial_checks["loan_to_income_ok"]:
+                    st.write("✨ Consider a longer loan tenure to reduce your monthly EMI")
+
+                if not financial_checks["debt_to_income_ok"]:
+                    st.write("✨ Work on reducing your existing debt before applying for this loan")
+
+                if not financial_checks["affordable"]:
+                    reduced_loan = calculate_affordable_loan(
+                        monthly_income=applicant_income + coapplicant_income,
+                        interest_rate=interest_rate,
+                        tenure_months=loan_amount_term,
+                        max_emi_percent=0.3
+                    )
+                    st.write(f"✨ A loan amount of approximately Rs {reduced_loan:,.2f} may be more affordable")
+
+                # Look at negative feature impacts for suggestions
+                feature_positions = {name: position for position, name in enumerate(feature_names)}
+
+                if "Property_Area" in feature_positions and contributions[0, feature_positions["Property_Area"]] < 0:
+                    st.write(
+                        "✨ Property area appears to negatively impact your approval - consider properties in areas with higher approval rates")
+
+            # One sweep covers the amounts, tenures and rates a user would otherwise try one by one.
+            st.markdown("### What-If: Approvable Region")
+            sweep = what_if.sweep_applicant(
+                sweep_scorer,
+                applicant_data,
+                *what_if.default_axes(loan_amount, loan_amount_term, interest_rate),
+                existing_debt=existing_monthly_debt,
+            )
+            amount_index = int(np.searchsorted(sweep["loan_amounts"], loan_amount))
+            tenure_index = int(np.searchsorted(sweep["tenures"], loan_amount_term))
+            rate_index = int(np.searchsorted(sweep["rates"], round(interest_rate, 1)))
+            st.image(
+                render_sweep_heatmaps(
+                    (model_version, normalize_applicant(applicant_data, existing_monthly_debt=existing_monthly_debt,
+                                                        interest_rate=interest_rate)),
+                    sweep, amount_index, tenure_index, rate_index,
+                ),
+                width="stretch",
+            )
+            largest_amount = what_if.max_approvable_amount(sweep)[tenure_index, rate_index]
+            if np.isnan(largest_amount):
+                st.caption("No loan amount in the sweep is approvable at this tenure and interest rate.")
+            else:
+                st.caption(
+                    f"At {interest_rate:.1f}% over {loan_amount_term} months, loans of up to Rs {largest_amount:,.0f} "
+                    f"are approvable (amounts swept up to Rs {sweep['loan_amounts'][-1]:,.0f}). "
+                    "Grey cells fail the ML screening or the financial policy checks."
+                )
 
-            if not negative_impacts.empty and "Property_Area" in negative_impacts['Feature'].values:
-                st.write(
-                    "✨ Property area appears to negatively impact your approval - consider properties in areas with higher approval rates")
+            instrumentation.observe("render", time.perf_counter() - render_start)
 
 
 
@@ -520,33 +655,21 @@ with tab2:
 
 
 
+    importance_png, confusion_png = render_insight_figures(
+        model_version, feature_names, feature_importance, conf_matrix
+    )
+
     # Feature importance
     col1, col2= st.columns([2, 1])
     with col1:
         st.markdown("### Feature Importance")
-        feature_importance_df = pd.DataFrame({
-            'Feature': feature_names,
-            'Importance': np.abs(feature_importance)
-        }).sort_values(by='Importance', ascending=False)
-    
-        fig, ax = plt.subplots(figsize=(12, 5))
-        sns.barplot(x='Importance', y='Feature', data=feature_importance_df, palette='viridis', ax=ax)
-        ax.set_title('Feature Importance for Loan Approval')
-        ax.set_xlabel('Absolute Importance')
-        st.pyplot(fig)
+        st.image(importance_png, width="stretch")
         st.markdown('</div>', unsafe_allow_html=True)
 
     with col2:
         # Confusion matrix
         st.markdown("### Confusion Matrix")
-        fig, ax = plt.subplots(figsize=(4, 3))
-        sns.heatmap(conf_matrix, annot=True, fmt='d', cmap='Blues', ax=ax)
-        ax.set_xlabel('Predicted Label')
-        ax.set_ylabel('True Label')
-        ax.set_title('Confusion Matrix')
-        ax.set_xticklabels(['Rejected', 'Approved'])
-        ax.set_yticklabels(['Rejected', 'Approved'])
-        st.pyplot(fig)
+        st.image(confusion_png, width="stretch")
 
     
 
@@ -573,3 +696,14 @@ with tab2:
         st.markdown('</div>', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
+    cache_stats = prediction_cache.stats()
+    st.caption(
+        f"Prediction cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+        f"({cache_stats['hit_rate']:.0%} hit rate), {cache_stats['entries']} cached applicants."
+    )
+
+    if instrumentation.enabled():
+        with st.expander("Pipeline timings"):
+            st.code(instrumentation.export_prometheus(), language="text")
+            st.download_button("Download JSON", instrumentation.export_json(indent=2),
+                               file_name="pipeline_metrics.json", mime="application/json")
@@ -0,0 +1,289 @@
+"""
+Headless batch scoring
+
+Scores a file of loan applications shaped like the training CSV (Loan_Status
+is not needed) with the exported model and the financial policy, and writes
+one decision row per application:
+
+    python batch_score.py applications.csv decisions.csv --workers 8
+    python batch_score.py applications.parquet decisions.parquet --interest-rate 9.5
+    python batch_score.py applications.csv decisions.csv --reason-codes 3
+
+Missing values are filled with the training data's modes and medians and the
+features are built exactly as in load_data/create_input_data. The input is
+streamed in chunks that a pool of worker processes score in parallel, so
+memory stays bounded by the chunk size times the number of workers. Parquet
+input and output need pyarrow.
+"""
+import argparse
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_utils import DATA_PATH, RAW_DTYPES, compute_ingestion_stats
+from explanations import explain_applicants, reason_codes
+from features import build_feature_matrix
+from financial_utils import perform_financial_checks_batch
+from scorer import INFERENCE_ARTIFACT_PATH, load_scorer, resolve_scorer
+
+
+APPLICATION_DTYPES = {col: dtype for col, dtype in RAW_DTYPES.items() if col != "Loan_Status"}
+# Optional per-application column; when absent every applicant gets --existing-debt.
+EXISTING_DEBT_COLUMN = "Existing_Monthly_Debt"
+DEFAULT_CHUNKSIZE = 50_000
+
+# Per-process scoring state, set once by _init_worker.
+_worker_state = {}
+
+
+def score_applications(applications, scorer, fill_values, interest_rate=8.5, existing_debt=0.0, n_reasons=0):
+    """
+    Score a chunk of raw applications with the model and the financial policy
+
+    Args:
+        applications (pandas.DataFrame): Raw applications in the training CSV layout (LoanAmount in thousands)
+        scorer (LinearScorer): Exported model
+        fill_values (dict): Training-data fills from compute_ingestion_stats
+        interest_rate (float): Annual interest rate in percentage used for the EMI checks
+        existing_debt (float): Monthly debt for applicants without an Existing_Monthly_Debt value
+        n_reasons (int): Strength and risk reason codes to attach per application (0 for none)
+
+    Returns:
+        pandas.DataFrame: Model prediction and probability, financial checks and final_approval per
+        application, plus strength_1..n and risk_1..n feature names when n_reasons is set
+    """
+    applications = applications.fillna(fill_values)
+    columns = {col: applications[col].to_numpy() for col in scorer.feature_names if col in applications}
+    # The file follows the training schema, so convert the loan amount from thousands to rupees.
+    columns["LoanAmount"] = applications["LoanAmount"].to_numpy(dtype=float) * 1000
+    columns["Loan_Amount_Term"] = applications["Loan_Amount_Term"].to_numpy(dtype=float)
+
+    input_data = build_feature_matrix(columns, scorer.encoder, scorer.feature_names)
+    predictions, probabilities = scorer.predict(input_data)
+
+    if EXISTING_DEBT_COLUMN in applications:
+        existing_debt = applications[EXISTING_DEBT_COLUMN].fillna(existing_debt).to_numpy(dtype=float)
+    checks = perform_financial_checks_batch(
+        columns["LoanAmount"],
+        columns["Loan_Amount_Term"],
+        applications["ApplicantIncome"].to_numpy(dtype=float),
+        applications["CoapplicantIncome"].to_numpy(dtype=float),
+        existing_debt,
+        interest_rate,
+    )
+
+    results = pd.DataFrame(index=applications.index)
+    if "Loan_ID" in applications:
+        results["Loan_ID"] = applications["Loan_ID"]
+    results["model_prediction"] = predictions
+    results["approval_probability"] = probabilities[:, 1]
+    for name, values in checks.items():
+        results[name] = np.broadcast_to(values, len(results))
+    results["final_approval"] = (predictions == 1) & results["financially_feasible"].to_numpy()
+
+    if n_reasons:
+        explanation = explain_applicants(
+            input_data, scorer.coef, scorer.mean, scorer.scale, scorer.feature_names,
+            total_income=applications["ApplicantIncome"].to_numpy(dtype=float)
+            + applications["CoapplicantIncome"].to_numpy(dtype=float),
+            monthly_emi=checks["monthly_emi"],
+            k=n_reasons,
+        )
+        for side, column_prefix in (("strengths", "strength"), ("risks", "risk")):
+            codes = reason_codes(explanation[side], scorer.feature_names)
+            for rank in range(codes.shape[1]):
+                results[f"{column_prefix}_{rank + 1}"] = codes[:, rank]
+    return results
+
+
+def iter_application_chunks(input_path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Stream raw applications from a CSV or Parquet file
+
+    Args:
+        input_path (str or Path): Applications file (.csv or .parquet)
+        chunksize (int): Rows per chunk
+
+    Yields:
+        pandas.DataFrame: Raw application chunks with the training dtypes
+    """
+    input_path = Path(input_path)
+    if input_path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunksize):
+            chunk = batch.to_pandas()
+            yield chunk.astype({col: dtype for col, dtype in APPLICATION_DTYPES.items() if col in chunk})
+    else:
+        yield from pd.read_csv(input_path, chunksize=chunksize, dtype=APPLICATION_DTYPES)
+
+
+class ResultWriter:
+    """
+    Append scored chunks to a CSV or Parquet file
+
+    Chunks go to a temporary file next to the destination, which is renamed into
+    place on close, so an interrupted run never leaves a partial result behind.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.parquet = self.output_path.suffix.lower() == ".parquet"
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=self.output_path.parent, prefix=f".{self.output_path.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        self._parquet_writer = None
+        self._rows = 0
+
+    def write(self, results):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(results, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self._tmp_path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            results.to_csv(self._tmp_path, mode="a", header=self._rows == 0, index=False)
+        self._rows += len(results)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        os.replace(self._tmp_path, self.output_path)
+
+    def abort(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        Path(self._tmp_path).unlink(missing_ok=True)
+
+
+def _init_worker(artifact_path, fill_values, interest_rate, existing_debt, n_reasons):
+    _worker_state.update(
+        scorer=load_scorer(artifact_path),
+        fill_values=fill_values,
+        interest_rate=interest_rate,
+        existing_debt=existing_debt,
+        n_reasons=n_reasons,
+    )
+
+
+def _score_in_worker(applications):
+    return score_applications(applications, **_worker_state)
+
+
+@contextmanager
+def _scoring_pool(workers, worker_args):
+    """Yield a function mapping raw chunks to scored chunks, in input order."""
+    if workers == 1:
+        _init_worker(*worker_args)
+        yield lambda chunks: map(_score_in_worker, chunks)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=worker_args) as executor:
+        def score_chunks(chunks):
+            # Keep a couple of chunks per worker in flight so memory stays bounded.
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_score_in_worker, chunk))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+        yield score_chunks
+
+
+def score_file(input_path, output_path, artifact_path=INFERENCE_ARTIFACT_PATH, training_data=DATA_PATH,
+               interest_rate=8.5, existing_debt=0.0, chunksize=DEFAULT_CHUNKSIZE, workers=None, n_reasons=0):
+    """
+    Score an applications file end to end
+
+    Args:
+        input_path (str or Path): Applications file (.csv or .parquet)
+        output_path (str or Path): Destination file (.csv or .parquet)
+        artifact_path (str or Path): Inference artifact written by export_inference_artifact
+        training_data (str or Path): Training CSV whose modes/medians fill missing values
+        interest_rate (float): Annual interest rate in percentage used for the EMI checks
+        existing_debt (float): Monthly debt for applicants without an Existing_Monthly_Debt value
+        chunksize (int): Rows per chunk
+        workers (int, optional): Worker processes; defaults to the number of CPUs. 1 scores in-process.
+        n_reasons (int): Strength and risk reason codes to attach per application (0 for none)
+
+    Returns:
+        dict: rows, approved, seconds, rows_per_second and workers
+    """
+    workers = workers or os.cpu_count() or 1
+    resolve_scorer(artifact_path)
+    fill_values = compute_ingestion_stats(training_data)["fill_values"]
+    worker_args = (artifact_path, fill_values, interest_rate, existing_debt, n_reasons)
+
+    start = time.perf_counter()
+    rows = approved = 0
+    writer = ResultWriter(output_path)
+    try:
+        with _scoring_pool(workers, worker_args) as score_chunks:
+            for results in score_chunks(iter_application_chunks(input_path, chunksize)):
+                writer.write(results)
+                rows += len(results)
+                approved += int(results["final_approval"].sum())
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "approved": approved,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds > 0 else float("inf"),
+        "workers": workers,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a file of loan applications with the model and policy.")
+    parser.add_argument("input", help="Applications file (.csv or .parquet) in the training CSV layout")
+    parser.add_argument("output", help="Destination file (.csv or .parquet)")
+    parser.add_argument("--artifact", default=str(INFERENCE_ARTIFACT_PATH), help="Inference artifact (.npz)")
+    parser.add_argument("--training-data", default=DATA_PATH, help="Training CSV used for missing-value fills")
+    parser.add_argument("--interest-rate", type=float, default=8.5, help="Annual interest rate (%%) for EMI checks")
+    parser.add_argument("--existing-debt", type=float, default=0.0,
+                        help=f"Monthly debt for rows without an {EXISTING_DEBT_COLUMN} value")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all CPUs)")
+    parser.add_argument("--reason-codes", type=int, default=0, metavar="K",
+                        help="Attach the top K strength and risk features per application")
+    args = parser.parse_args()
+
+    try:
+        summary = score_file(
+            args.input,
+            args.output,
+            artifact_path=Path(args.artifact),
+            training_data=args.training_data,
+            interest_rate=args.interest_rate,
+            existing_debt=args.existing_debt,
+            chunksize=args.chunksize,
+            workers=args.workers,
+            n_reasons=args.reason_codes,
+        )
+    except (FileNotFoundError, RuntimeError) as exc:
+        raise SystemExit(str(exc))
+    print(f"Scored {summary['rows']:,} applications ({summary['approved']:,} approved) in {summary['seconds']:.2f}s"
+          f" with {summary['workers']} worker(s): {summary['rows_per_second']:,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Check the shared annuity-factor table against the exact EMI formula and time it
+
+Loans are drawn on the app's rate grid and loan terms, plus a share of
+off-grid rates and terms that must fall back to the exact computation.
+
+Usage:
+    python benchmarks/bench_annuity_table.py --loans 1000000 --off-grid 0.05
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from financial_utils import (  # noqa: E402
+    ANNUITY_TABLE,
+    TERM_GRID,
+    calculate_affordable_loan,
+    calculate_affordable_loan_batch,
+    calculate_emi,
+    calculate_emi_batch,
+)
+
+
+def exact_emi(loan_amount, interest_rate, tenure_months):
+    """Reference EMI straight from P * r * (1+r)^n / ((1+r)^n - 1)."""
+    monthly_rate = interest_rate / 100 / 12
+    growth = (1 + monthly_rate) ** tenure_months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(monthly_rate == 0, loan_amount / tenure_months,
+                        loan_amount * monthly_rate * growth / (growth - 1))
+
+
+def exact_scalar_emi(loan_amount, interest_rate, tenure_months):
+    """The pre-table scalar calculate_emi."""
+    monthly_rate = (interest_rate / 100) / 12
+    if monthly_rate == 0:
+        return loan_amount / tenure_months
+    growth = (1 + monthly_rate) ** tenure_months
+    return loan_amount * monthly_rate * growth / (growth - 1)
+
+
+def best_of(fn, repeats=5):
+    """Fastest wall time of several runs, in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def make_loans(n_loans, off_grid_share, seed=42):
+    rng = np.random.default_rng(seed)
+    loan_amount = np.round(rng.lognormal(11.8, 0.5, n_loans), -3)
+    interest_rate = np.round(rng.uniform(5.0, 18.0, n_loans), 1)
+    tenure_months = rng.choice(TERM_GRID, size=n_loans).astype(float)
+
+    off_grid = rng.random(n_loans) < off_grid_share
+    interest_rate[off_grid] = rng.uniform(0.0, 25.0, off_grid.sum())
+    tenure_months[off_grid] = rng.integers(1, 481, off_grid.sum())
+    interest_rate[::997] = 0.0
+    return loan_amount, interest_rate, tenure_months
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--loans", type=int, default=1_000_000)
+    parser.add_argument("--off-grid", type=float, default=0.05, help="Share of loans off the rate/term grid")
+    args = parser.parse_args()
+
+    loan_amount, interest_rate, tenure_months = make_loans(args.loans, args.off_grid)
+    expected = exact_emi(loan_amount, interest_rate, tenure_months)
+    emi = calculate_emi_batch(loan_amount, interest_rate, tenure_months)
+    assert np.allclose(emi, expected, rtol=1e-12, atol=0)
+
+    # The whole grid, the scalar path and the inverse (affordability) path agree too.
+    grid_rates, grid_terms = np.meshgrid(ANNUITY_TABLE.rates, ANNUITY_TABLE.terms, indexing="ij")
+    assert np.allclose(calculate_emi_batch(1.0, grid_rates, grid_terms), exact_emi(1.0, grid_rates, grid_terms),
+                       rtol=1e-12, atol=0)
+    sample = slice(0, min(args.loans, 100_000))
+    rows = list(zip(loan_amount[sample].tolist(), interest_rate[sample].tolist(), tenure_months[sample].tolist()))
+    assert np.allclose([calculate_emi(*row) for row in rows], expected[sample], rtol=1e-12, atol=0)
+    affordable = calculate_affordable_loan_batch(emi / 0.3, interest_rate, tenure_months)
+    assert np.allclose(affordable, loan_amount, rtol=1e-9, atol=0)
+    assert np.isclose(calculate_affordable_loan(emi[0] / 0.3, interest_rate[0], tenure_months[0]), loan_amount[0],
+                      rtol=1e-9, atol=0)
+    reference_rate = 8.5
+    assert np.allclose(calculate_emi_batch(loan_amount, reference_rate, tenure_months),
+                       exact_emi(loan_amount, reference_rate, tenure_months), rtol=1e-12, atol=0)
+
+    print(f"table: {ANNUITY_TABLE.rates.size} rate buckets x {ANNUITY_TABLE.terms.size} terms,"
+          f" {args.off_grid:.0%} of loans off the grid")
+    print(f"{'workload':<28} | {'exact /s':>14} | {'table /s':>14} | speedup")
+    workloads = [
+        ("per-loan rates (batch)", len(loan_amount),
+         lambda: exact_emi(loan_amount, interest_rate, tenure_months),
+         lambda: calculate_emi_batch(loan_amount, interest_rate, tenure_months)),
+        ("reference rate (features)", len(loan_amount),
+         lambda: exact_emi(loan_amount, reference_rate, tenure_months),
+         lambda: calculate_emi_batch(loan_amount, reference_rate, tenure_months)),
+        ("scalar calculate_emi", len(rows),
+         lambda: [exact_scalar_emi(*row) for row in rows],
+         lambda: [calculate_emi(*row) for row in rows]),
+    ]
+    for name, n_loans, exact_fn, table_fn in workloads:
+        exact_seconds = best_of(exact_fn)
+        table_seconds = best_of(table_fn)
+        print(f"{name:<28} | {n_loans / exact_seconds:>14,.0f} | {n_loans / table_seconds:>14,.0f}"
+              f" | {exact_seconds / table_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
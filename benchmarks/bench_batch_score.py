@@ -0,0 +1,89 @@
+"""
+Throughput of the batch-scoring CLI against worker count, checked against the app's scalar path
+
+Usage:
+    python benchmarks/bench_batch_score.py --rows 1000000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from batch_score import score_file  # noqa: E402
+from data_utils import DATA_PATH, compute_ingestion_stats, create_input_data, load_data  # noqa: E402
+from financial_utils import perform_financial_checks  # noqa: E402
+import model as model_module  # noqa: E402
+from synthetic import RAW_COLUMNS, make_applications  # noqa: E402
+
+
+def check_against_app(applications, decisions, interest_rate, sample_size=500):
+    """Assert sampled rows match create_input_data + predict_loan_approval + perform_financial_checks."""
+    df, _, label_encoders, _ = load_data(keep_raw=False)
+    model, scaler = model_module.get_or_train_model(df)[:2]
+    feature_names = df.drop("Loan_Status", axis=1).columns.tolist()
+    filled = applications.fillna(compute_ingestion_stats(DATA_PATH)["fill_values"])
+    applicant_fields = [col for col in RAW_COLUMNS if col not in ("Loan_ID", "Loan_Status")]
+
+    rng = np.random.default_rng(0)
+    for row in rng.choice(len(applications), size=min(sample_size, len(applications)), replace=False):
+        applicant_data = filled.iloc[row][applicant_fields].to_dict()
+        applicant_data["LoanAmount"] *= 1000
+        prediction, probability, _ = model_module.predict_loan_approval(
+            model, scaler, create_input_data(applicant_data, label_encoders, feature_names)
+        )
+        checks = perform_financial_checks(applicant_data["LoanAmount"], applicant_data["Loan_Amount_Term"],
+                                          applicant_data["ApplicantIncome"], applicant_data["CoapplicantIncome"],
+                                          0, interest_rate)
+        scored = decisions.iloc[row]
+        assert scored["model_prediction"] == prediction
+        assert np.isclose(scored["approval_probability"], probability[1], rtol=0, atol=1e-9)
+        assert np.isclose(scored["monthly_emi"], checks["monthly_emi"], rtol=1e-12, atol=0)
+        assert scored["financially_feasible"] == checks["financially_feasible"]
+        assert scored["final_approval"] == (prediction == 1 and checks["financially_feasible"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = Path(tmp_dir) / f"applications.{args.format}"
+        applications = make_applications(args.rows, include_target=False)
+        if args.format == "parquet":
+            applications.to_parquet(input_path, index=False)
+        else:
+            applications.to_csv(input_path, index=False)
+
+        reference = None
+        print(f"{'workers':>7} | {'seconds':>8} | {'rows/sec':>12}")
+        for workers in dict.fromkeys(args.workers):
+            output_path = Path(tmp_dir) / f"decisions_{workers}.{args.format}"
+            start = time.perf_counter()
+            score_file(input_path, output_path, chunksize=args.chunksize, workers=workers)
+            seconds = time.perf_counter() - start
+            print(f"{workers:>7} | {seconds:>8.2f} | {args.rows / seconds:>12,.0f}")
+
+            decisions = (pd.read_parquet(output_path) if args.format == "parquet"
+                         else pd.read_csv(output_path, dtype={"Loan_ID": "str"}))
+            if reference is None:
+                reference = decisions
+                check_against_app(applications, decisions, interest_rate=8.5)
+            else:
+                pd.testing.assert_frame_equal(decisions, reference)
+
+
+if __name__ == "__main__":
+    main()
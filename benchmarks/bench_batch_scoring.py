@@ -0,0 +1,59 @@
+"""
+Compare batch scoring throughput against the single-row prediction loop
+
+Usage:
+    python benchmarks/bench_batch_scoring.py --rows 100000 --loop-rows 2000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import load_data  # noqa: E402
+import model as model_module  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Applicants scored by the batch path")
+    parser.add_argument("--loop-rows", type=int, default=2_000, help="Applicants scored by the single-row loop")
+    args = parser.parse_args()
+
+    df, _, _, _ = load_data()
+    model, scaler = model_module.get_or_train_model(df)[:2]
+
+    # Resample the encoded training rows to build a large applicant queue.
+    features = df.drop("Loan_Status", axis=1).to_numpy(dtype=float)
+    rng = np.random.default_rng(42)
+    queue = features[rng.integers(0, len(features), size=args.rows)]
+
+    start = time.perf_counter()
+    loop_results = [
+        model_module.predict_loan_approval(model, scaler, row.reshape(1, -1))
+        for row in queue[:args.loop_rows]
+    ]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictions, probabilities, _ = model_module.predict_loan_approval_batch(model, scaler, queue)
+    batch_seconds = time.perf_counter() - start
+
+    # Both paths must agree row for row.
+    loop_predictions = np.array([result[0] for result in loop_results])
+    loop_probabilities = np.array([result[1] for result in loop_results])
+    assert np.array_equal(loop_predictions, predictions[:args.loop_rows])
+    assert np.allclose(loop_probabilities, probabilities[:args.loop_rows])
+
+    loop_rate = args.loop_rows / loop_seconds
+    batch_rate = args.rows / batch_seconds
+    print(f"single-row loop : {args.loop_rows:>9,} rows in {loop_seconds:8.3f}s -> {loop_rate:>12,.0f} rows/sec")
+    print(f"batch           : {args.rows:>9,} rows in {batch_seconds:8.3f}s -> {batch_rate:>12,.0f} rows/sec")
+    print(f"speedup         : {batch_rate / loop_rate:,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
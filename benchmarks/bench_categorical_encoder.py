@@ -0,0 +1,75 @@
+"""
+Compare CategoricalEncoder against per-field LabelEncoder.transform calls
+
+Usage:
+    python benchmarks/bench_categorical_encoder.py --applicants 20000 --column-rows 1000000
+"""
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import CATEGORICAL_COLUMNS, load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--applicants", type=int, default=20_000)
+    parser.add_argument("--column-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    _, raw_df, label_encoders, _ = load_data()
+    encoder = pickle.loads(pickle.dumps(CategoricalEncoder.from_label_encoders(label_encoders)))
+
+    rng = np.random.default_rng(42)
+    applicants = [
+        {col: rng.choice(label_encoders[col].classes_) for col in CATEGORICAL_COLUMNS}
+        for _ in range(args.applicants)
+    ]
+
+    start = time.perf_counter()
+    sklearn_rows = [
+        {col: label_encoders[col].transform([applicant[col]])[0] for col in CATEGORICAL_COLUMNS}
+        for applicant in applicants
+    ]
+    sklearn_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    encoder_rows = [encoder.encode_row(applicant) for applicant in applicants]
+    encoder_seconds = time.perf_counter() - start
+    assert sklearn_rows == encoder_rows
+
+    print(f"single applicant | LabelEncoder {sklearn_seconds / args.applicants * 1e6:8.2f} us"
+          f" | CategoricalEncoder {encoder_seconds / args.applicants * 1e6:8.2f} us"
+          f" | speedup {sklearn_seconds / encoder_seconds:,.0f}x")
+
+    for col in CATEGORICAL_COLUMNS:
+        values = raw_df[col].dropna().to_numpy(dtype=object)
+        column = values[rng.integers(0, len(values), size=args.column_rows)]
+
+        start = time.perf_counter()
+        expected = label_encoders[col].transform(column)
+        sklearn_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        codes = encoder.encode_column(col, column)
+        encoder_seconds = time.perf_counter() - start
+        assert np.array_equal(expected, codes)
+
+        print(f"{col:<14} column | LabelEncoder {sklearn_seconds:7.3f}s"
+              f" | CategoricalEncoder {encoder_seconds:7.3f}s | {args.column_rows:,} rows")
+
+    try:
+        encoder.encode("Property_Area", "Metro")
+    except ValueError as error:
+        print(f"unseen category -> ValueError: {error}")
+
+
+if __name__ == "__main__":
+    main()
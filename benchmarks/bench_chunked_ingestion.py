@@ -0,0 +1,74 @@
+"""
+Compare peak memory of load_data against chunked ingestion on a synthetic CSV
+
+Usage:
+    python benchmarks/bench_chunked_ingestion.py --rows 2000000 --chunksize 100000
+"""
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from synthetic import make_applications  # noqa: E402
+
+
+def _peak_rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _write_csv(csv_path, rows):
+    make_applications(rows).to_csv(csv_path, index=False)
+
+
+def _run_full(csv_path, chunksize, results):
+    from data_utils import load_data
+
+    start = time.perf_counter()
+    df = load_data(csv_path)[0]
+    results.put(("load_data", len(df), time.perf_counter() - start, _peak_rss_mb()))
+
+
+def _run_chunked(csv_path, chunksize, results):
+    from data_utils import iter_processed_chunks
+
+    start = time.perf_counter()
+    rows = sum(len(chunk) for chunk in iter_processed_chunks(csv_path, chunksize=chunksize))
+    results.put(("iter_processed_chunks", rows, time.perf_counter() - start, _peak_rss_mb()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "applications.csv"
+
+        # Keep every large allocation out of this process: Linux carries the peak RSS
+        # of a forked parent over into the child, even across exec.
+        context = multiprocessing.get_context("spawn")
+        writer = context.Process(target=_write_csv, args=(csv_path, args.rows))
+        writer.start()
+        writer.join()
+        print(f"synthetic CSV: {args.rows:,} rows, {csv_path.stat().st_size / 1e6:,.1f} MB")
+
+        # Spawn fresh interpreters so each mode reports its own peak RSS.
+        results = context.Queue()
+        for target in (_run_full, _run_chunked):
+            process = context.Process(target=target, args=(csv_path, args.chunksize, results))
+            process.start()
+            name, rows, seconds, peak_mb = results.get()
+            process.join()
+            print(f"{name:<22} {rows:>11,} rows in {seconds:8.2f}s | peak RSS {peak_mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Compare the compact int8/float32 schema with the full-width int64/float64 one
+
+Trains on the loan dataset loaded both ways and checks the hold-out metrics
+agree, then scores a synthetic queue with float32 and float64 feature matrices
+and checks the decisions and probabilities agree. Memory per row and
+throughput are reported for both schemas.
+
+Usage:
+    python benchmarks/bench_compact_dtypes.py --rows 1000000
+"""
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+from features import build_feature_matrix  # noqa: E402
+import model as model_module  # noqa: E402
+from scorer import LinearScorer  # noqa: E402
+from synthetic import make_applications, write_applications_csv  # noqa: E402
+
+
+def best_of(func, repeats=3):
+    """Return the result and the fastest wall-clock time of several calls."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the synthetic scoring queue")
+    parser.add_argument("--load-rows", type=int, default=200_000, help="Rows in the synthetic CSV for load_data")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    loaded = {compact: load_data(keep_raw=False, compact=compact) for compact in (True, False)}
+    frames = {compact: result[0] for compact, result in loaded.items()}
+    bundles = {compact: model_module.train_model(df) for compact, df in frames.items()}
+
+    # One hold-out row either way is the tolerance for float32 rounding in the scaled features.
+    test_rows = len(bundles[True][3])
+    for position, name in zip(range(5, 9), ("accuracy", "precision", "recall", "f1")):
+        assert abs(bundles[True][position] - bundles[False][position]) <= 1.5 / test_rows, name
+    agreement = np.mean(bundles[True][4] == bundles[False][4])
+    print(f"training on {len(frames[True])} rows: hold-out accuracy {bundles[True][5]:.4f} compact vs"
+          f" {bundles[False][5]:.4f} full width, f1 {bundles[True][8]:.4f} vs {bundles[False][8]:.4f},"
+          f" {agreement:.2%} same predictions")
+
+    label_encoders = loaded[True][2]
+    model, scaler = bundles[True][:2]
+    feature_names = bundles[True][-1]
+    encoder = CategoricalEncoder.from_label_encoders(label_encoders)
+    scorer = LinearScorer.from_estimator(model, scaler, feature_names, encoder)
+
+    applications = make_applications(args.rows, include_target=False, include_ids=False, missing_rate=0.0)
+    columns = {name: applications[name].to_numpy() for name in applications.columns}
+    columns["LoanAmount"] = columns["LoanAmount"] * 1000
+    matrices = {}
+    timings = {}
+    for dtype in (np.float32, np.float64):
+        matrices[dtype], build_seconds = best_of(lambda: build_feature_matrix(columns, encoder, feature_names, dtype))
+        scores, score_seconds = best_of(lambda: scorer.predict(matrices[dtype]))
+        timings[dtype] = (build_seconds, score_seconds, scores)
+
+    predictions32, probabilities32 = timings[np.float32][2]
+    predictions64, probabilities64 = timings[np.float64][2]
+    agreement = np.mean(predictions32 == predictions64)
+    max_gap = np.abs(probabilities32 - probabilities64).max()
+    assert agreement >= 0.9999, agreement
+    assert max_gap < 1e-4, max_gap
+    print(f"scoring {args.rows:,} rows: {agreement:.4%} same decisions, max probability gap {max_gap:.2e}")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "applications.csv"
+        write_applications_csv(csv_path, args.load_rows)
+        loads = {compact: best_of(lambda: load_data(csv_path, keep_raw=False, compact=compact)[0], repeats=2)
+                 for compact in (True, False)}
+
+    print(f"{'schema':<11} | {'frame B/row':>11} | {'matrix B/row':>12} | {'load rows/s':>12}"
+          f" | {'build rows/s':>12} | {'score rows/s':>12}")
+    for compact, dtype, name in ((True, np.float32, "int8/f32"), (False, np.float64, "int64/f64")):
+        frame, load_seconds = loads[compact]
+        frame_bytes = frame.memory_usage(index=False).sum() / len(frame)
+        build_seconds, score_seconds, _ = timings[dtype]
+        print(f"{name:<11} | {frame_bytes:>11.0f} | {matrices[dtype].nbytes / args.rows:>12.0f}"
+              f" | {args.load_rows / load_seconds:>12,.0f} | {args.rows / build_seconds:>12,.0f}"
+              f" | {args.rows / score_seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare GridSearchCV with the shared-memory CV scheduler, exhaustive and with successive halving
+
+The exhaustive scheduler must pick the same parameters as GridSearchCV and
+refit an identical model; the halving run reports how many fits it saved and
+whether it found the same winner. The scheduler's per-rung and per-candidate
+wall-clock breakdown is printed for the halving run.
+
+Usage:
+    python benchmarks/bench_cv_scheduler.py --rows 3000 --workers 4
+"""
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import cv_scheduler  # noqa: E402
+from data_utils import load_data  # noqa: E402
+import model as model_module  # noqa: E402
+from synthetic import make_applications  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3_000)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all CPUs)")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    from sklearn.model_selection import GridSearchCV
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.svm import SVC
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "applications.csv"
+        make_applications(args.rows).to_csv(csv_path, index=False)
+        df = load_data(csv_path, keep_raw=False)[0]
+
+    X = df.drop("Loan_Status", axis=1)
+    y = df["Loan_Status"]
+    train_positions, _ = model_module.train_test_indices(y)
+    X_train = StandardScaler().fit_transform(X.iloc[train_positions].values)
+    y_train = y.iloc[train_positions].to_numpy()
+    config = model_module.TRAINING_CONFIG
+    base_model = SVC(kernel="linear", probability=True, random_state=config["random_state"])
+
+    start = time.perf_counter()
+    grid_search = GridSearchCV(base_model, param_grid=model_module.PARAM_GRID, scoring=config["scoring"],
+                               cv=config["cv"], n_jobs=args.workers or -1).fit(X_train, y_train)
+    grid_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exhaustive_model, exhaustive = cv_scheduler.search(base_model, model_module.PARAM_GRID, X_train, y_train,
+                                                       cv=config["cv"], scoring=config["scoring"],
+                                                       workers=args.workers)
+    exhaustive_seconds = time.perf_counter() - start
+    n_candidates = len(exhaustive["candidates"])
+    assert exhaustive["best_params"] == grid_search.best_params_
+    assert np.isclose(exhaustive["best_score"], grid_search.best_score_, rtol=0, atol=1e-12)
+    assert np.array_equal(exhaustive_model.coef_, grid_search.best_estimator_.coef_)
+    assert np.array_equal(exhaustive_model.probA_, grid_search.best_estimator_.probA_)
+
+    start = time.perf_counter()
+    _, halving = cv_scheduler.search(base_model, model_module.PARAM_GRID, X_train, y_train,
+                                     cv=config["cv"], scoring=config["scoring"], halving=True,
+                                     workers=args.workers, **model_module.HALVING_CONFIG)
+    halving_seconds = time.perf_counter() - start
+
+    print(f"{len(X_train):,} training rows, {n_candidates} candidates x {config['cv']} folds")
+    print(f"{'search':<26} | {'fits':>5} | {'wall s':>7} | best")
+    print(f"{'GridSearchCV':<26} | {n_candidates * config['cv']:>5} | {grid_seconds:>7.2f}"
+          f" | {grid_search.best_params_}")
+    print(f"{'scheduler, exhaustive':<26} | {len(exhaustive['fits']):>5} | {exhaustive_seconds:>7.2f}"
+          f" | {exhaustive['best_params']}")
+    print(f"{'scheduler, halving':<26} | {len(halving['fits']):>5} | {halving_seconds:>7.2f}"
+          f" | {halving['best_params']}")
+    same_winner = halving["best_params"] == grid_search.best_params_
+    print(f"halving picked {'the same' if same_winner else 'a different'} winner"
+          f" (mean score {halving['best_score']:.4f} vs {grid_search.best_score_:.4f})")
+    print()
+    print(cv_scheduler.format_report(halving))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Compare the vectorized explanation engine with the app's former per-applicant pandas code
+
+The legacy path is the Prediction tab's previous driver logic: a sorted
+DataFrame of impacts per applicant, .iterrows() over the top drivers and a
+Python scan of the label classes to decode categories. Every applicant's
+strengths, risks and display values must match between the two paths.
+
+Usage:
+    python benchmarks/bench_explanations.py --legacy-rows 2000 --rows 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+import explanations  # noqa: E402
+from financial_utils import calculate_emi  # noqa: E402
+import model as model_module  # noqa: E402
+
+
+def legacy_drivers(input_row, scaled_row, feature_names, feature_importance, label_encoders, total_income,
+                   monthly_emi):
+    """The app's previous explanation code for one applicant, returning (name, value) pairs per side."""
+    input_features = pd.DataFrame(scaled_row, columns=feature_names)
+    feature_impact = input_features.iloc[0] * feature_importance
+    feature_impact_df = pd.DataFrame({
+        'Feature': feature_names,
+        'Impact': feature_impact,
+        'Absolute Impact': np.abs(feature_impact)
+    }).sort_values(by='Absolute Impact', ascending=False)
+
+    adjusted = feature_impact_df.copy()
+    emi_is_strength = total_income > 0 and (monthly_emi / total_income) <= 0.30
+    total_income_is_strength = monthly_emi > 0 and (total_income / monthly_emi) >= 3.0
+    for feature_name, is_strength in {"EMI": emi_is_strength, "TotalIncome": total_income_is_strength}.items():
+        feature_rows = adjusted["Feature"] == feature_name
+        if feature_rows.any():
+            base_abs_impact = adjusted.loc[feature_rows, "Absolute Impact"]
+            adjusted.loc[feature_rows, "Impact"] = np.where(is_strength, base_abs_impact, -base_abs_impact)
+
+    def format_feature_value(name, raw_value):
+        if name == "Credit_History":
+            return "Good" if raw_value == 1.0 else "Poor/Unknown"
+        if name in {"ApplicantIncome", "CoapplicantIncome", "LoanAmount", "EMI", "TotalIncome"}:
+            return f"Rs {raw_value:,.2f}"
+        if name == "Loan_Amount_Term":
+            return f"{int(raw_value)} months"
+        return str(raw_value)
+
+    def rows(drivers_df):
+        shown = []
+        for _, row in drivers_df.iterrows():
+            factor_name = row["Feature"]
+            if factor_name in label_encoders:
+                value_to_show = None
+                for original, encoded in zip(label_encoders[factor_name].classes_,
+                                             range(len(label_encoders[factor_name].classes_))):
+                    if encoded == input_row[0][list(feature_names).index(factor_name)]:
+                        value_to_show = original
+                        break
+            else:
+                value_to_show = format_feature_value(factor_name, input_row[0][list(feature_names).index(factor_name)])
+            shown.append((factor_name, value_to_show))
+        return shown
+
+    return rows(adjusted[adjusted["Impact"] > 0].head(3)), rows(adjusted[adjusted["Impact"] < 0].head(3))
+
+
+def explain(features, scaler, feature_importance, feature_names, encoder, total_income, monthly_emi):
+    explanation = explanations.explain_applicants(
+        features, feature_importance, scaler.mean_, scaler.scale_, feature_names, total_income, monthly_emi
+    )
+    return {
+        side: (explanation[side], explanations.display_values(features, explanation[side], feature_names, encoder))
+        for side in ("strengths", "risks")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--legacy-rows", type=int, default=2_000)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df, _, label_encoders, _ = load_data(keep_raw=False)
+    model_bundle = model_module.get_or_train_model(df)
+    scaler, feature_importance, feature_names = model_bundle[1], model_bundle[-2], model_bundle[-1]
+    feature_names = list(feature_names)
+    encoder = CategoricalEncoder.from_label_encoders(label_encoders)
+
+    rng = np.random.default_rng(42)
+    features = df[feature_names].to_numpy(dtype=float)
+    features = features[rng.integers(0, len(features), size=max(args.rows, args.legacy_rows))]
+    total_income = features[:, feature_names.index("TotalIncome")]
+    # Vary the policy rate so both directions of the EMI/TotalIncome overrides occur.
+    monthly_emi = np.array([
+        calculate_emi(loan, term, rate) for loan, term, rate in zip(
+            features[:, feature_names.index("LoanAmount")].tolist(),
+            features[:, feature_names.index("Loan_Amount_Term")].tolist(),
+            rng.uniform(5.0, 18.0, len(features)).round(1).tolist(),
+        )
+    ])
+
+    legacy = features[:args.legacy_rows]
+    scaled = scaler.transform(legacy)
+    start = time.perf_counter()
+    expected = [
+        legacy_drivers(legacy[row:row + 1], scaled[row:row + 1], feature_names, feature_importance, label_encoders,
+                       total_income[row], monthly_emi[row])
+        for row in range(len(legacy))
+    ]
+    legacy_seconds = time.perf_counter() - start
+
+    result = explain(legacy, scaler, feature_importance, feature_names, encoder, total_income[:len(legacy)],
+                     monthly_emi[:len(legacy)])
+    for row, (strengths, risks) in enumerate(expected):
+        for side, expected_rows in (("strengths", strengths), ("risks", risks)):
+            drivers, values = result[side]
+            actual_rows = [(feature_names[position], value)
+                           for position, value in zip(drivers[row].tolist(), values[row].tolist()) if position >= 0]
+            assert actual_rows == expected_rows, (row, side, actual_rows, expected_rows)
+    print(f"equivalence: {len(legacy):,} applicants match the legacy drivers and display values")
+
+    start = time.perf_counter()
+    explain(features[:args.rows], scaler, feature_importance, feature_names, encoder, total_income[:args.rows],
+            monthly_emi[:args.rows])
+    vectorized_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    explanation = explanations.explain_applicants(features[:args.rows], feature_importance, scaler.mean_,
+                                                  scaler.scale_, feature_names, total_income[:args.rows],
+                                                  monthly_emi[:args.rows])
+    explanations.reason_codes(explanation["strengths"], feature_names)
+    explanations.reason_codes(explanation["risks"], feature_names)
+    codes_seconds = time.perf_counter() - start
+
+    print(f"legacy pandas per applicant   : {len(legacy) / legacy_seconds:>14,.0f} applicants/sec")
+    print(f"vectorized with display values: {args.rows / vectorized_seconds:>14,.0f} applicants/sec")
+    print(f"vectorized reason codes only  : {args.rows / codes_seconds:>14,.0f} applicants/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare the vectorized financial checks against looping the scalar functions
+
+Usage:
+    python benchmarks/bench_financial_checks.py --loans 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from financial_utils import (  # noqa: E402
+    calculate_affordable_loan,
+    calculate_affordable_loan_batch,
+    perform_financial_checks,
+    perform_financial_checks_batch,
+)
+
+
+def make_portfolio(n_loans, seed=42):
+    """Random loans, including 0% interest and zero-income edge cases."""
+    rng = np.random.default_rng(seed)
+    portfolio = {
+        "loan_amount": np.round(rng.lognormal(11.8, 0.5, n_loans), -3),
+        "loan_term": rng.choice([60, 120, 180, 240, 360], size=n_loans).astype(float),
+        "applicant_income": np.round(rng.lognormal(8.4, 0.6, n_loans)),
+        "coapplicant_income": np.where(rng.random(n_loans) < 0.5, 0.0, np.round(rng.lognormal(7.4, 0.7, n_loans))),
+        "existing_debt": np.where(rng.random(n_loans) < 0.6, 0.0, np.round(rng.uniform(500, 5000, n_loans))),
+        "interest_rate": np.round(rng.uniform(5.0, 18.0, n_loans), 1),
+    }
+    portfolio["interest_rate"][::97] = 0.0
+    portfolio["applicant_income"][::101] = 0.0
+    portfolio["coapplicant_income"][::101] = 0.0
+    return portfolio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--loans", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    portfolio = make_portfolio(args.loans)
+    columns = list(portfolio)
+    rows = list(zip(*(portfolio[col].tolist() for col in columns)))
+
+    start = time.perf_counter()
+    scalar_checks = [perform_financial_checks(*row) for row in rows]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_checks = perform_financial_checks_batch(**portfolio)
+    batch_seconds = time.perf_counter() - start
+
+    for key, values in batch_checks.items():
+        expected = np.array([checks[key] for checks in scalar_checks])
+        assert np.allclose(values, expected, rtol=1e-12, atol=0, equal_nan=True), key
+
+    print(f"perform_financial_checks   | loop {scalar_seconds:8.3f}s | batch {batch_seconds:8.4f}s"
+          f" | speedup {scalar_seconds / batch_seconds:,.0f}x | {args.loans:,} loans")
+
+    incomes = portfolio["applicant_income"] + portfolio["coapplicant_income"]
+    start = time.perf_counter()
+    scalar_amounts = [
+        calculate_affordable_loan(income, rate, term)
+        for income, rate, term in zip(incomes.tolist(), portfolio["interest_rate"].tolist(),
+                                      portfolio["loan_term"].tolist())
+    ]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_amounts = calculate_affordable_loan_batch(incomes, portfolio["interest_rate"], portfolio["loan_term"])
+    batch_seconds = time.perf_counter() - start
+    assert np.allclose(batch_amounts, scalar_amounts, rtol=1e-12, atol=0)
+
+    print(f"calculate_affordable_loan  | loop {scalar_seconds:8.3f}s | batch {batch_seconds:8.4f}s"
+          f" | speedup {scalar_seconds / batch_seconds:,.0f}x | {args.loans:,} loans")
+
+
+if __name__ == "__main__":
+    main()
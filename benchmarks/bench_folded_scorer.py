@@ -0,0 +1,73 @@
+"""
+Check the folded scaler+linear-SVM scorer against predict_loan_approval and time it
+
+The equivalence checks fail loudly (AssertionError) if the closed-form scorer
+ever drifts from the scikit-learn path.
+
+Usage:
+    python benchmarks/bench_folded_scorer.py --rows 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+import model as model_module  # noqa: E402
+from scorer import LinearScorer  # noqa: E402
+
+
+def check_equivalence(model, scaler, scorer, features):
+    """Assert the folded scorer reproduces predict_loan_approval row by row."""
+    for row in features:
+        prediction, probability, scaled_input = model_module.predict_loan_approval(model, scaler, row.reshape(1, -1))
+        folded_predictions, folded_probabilities = scorer.predict(row)
+        assert folded_predictions[0] == prediction
+        assert np.allclose(folded_probabilities[0], probability, rtol=0, atol=1e-9)
+        assert np.isclose(scorer.decision_function(row)[0], model.decision_function(scaled_input)[0],
+                          rtol=0, atol=1e-9)
+
+    # libsvm's predict_proba adds an iterative pairwise-coupling step on top of the same sigmoid.
+    libsvm_probabilities = model.predict_proba(scaler.transform(features))
+    assert np.allclose(scorer.predict(features)[1], libsvm_probabilities, rtol=0, atol=1e-4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df, _, label_encoders, _ = load_data(keep_raw=False)
+    model, scaler = model_module.get_or_train_model(df)[:2]
+    feature_names = df.drop("Loan_Status", axis=1).columns.tolist()
+    scorer = LinearScorer.from_estimator(
+        model, scaler, feature_names, CategoricalEncoder.from_label_encoders(label_encoders)
+    )
+
+    features = df[feature_names].to_numpy(dtype=float)
+    check_equivalence(model, scaler, scorer, features)
+    print(f"equivalence: {len(features)} training rows match predict_loan_approval")
+
+    rng = np.random.default_rng(42)
+    queue = features[rng.integers(0, len(features), size=args.rows)]
+
+    start = time.perf_counter()
+    model_module.predict_loan_approval_batch(model, scaler, queue)
+    sklearn_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scorer.predict(queue)
+    folded_seconds = time.perf_counter() - start
+
+    print(f"sklearn batch  : {args.rows / sklearn_seconds:>14,.0f} rows/sec")
+    print(f"folded scorer  : {args.rows / folded_seconds:>14,.0f} rows/sec")
+    print(f"speedup        : {sklearn_seconds / folded_seconds:,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure module import time for the app's cold start and the pure scoring path
+
+Each scenario imports its modules in a fresh interpreter under `python -X
+importtime` and sums the cumulative time of the top-level imports. The
+heaviest packages of each scenario are listed so regressions (a training-only
+library creeping back into a module-level import) are easy to spot. The
+scoring scenarios also assert that pandas, scikit-learn and matplotlib stay
+out of sys.modules.
+
+Usage:
+    python benchmarks/bench_import_time.py --repeats 5 --top 8 --json import_times.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SCENARIOS = {
+    # Everything app.py imports before it renders the first tab.
+    "app cold start": ["streamlit", "pandas", "numpy", "data_utils", "encoders", "model", "financial_utils",
+                       "training_worker"],
+    # What Model Insights adds when its tab is drawn.
+    "app + model insights": ["streamlit", "pandas", "numpy", "data_utils", "encoders", "model",
+                             "financial_utils", "training_worker", "matplotlib.pyplot", "seaborn"],
+    "training (model.train_model)": ["model", "sklearn.model_selection", "sklearn.metrics", "sklearn.svm"],
+    "pure scoring (scorer)": ["scorer"],
+    "scoring service": ["scoring_service"],
+}
+# Modules that must not be imported by the pure scoring scenarios.
+SCORING_EXCLUDED = ("pandas", "sklearn", "matplotlib", "seaborn", "joblib")
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output
+
+    Args:
+        stderr (str): Interpreter stderr
+
+    Returns:
+        tuple: (top-level module -> cumulative microseconds, package -> cumulative microseconds)
+    """
+    top_level = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        # The name column starts with one space; each nesting level adds two more.
+        if len(name) - len(name.lstrip()) == 1:
+            top_level[name.strip()] = int(cumulative_us)
+    packages = {}
+    for name, cumulative_us in top_level.items():
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + cumulative_us
+    return top_level, packages
+
+
+def measure(modules, check_excluded=False):
+    code = "".join(f"import {module}\n" for module in modules)
+    if check_excluded:
+        code += (f"import sys\nloaded = [m for m in {SCORING_EXCLUDED!r} if m in sys.modules]\n"
+                 "assert not loaded, f'scoring path imported {loaded}'\n")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True,
+                            text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.splitlines()[-1])
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Heaviest packages to list per scenario")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    report = {}
+    for scenario, modules in SCENARIOS.items():
+        runs = [measure(modules, check_excluded=scenario.startswith(("pure scoring", "scoring service")))
+                for _ in range(args.repeats)]
+        totals_ms = [sum(top_level.values()) / 1000 for top_level, _ in runs]
+        packages = {
+            package: statistics.median(run[1].get(package, 0) for run in runs) / 1000
+            for package in runs[0][1]
+        }
+        heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        report[scenario] = {"median_ms": statistics.median(totals_ms), "min_ms": min(totals_ms),
+                            "heaviest_ms": dict(heaviest)}
+
+        print(f"{scenario}: median {statistics.median(totals_ms):,.0f} ms (min {min(totals_ms):,.0f} ms)")
+        for package, milliseconds in heaviest:
+            print(f"    {package:<24} {milliseconds:>8,.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(report, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
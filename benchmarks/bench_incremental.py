@@ -0,0 +1,107 @@
+"""
+Cost and drift of incremental model updates against full retrains
+
+Trains a model on a synthetic base set, folds in a series of daily labelled
+batches with incremental.update_model, and compares the result with a full
+retrain on the same rows. Later batches can be drawn from a shifted income
+distribution to show how the scaler and the model follow drift. The running
+scaler statistics must match a scaler fitted on every row seen, and carrying
+the weights over to the new scaling must not change any decision value.
+
+Usage:
+    python benchmarks/bench_incremental.py --base-rows 3000 --days 5 --batch-rows 500 --income-shift 1.3
+"""
+import argparse
+import copy
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import load_data, load_labelled_batch  # noqa: E402
+import incremental  # noqa: E402
+import model as model_module  # noqa: E402
+from synthetic import make_applications  # noqa: E402
+
+
+def make_batch(csv_path, n_rows, seed, income_shift):
+    applications = make_applications(n_rows, seed=seed)
+    applications["ApplicantIncome"] = np.round(applications["ApplicantIncome"] * income_shift).astype(np.int64)
+    applications.to_csv(csv_path, index=False)
+    return csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-rows", type=int, default=3_000)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--batch-rows", type=int, default=500)
+    parser.add_argument("--income-shift", type=float, default=1.0,
+                        help="Factor applied to ApplicantIncome, ramping up linearly over the days")
+    parser.add_argument("--engine", choices=model_module.TRAINING_ENGINES, default="svc")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base_path = Path(tmp_dir) / "base.csv"
+        make_applications(args.base_rows).to_csv(base_path, index=False)
+        df, _, label_encoders, _ = load_data(base_path, keep_raw=False)
+        batches = []
+        for day in range(1, args.days + 1):
+            shift = 1 + (args.income_shift - 1) * day / args.days
+            batch_path = make_batch(Path(tmp_dir) / f"day_{day}.csv", args.batch_rows, 1_000 + day, shift)
+            batches.append(load_labelled_batch(batch_path, label_encoders))
+        scaling_path = make_batch(Path(tmp_dir) / "scaling.csv", args.batch_rows * 8, 999, 1.0)
+        scaling_batch = load_labelled_batch(scaling_path, label_encoders)
+
+    start = time.perf_counter()
+    parent_bundle = model_module.train_model(df, engine=args.engine)
+    train_seconds = time.perf_counter() - start
+
+    # Carrying the weights over to a new scaling must leave every decision value unchanged.
+    model, scaler = parent_bundle[:2]
+    X_check = batches[0][parent_bundle[-1]].to_numpy(dtype=float)
+    new_scaler = copy.deepcopy(scaler).partial_fit(X_check)
+    coef, intercept = incremental.transfer_weights(model.coef_[0], model.intercept_[0], scaler, new_scaler)
+    assert np.allclose(new_scaler.transform(X_check) @ coef + intercept,
+                       model.decision_function(scaler.transform(X_check)), rtol=0, atol=1e-9)
+
+    print(f"base model: {len(df):,} rows, {args.engine} engine, trained in {train_seconds:.2f}s"
+          f" (hold-out accuracy {parent_bundle[5]:.4f})")
+    print(f"{'day':>3} | {'rows':>6} | {'update ms':>9} | {'acc before':>10} | {'hold-out acc':>12}"
+          f" | largest mean shift")
+    bundle = parent_bundle
+    update_seconds = 0.0
+    for day, batch in enumerate(batches, start=1):
+        bundle, summary = incremental.update_model(bundle, batch)
+        update_seconds += summary["seconds"]
+        name, shift = next(iter(summary["mean_shift"].items()))
+        print(f"{day:>3} | {summary['rows']:>6,} | {summary['seconds'] * 1000:>9.1f} | "
+              f"{summary['batch_accuracy_before']:>10.4f} | {bundle[5]:>12.4f} | {name} {shift:+.2f}sd")
+
+    # The running scaler statistics are exactly those of every row the model has seen.
+    train_positions, _ = model_module.train_test_indices(df["Loan_Status"])
+    seen = pd.concat([df.iloc[train_positions], *batches])[bundle[-1]].to_numpy(dtype=float)
+    assert np.allclose(bundle[1].mean_, seen.mean(axis=0), rtol=1e-10)
+    assert np.allclose(bundle[1].var_, seen.var(axis=0), rtol=1e-8)
+
+    # Update cost grows with the batch, not with the rows already seen.
+    small_seconds = min(incremental.update_model(bundle, batches[-1])[1]["seconds"] for _ in range(3))
+    large_seconds = min(incremental.update_model(bundle, scaling_batch)[1]["seconds"] for _ in range(3))
+    print(f"update time, {len(scaling_batch):,} vs {len(batches[-1]):,} rows: {large_seconds / small_seconds:.1f}x")
+    print()
+
+    reference = incremental.full_retrain_reference(df, batches, args.engine)
+    print(incremental.format_drift_report(
+        incremental.drift_report(parent_bundle, bundle, reference, batches, update_seconds)
+    ))
+
+
+if __name__ == "__main__":
+    main()
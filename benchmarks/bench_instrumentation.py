@@ -0,0 +1,91 @@
+"""
+Overhead of the instrumentation hooks, disabled and enabled
+
+Times the app's per-request path (create_input_data, predict_loan_approval,
+perform_financial_checks) with instrumentation off and on, and the bare cost
+of a disabled stage() block and instrumented() call. Results must not depend
+on whether instrumentation is on.
+
+Usage:
+    python benchmarks/bench_instrumentation.py --requests 5000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import create_input_data, load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+from financial_utils import perform_financial_checks  # noqa: E402
+import instrumentation  # noqa: E402
+import model as model_module  # noqa: E402
+from synthetic import make_applications  # noqa: E402
+
+
+def run_requests(applicants, model, scaler, encoder, feature_names):
+    results = []
+    start = time.perf_counter()
+    for applicant in applicants:
+        input_data = create_input_data(applicant, encoder, feature_names)
+        prediction, probability, _ = model_module.predict_loan_approval(model, scaler, input_data)
+        checks = perform_financial_checks(applicant["LoanAmount"], applicant["Loan_Amount_Term"],
+                                          applicant["ApplicantIncome"], applicant["CoapplicantIncome"])
+        results.append((prediction, probability[1], checks["financially_feasible"]))
+    return results, time.perf_counter() - start
+
+
+def per_call_ns(func, calls=1_000_000):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    df, _, label_encoders, _ = load_data(keep_raw=False)
+    model_bundle = model_module.get_or_train_model(df)
+    model, scaler, feature_names = model_bundle[0], model_bundle[1], model_bundle[-1]
+    encoder = CategoricalEncoder.from_label_encoders(label_encoders)
+    applications = make_applications(args.requests, missing_rate=0.0, include_target=False, include_ids=False)
+    applications["LoanAmount"] *= 1000
+    applicants = applications.to_dict("records")
+
+    instrumentation.disable()
+    run_requests(applicants[:200], model, scaler, encoder, feature_names)
+    disabled_results, disabled_seconds = run_requests(applicants, model, scaler, encoder, feature_names)
+    instrumentation.enable()
+    enabled_results, enabled_seconds = run_requests(applicants, model, scaler, encoder, feature_names)
+    assert disabled_results == enabled_results
+    stages = instrumentation.REGISTRY.to_dict()["stages"]
+    assert stages["create_input_data"]["count"] == args.requests
+    instrumentation.disable()
+
+    def bare():
+        pass
+
+    def staged():
+        with instrumentation.stage("noop"):
+            pass
+
+    wrapped = instrumentation.instrumented("noop")(bare)
+
+    print(f"{'request path':<26} | {'ms/request':>10}")
+    print(f"{'instrumentation off':<26} | {disabled_seconds / args.requests * 1000:>10.4f}")
+    print(f"{'instrumentation on':<26} | {enabled_seconds / args.requests * 1000:>10.4f}")
+    print()
+    print(f"disabled stage() block  : {per_call_ns(staged) - per_call_ns(bare):>6.0f} ns over a bare call")
+    print(f"disabled instrumented() : {per_call_ns(wrapped) - per_call_ns(bare):>6.0f} ns over a bare call")
+    print()
+    print("stage means with instrumentation on:")
+    for name, stats in stages.items():
+        print(f"    {name:<20} {stats['mean_seconds'] * 1e6:>9.1f} µs x {stats['count']:,}")
+
+
+if __name__ == "__main__":
+    main()
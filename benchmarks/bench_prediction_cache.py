@@ -0,0 +1,90 @@
+"""
+Latency of the app's single-applicant assessment with and without the prediction cache
+
+Replays a stream of form submissions in which a share of the applicants are
+resubmissions, as happens when users click Predict again or tweak and revert a
+field. A cache hit must return exactly what a fresh assessment computes.
+
+Usage:
+    python benchmarks/bench_prediction_cache.py --submissions 5000 --repeat-share 0.5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import create_input_data, load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+import explanations  # noqa: E402
+from financial_utils import perform_financial_checks  # noqa: E402
+import model as model_module  # noqa: E402
+from prediction_cache import PredictionCache, normalize_applicant  # noqa: E402
+from synthetic import make_applications  # noqa: E402
+
+
+def assess(applicant, model, scaler, encoder, feature_names, feature_importance):
+    """The Prediction tab's work for one submission."""
+    input_data = create_input_data(applicant, encoder, feature_names)
+    prediction, probability, scaled_input = model_module.predict_loan_approval(model, scaler, input_data)
+    checks = perform_financial_checks(applicant["LoanAmount"], applicant["Loan_Amount_Term"],
+                                      applicant["ApplicantIncome"], applicant["CoapplicantIncome"], 0, 8.5)
+    contributions = explanations.apply_direction_overrides(
+        explanations.feature_contributions(scaled_input, feature_importance), feature_names,
+        applicant["ApplicantIncome"] + applicant["CoapplicantIncome"], checks["monthly_emi"],
+    )
+    drivers = explanations.top_drivers(contributions)
+    return prediction, probability, checks, drivers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=5_000)
+    parser.add_argument("--repeat-share", type=float, default=0.5, help="Share of submissions that repeat one")
+    args = parser.parse_args()
+
+    df, _, label_encoders, _ = load_data(keep_raw=False)
+    model_bundle = model_module.get_or_train_model(df)
+    model, scaler = model_bundle[:2]
+    feature_importance, feature_names = model_bundle[-2:]
+    encoder = CategoricalEncoder.from_label_encoders(label_encoders)
+
+    n_distinct = max(1, int(args.submissions * (1 - args.repeat_share)))
+    applications = make_applications(n_distinct, missing_rate=0.0, include_target=False, include_ids=False)
+    applications["LoanAmount"] *= 1000
+    distinct = applications.to_dict("records")
+    rng = np.random.default_rng(42)
+    stream = distinct + [distinct[i] for i in rng.integers(0, n_distinct, args.submissions - n_distinct)]
+    stream = [stream[i] for i in rng.permutation(len(stream))]
+
+    start = time.perf_counter()
+    for applicant in stream:
+        assess(applicant, model, scaler, encoder, feature_names, feature_importance)
+    uncached_seconds = time.perf_counter() - start
+
+    cache = PredictionCache(max_entries=len(distinct))
+    start = time.perf_counter()
+    for applicant in stream:
+        cache.get_or_compute(normalize_applicant(applicant, existing_monthly_debt=0, interest_rate=8.5), "bench",
+                             lambda: assess(applicant, model, scaler, encoder, feature_names, feature_importance))
+    cached_seconds = time.perf_counter() - start
+    stats = cache.stats()
+
+    for applicant in distinct[:200]:
+        prediction, probability, checks, drivers = assess(applicant, model, scaler, encoder, feature_names,
+                                                          feature_importance)
+        cached = cache.get(normalize_applicant(applicant, existing_monthly_debt=0, interest_rate=8.5), "bench")
+        assert cached[0] == prediction and np.array_equal(cached[1], probability) and cached[2] == checks
+        assert all(np.array_equal(a, b) for a, b in zip(cached[3], drivers))
+
+    print(f"{len(stream):,} submissions, {n_distinct:,} distinct applicants")
+    print(f"uncached: {uncached_seconds / len(stream) * 1000:>8.3f} ms/submission")
+    print(f"cached  : {cached_seconds / len(stream) * 1000:>8.3f} ms/submission"
+          f" ({stats['hits']:,} hits, {stats['misses']:,} misses)")
+
+
+if __name__ == "__main__":
+    main()
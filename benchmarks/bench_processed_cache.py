@@ -0,0 +1,71 @@
+"""
+Time rebuilding the processed frame with load_data against mapping the on-disk cache
+
+A "new worker" is a fresh interpreter that loads the frame from a warm cache,
+as an app restart or an extra worker process would.
+
+Usage:
+    python benchmarks/bench_processed_cache.py --rows 1000000
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from data_utils import load_data, load_data_cached  # noqa: E402
+from synthetic import make_applications  # noqa: E402
+
+_NEW_WORKER = """
+import json, sys, time
+start = time.perf_counter()
+from data_utils import load_data_cached
+df = load_data_cached({csv_path!r}, {cache_dir!r})[0]
+print(json.dumps({{"seconds": time.perf_counter() - start, "rows": len(df)}}))
+"""
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = str(Path(tmp_dir) / "applications.csv")
+        cache_dir = str(Path(tmp_dir) / "processed")
+        make_applications(args.rows).to_csv(csv_path, index=False)
+
+        (expected, _, _, _), rebuild_seconds = timed(lambda: load_data(csv_path, keep_raw=False))
+        _, cold_seconds = timed(lambda: load_data_cached(csv_path, cache_dir))
+        (cached, _, _, _), warm_seconds = timed(lambda: load_data_cached(csv_path, cache_dir))
+        pd.testing.assert_frame_equal(cached, expected, check_exact=True)
+
+        worker = subprocess.run(
+            [sys.executable, "-c", _NEW_WORKER.format(csv_path=csv_path, cache_dir=cache_dir)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        new_worker = json.loads(worker.stdout)
+        assert new_worker["rows"] == len(expected)
+
+    print(f"{args.rows:,} rows")
+    print(f"load_data (rebuild)            : {rebuild_seconds:8.3f}s")
+    print(f"load_data_cached (cold, writes): {cold_seconds:8.3f}s")
+    print(f"load_data_cached (warm)        : {warm_seconds:8.3f}s  (incl. hashing the CSV)")
+    print(f"new worker, warm cache         : {new_worker['seconds']:8.3f}s  (incl. imports)")
+
+
+if __name__ == "__main__":
+    main()
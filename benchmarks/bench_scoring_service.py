@@ -0,0 +1,154 @@
+"""
+Load-generate against a local scoring service and report throughput and latency
+
+Starts scoring_service.py on localhost for each max-wait setting, drives it with
+keep-alive clients at several concurrency levels and prints client-side p50/p99
+latency, requests/sec and the server's mean micro-batch size. Every response is
+checked against scoring all applicants in one local batch, so batching must not
+change any result.
+
+Usage:
+    python benchmarks/bench_scoring_service.py --requests 20000 --concurrency 1 16 64 --max-wait-ms 0 2
+"""
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from scoring_service import APPLICANT_FIELDS, score_batch  # noqa: E402
+from scorer import load_scorer  # noqa: E402
+from synthetic import make_applications  # noqa: E402
+
+
+def make_payloads(n_requests, seed=42):
+    """Complete applicants (no missing values) in the app's units, with per-request policy inputs."""
+    applications = make_applications(n_requests, seed=seed, missing_rate=0.0, include_target=False,
+                                     include_ids=False)
+    applications["LoanAmount"] *= 1000
+    rng = np.random.default_rng(seed)
+    applications["existing_debt"] = np.where(rng.random(n_requests) < 0.6, 0.0,
+                                             np.round(rng.uniform(500, 5000, n_requests)))
+    applications["interest_rate"] = np.round(rng.uniform(5.0, 18.0, n_requests), 1)
+    return applications[APPLICANT_FIELDS + ["existing_debt", "interest_rate"]].to_dict("records")
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _request(reader, writer, method, path, payload=None):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    content_length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value)
+    response = json.loads(await reader.readexactly(content_length))
+    assert status == 200, response
+    return response
+
+
+async def _client(port, payloads, indices, results, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for index in indices:
+            start = time.perf_counter()
+            results[index] = await _request(reader, writer, "POST", "/score", payloads[index])
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def _server_metrics(port):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        return await _request(reader, writer, "GET", "/metrics")
+    finally:
+        writer.close()
+
+
+async def run_load(port, payloads, concurrency):
+    """Spread the payloads over keep-alive clients; return results, latencies, wall time and mean batch size."""
+    before = await _server_metrics(port)
+    results = [None] * len(payloads)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(port, payloads, range(client, len(payloads), concurrency), results, latencies)
+        for client in range(concurrency)
+    ))
+    seconds = time.perf_counter() - start
+
+    after = await _server_metrics(port)
+    mean_batch_size = len(payloads) / max(after["batches"] - before["batches"], 1)
+    return results, np.asarray(latencies), seconds, mean_batch_size
+
+
+def start_service(port, max_wait_ms, max_batch_size):
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / "scoring_service.py"), "--port", str(port), "--max-wait-ms", str(max_wait_ms),
+         "--max-batch-size", str(max_batch_size)],
+        cwd=ROOT, stdout=subprocess.PIPE, text=True,
+    )
+    # The service prints its address once the artifact is loaded and the socket is bound.
+    line = process.stdout.readline()
+    if "listening" not in line:
+        process.kill()
+        raise RuntimeError(f"Scoring service failed to start: {line!r}")
+    return process
+
+
+def check_results(results, payloads, scorer):
+    expected = score_batch(payloads, scorer)
+    for result, reference in zip(results, expected):
+        assert result["model_prediction"] == reference["model_prediction"]
+        assert np.isclose(result["approval_probability"], reference["approval_probability"], rtol=0, atol=1e-12)
+        assert result["final_approval"] == reference["final_approval"]
+        assert result["financial_checks"] == reference["financial_checks"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--max-wait-ms", type=float, nargs="+", default=[0.0, 2.0])
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.requests)
+
+    print(f"{'wait ms':>7} | {'clients':>7} | {'req/sec':>9} | {'p50 ms':>7} | {'p99 ms':>7} | {'mean batch':>10}")
+    for max_wait_ms in args.max_wait_ms:
+        port = _free_port()
+        process = start_service(port, max_wait_ms, args.max_batch_size)
+        try:
+            # The service trains and exports the model on first use, so load it after startup.
+            scorer = load_scorer()
+            for concurrency in args.concurrency:
+                results, latencies, seconds, mean_batch_size = asyncio.run(run_load(port, payloads, concurrency))
+                check_results(results, payloads, scorer)
+                p50, p99 = np.percentile(latencies * 1000, [50, 99])
+                print(f"{max_wait_ms:>7.1f} | {concurrency:>7} | {len(payloads) / seconds:>9,.0f} | {p50:>7.2f}"
+                      f" | {p99:>7.2f} | {mean_batch_size:>10.1f}")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
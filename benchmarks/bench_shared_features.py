@@ -0,0 +1,113 @@
+"""
+Per-worker memory with a private feature matrix versus the shared memory-mapped store
+
+Each worker process either loads its own float64 copy of the feature matrix
+(what every app or scoring process held before) or maps the shared float32
+feature store read-only. Every worker reads all of its data, all workers stay
+alive together, and then each reports RSS and PSS. PSS (proportional set size)
+charges shared pages 1/N to each of the N processes mapping them, so total PSS
+is the real memory cost of the worker pool. Needs Linux (/proc/self/smaps_rollup).
+
+Usage:
+    python benchmarks/bench_shared_features.py --rows 500000 --workers 1 4 16
+"""
+import argparse
+import multiprocessing
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def memory_mb():
+    """Current RSS and PSS of this process in MB."""
+    usage = {}
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            name, _, value = line.partition(":")
+            if name in ("Rss", "Pss"):
+                usage[name.lower()] = int(value.split()[0]) / 1024
+    return usage
+
+
+def _worker(store_path, mode, barrier, results):
+    from feature_store import load_feature_store
+
+    baseline = memory_mb()
+    store = load_feature_store(store_path)
+    if mode == "private":
+        data = np.array(store.matrix, dtype=np.float64)
+        del store
+    else:
+        data = store.matrix
+    # Read every page, as scoring or analytics over the full matrix would.
+    checksum = float(data[:, :-1].sum(dtype=np.float64))
+    barrier.wait()
+    usage = memory_mb()
+    results.put({
+        "rss": usage["rss"] - baseline["rss"],
+        "pss": usage["pss"] - baseline["pss"],
+        "checksum": checksum,
+    })
+    barrier.wait()
+
+
+def run_workers(store_path, mode, n_workers):
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(n_workers)
+    results = context.Queue()
+    processes = [context.Process(target=_worker, args=(store_path, mode, barrier, results)) for _ in range(n_workers)]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    from data_utils import load_data
+    from feature_store import build_feature_store, load_feature_store
+    from model import train_test_indices
+    from synthetic import make_applications
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "applications.csv"
+        make_applications(args.rows).to_csv(csv_path, index=False)
+        df = load_data(csv_path, keep_raw=False)[0]
+        store_path = Path(tmp_dir) / "features"
+        build_feature_store(df, store_path)
+
+        store = load_feature_store(store_path)
+        assert store.feature_names == df.drop("Loan_Status", axis=1).columns.tolist()
+        # The store's split and column layout are train_model's.
+        _, test_positions = train_test_indices(df["Loan_Status"])
+        expected_test = df.drop("Loan_Status", axis=1).iloc[test_positions].to_numpy(dtype=np.float32)
+        assert np.array_equal(store.X_test, expected_test)
+        assert np.array_equal(store.y_test, df["Loan_Status"].to_numpy()[test_positions])
+        expected_checksum = float(store.X.sum(dtype=np.float64))
+        matrix_mb = store.matrix.nbytes / 2**20
+        del store, df
+
+        print(f"{args.rows:,} rows, float32 store {matrix_mb:.1f} MB (private float64 copy {2 * matrix_mb:.1f} MB)")
+        print(f"{'mode':<8} | {'workers':>7} | {'RSS/worker MB':>13} | {'PSS/worker MB':>13} | {'total PSS MB':>12}")
+        for mode in ("private", "shared"):
+            for n_workers in args.workers:
+                reports = run_workers(store_path, mode, n_workers)
+                assert all(np.isclose(report["checksum"], expected_checksum) for report in reports)
+                rss = np.mean([report["rss"] for report in reports])
+                pss = np.mean([report["pss"] for report in reports])
+                print(f"{mode:<8} | {n_workers:>7} | {rss:>13.1f} | {pss:>13.1f} | {pss * n_workers:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measure cold start time and peak RSS of a scoring worker
+
+Compares loading the joblib training bundle (pandas + scikit-learn) with
+loading the compact inference artifact into the pure-NumPy scorer. Each mode
+runs in a fresh interpreter and scores one applicant.
+
+Usage:
+    python benchmarks/bench_startup.py --repeats 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+APPLICANT = {
+    "Gender": "Male", "Married": "Yes", "Dependents": "0", "Education": "Graduate", "Self_Employed": "No",
+    "ApplicantIncome": 5000, "CoapplicantIncome": 0, "LoanAmount": 100000, "Loan_Amount_Term": 360,
+    "Credit_History": 1.0, "Property_Area": "Urban",
+}
+
+_MEASURE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{body}
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+print(json.dumps({{"seconds": time.perf_counter() - start, "peak_rss_mb": peak_mb, "probability": float(probability[1])}}))
+"""
+
+MODES = {
+    "joblib bundle (pandas + sklearn)": """
+import joblib
+from data_utils import create_input_data
+import model as model_module
+bundle = joblib.load("{bundle_path}")
+encoder = joblib.load("{encoders_path}")
+input_data = create_input_data({applicant}, encoder, bundle[-1])
+prediction, probability, _ = model_module.predict_loan_approval(bundle[0], bundle[1], input_data)
+""",
+    "inference artifact (NumPy only)": """
+from scorer import load_scorer
+scorer = load_scorer()
+predictions, probabilities = scorer.score_applicants({{key: [value] for key, value in {applicant}.items()}})
+probability = probabilities[0]
+""",
+}
+
+_PREPARE = """
+import json
+import joblib
+from data_utils import load_data
+from encoders import CategoricalEncoder
+import model as model_module
+df, _, label_encoders, _ = load_data(keep_raw=False)
+bundle = model_module.get_or_train_model(df)
+model_module.export_inference_artifact(bundle[0], bundle[1], bundle[-1], label_encoders)
+joblib.dump(CategoricalEncoder.from_label_encoders(label_encoders), "{encoders_path}")
+print(json.dumps({{"bundle_path": str(model_module.artifact_path_for(model_module.compute_model_fingerprint(df)))}}))
+"""
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1]) if result.stdout.strip() else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    encoders_path = ROOT / "saved_models" / "bench_encoders.joblib"
+    # Train/export in a separate interpreter so this process stays small.
+    bundle_path = _run(_PREPARE.format(encoders_path=encoders_path))["bundle_path"]
+
+    results = {}
+    for name, body in MODES.items():
+        code = _MEASURE.format(body=body.format(applicant=repr(APPLICANT), encoders_path=encoders_path, bundle_path=bundle_path))
+        runs = [_run(code) for _ in range(args.repeats)]
+        results[name] = runs
+        print(f"{name:<34} | cold start {statistics.median(r['seconds'] for r in runs):7.3f}s"
+              f" | peak RSS {statistics.median(r['peak_rss_mb'] for r in runs):7.1f} MB"
+              f" | P(approve) {runs[0]['probability']:.6f}")
+
+    encoders_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Time train_model against row count for the libsvm and SGD training engines
+
+Usage:
+    python benchmarks/bench_training.py --sizes 1000 5000 20000 100000 --svc-max 5000
+"""
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import load_data  # noqa: E402
+import model as model_module  # noqa: E402
+from synthetic import make_applications  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 5_000, 20_000, 100_000])
+    parser.add_argument("--svc-max", type=int, default=5_000,
+                        help="Largest size also trained with the libsvm engines")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    print(f"{'rows':>9} | {'engine':<11} | {'train s':>9} | {'accuracy':>8} | {'f1':>6} | model")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.sizes:
+            csv_path = Path(tmp_dir) / f"applications_{n_rows}.csv"
+            make_applications(n_rows).to_csv(csv_path, index=False)
+            df = load_data(csv_path, keep_raw=False)[0]
+
+            for engine in model_module.TRAINING_ENGINES:
+                if engine.startswith("svc") and n_rows > args.svc_max:
+                    continue
+                start = time.perf_counter()
+                bundle = model_module.train_model(df, engine=engine)
+                seconds = time.perf_counter() - start
+                print(f"{n_rows:>9,} | {engine:<11} | {seconds:>9.2f} | {bundle[5]:>8.3f} | {bundle[8]:>6.3f}"
+                      f" | {bundle[0]}")
+
+
+if __name__ == "__main__":
+    main()
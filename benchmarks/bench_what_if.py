@@ -0,0 +1,106 @@
+"""
+Time a what-if sweep against rerunning the single-applicant pipeline per grid cell
+
+Every (amount, tenure) cell of the sweep must match predict_loan_approval on
+the same applicant, and a random sample of (amount, tenure, rate) cells must
+match perform_financial_checks. The per-cell pipeline is timed on that sample
+and extrapolated to the whole grid.
+
+Usage:
+    python benchmarks/bench_what_if.py --amounts 100 --tenures 50 --rates 20
+"""
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import create_input_data, load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+from financial_utils import perform_financial_checks  # noqa: E402
+import model as model_module  # noqa: E402
+from scorer import LinearScorer  # noqa: E402
+import what_if  # noqa: E402
+
+
+APPLICANT = {
+    "Gender": "Male",
+    "Married": "Yes",
+    "Dependents": "1",
+    "Education": "Graduate",
+    "Self_Employed": "No",
+    "ApplicantIncome": 5000,
+    "CoapplicantIncome": 1500,
+    "LoanAmount": 150_000,
+    "Loan_Amount_Term": 360,
+    "Credit_History": 1.0,
+    "Property_Area": "Semiurban",
+}
+EXISTING_DEBT = 500
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--amounts", type=int, default=100)
+    parser.add_argument("--tenures", type=int, default=50)
+    parser.add_argument("--rates", type=int, default=20)
+    parser.add_argument("--sample", type=int, default=500, help="Grid cells checked against the scalar pipeline")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    df, _, label_encoders, _ = load_data(keep_raw=False)
+    model, scaler = model_module.get_or_train_model(df)[:2]
+    feature_names = df.drop("Loan_Status", axis=1).columns.tolist()
+    encoder = CategoricalEncoder.from_label_encoders(label_encoders)
+    scorer = LinearScorer.from_estimator(model, scaler, feature_names, encoder)
+
+    loan_amounts = np.linspace(10_000, 800_000, args.amounts)
+    tenures = np.linspace(12, 480, args.tenures)
+    rates = np.linspace(5, 18, args.rates)
+    sweep = what_if.sweep_applicant(scorer, APPLICANT, loan_amounts, tenures, rates, existing_debt=EXISTING_DEBT)
+    timings = []
+    for _ in range(20):
+        start = time.perf_counter()
+        what_if.sweep_applicant(scorer, APPLICANT, loan_amounts, tenures, rates, existing_debt=EXISTING_DEBT)
+        timings.append(time.perf_counter() - start)
+    sweep_seconds = float(np.median(timings))
+
+    # The model half depends only on (amount, tenure); check all of those cells.
+    for i, loan_amount in enumerate(loan_amounts):
+        for j, tenure in enumerate(tenures):
+            applicant = dict(APPLICANT, LoanAmount=loan_amount, Loan_Amount_Term=tenure)
+            prediction, probability, _ = model_module.predict_loan_approval(
+                model, scaler, create_input_data(applicant, encoder, feature_names)
+            )
+            assert sweep["model_approves"][i, j, 0] == (prediction == 1), (loan_amount, tenure)
+            assert np.isclose(sweep["approval_probability"][i, j, 0], probability[1], rtol=0, atol=1e-6)
+
+    rng = np.random.default_rng(42)
+    cells = np.column_stack([rng.integers(0, size, args.sample) for size in sweep["approvable"].shape])
+    start = time.perf_counter()
+    for i, j, k in cells:
+        applicant = dict(APPLICANT, LoanAmount=loan_amounts[i], Loan_Amount_Term=tenures[j])
+        prediction = model_module.predict_loan_approval(
+            model, scaler, create_input_data(applicant, encoder, feature_names)
+        )[0]
+        checks = perform_financial_checks(loan_amounts[i], tenures[j], APPLICANT["ApplicantIncome"],
+                                          APPLICANT["CoapplicantIncome"], EXISTING_DEBT, rates[k])
+        for name, value in checks.items():
+            assert np.isclose(sweep[name][i, j, k], value, rtol=1e-12, atol=0), name
+        assert sweep["approvable"][i, j, k] == (prediction == 1 and checks["financially_feasible"])
+    per_cell_seconds = (time.perf_counter() - start) / args.sample
+
+    n_cells = sweep["approvable"].size
+    print(f"grid {args.amounts} x {args.tenures} x {args.rates} = {n_cells:,} cells,"
+          f" {sweep['approvable'].mean():.1%} approvable")
+    print(f"sweep             : {sweep_seconds * 1000:>10.2f} ms")
+    print(f"per-cell pipeline : {per_cell_seconds * n_cells * 1000:>10.0f} ms (extrapolated from {args.sample} cells)")
+    print(f"speedup           : {per_cell_seconds * n_cells / sweep_seconds:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+Regression benchmark suite for ingestion, training, scoring and policy checks
+
+Runs every case on synthetic data in the train_u6lujuX_CVtuZ9i.csv schema,
+writes the timings with machine metadata to JSON and, given a baseline from an
+earlier run, flags every case that got slower than its threshold allows. The
+exit status is 1 when a case regressed, so CI can gate on it.
+
+    python benchmarks/run_suite.py --output results.json --save-baseline benchmarks/baseline.json
+    python benchmarks/run_suite.py --baseline benchmarks/baseline.json
+    python benchmarks/run_suite.py --rows 2000000 --cases load_data   # ingestion at scale
+
+Cases report seconds per call; the median over the repeats is compared. The
+app_render case re-runs the Streamlit app against the repository's own data
+and saved model, so it is only run when named with --cases.
+
+Usage:
+    python benchmarks/run_suite.py --rows 100000 --train-rows 3000 --requests 2000 --repeats 5
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from data_utils import create_input_data, load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+from financial_utils import perform_financial_checks  # noqa: E402
+import model as model_module  # noqa: E402
+from scorer import LinearScorer  # noqa: E402
+from synthetic import make_applications, write_applications_csv  # noqa: E402
+import what_if  # noqa: E402
+
+
+DEFAULT_CASES = [
+    "load_data",
+    "train_model",
+    "get_or_train_model_cold",
+    "get_or_train_model_warm",
+    "create_input_data_predict",
+    "perform_financial_checks",
+    "analyze_feature_impact",
+    "what_if_sweep",
+]
+OPTIONAL_CASES = ["app_render"]
+# Applicants per repeat of the what_if_sweep case, each swept over a SWEEP_SHAPE grid
+SWEEP_APPLICANTS = 100
+SWEEP_SHAPE = (100, 50, 20)
+# Allowed slowdown of the median against the baseline before a case counts as a regression.
+DEFAULT_THRESHOLD = 0.25
+# Cases dominated by disk I/O or by a few long solver runs are noisier.
+CASE_THRESHOLDS = {
+    "load_data": 0.35,
+    "train_model": 0.35,
+    "get_or_train_model_cold": 0.35,
+    "app_render": 0.50,
+}
+# Metadata that has to match for a baseline comparison to mean anything.
+COMPARABLE_METADATA = ["machine", "processor", "cpu_count", "python", "versions"]
+
+
+def machine_metadata():
+    """Hardware, software and source revision the results were measured on."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "versions": {
+            package: metadata.version(package)
+            for package in ("numpy", "pandas", "scikit-learn", "joblib", "streamlit")
+        },
+        "git_commit": commit,
+    }
+
+
+class Suite:
+    """Shared synthetic inputs, built on first use so a single case only prepares what it needs."""
+
+    def __init__(self, args, work_dir):
+        self.args = args
+        self.work_dir = Path(work_dir)
+        # Training cases keep their feature stores here, never in the repository's saved_models/.
+        self.store_dir = self.work_dir / "features"
+        self._cache = {}
+
+    def _get(self, name, build):
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    @property
+    def ingestion_csv(self):
+        return self._get("ingestion_csv", lambda: write_applications_csv(self.work_dir / "ingestion.csv",
+                                                                          self.args.rows))
+
+    @property
+    def training_data(self):
+        def build():
+            csv_path = write_applications_csv(self.work_dir / "training.csv", self.args.train_rows)
+            df, _, label_encoders, _ = load_data(csv_path, keep_raw=False)
+            return df, CategoricalEncoder.from_label_encoders(label_encoders)
+        return self._get("training_data", build)
+
+    @property
+    def model_bundle(self):
+        return self._get("model_bundle", lambda: model_module.train_model(self.training_data[0],
+                                                                          engine=self.args.engine,
+                                                                          store_dir=self.store_dir))
+
+    @property
+    def applicants(self):
+        def build():
+            applications = make_applications(self.args.requests, seed=7, missing_rate=0.0, include_target=False,
+                                             include_ids=False)
+            applications["LoanAmount"] *= 1000
+            return applications.to_dict("records")
+        return self._get("applicants", build)
+
+
+def time_calls(func, repeats, calls=1, warmup=False):
+    """Seconds per call of func() for each repeat; func runs `calls` calls per repeat."""
+    if warmup:
+        func()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) / calls)
+    return timings
+
+
+def case_load_data(suite):
+    csv_path = suite.ingestion_csv
+    return time_calls(lambda: load_data(csv_path, keep_raw=False), suite.args.repeats), suite.args.rows
+
+
+def case_train_model(suite):
+    df = suite.training_data[0]
+
+    def train():
+        model_module.train_model(df, engine=suite.args.engine, store_dir=suite.store_dir)
+
+    return time_calls(train, suite.args.train_repeats), len(df)
+
+
+def case_get_or_train_model_cold(suite):
+    df = suite.training_data[0]
+
+    def cold():
+        # A fresh artifact directory and feature store each time, so every call builds the store, trains and saves.
+        with tempfile.TemporaryDirectory(dir=suite.work_dir) as artifact_dir:
+            model_module.get_or_train_model(df, artifact_dir=artifact_dir, engine=suite.args.engine,
+                                            store_dir=model_module.feature_store_dir(artifact_dir))
+
+    return time_calls(cold, suite.args.train_repeats), len(df)
+
+
+def case_get_or_train_model_warm(suite):
+    df = suite.training_data[0]
+    artifact_dir = suite.work_dir / "artifacts"
+    model_module.save_model_artifact(
+        suite.model_bundle,
+        model_module.artifact_path_for(model_module.compute_model_fingerprint(df, suite.args.engine), artifact_dir),
+    )
+
+    def warm():
+        model_module.get_or_train_model(df, artifact_dir=artifact_dir, engine=suite.args.engine)
+
+    return time_calls(warm, suite.args.repeats, warmup=True), len(df)
+
+
+def case_create_input_data_predict(suite):
+    model, scaler = suite.model_bundle[:2]
+    feature_names = suite.model_bundle[-1]
+    encoder = suite.training_data[1]
+    applicants = suite.applicants
+
+    def requests():
+        for applicant in applicants:
+            input_data = create_input_data(applicant, encoder, feature_names)
+            model_module.predict_loan_approval(model, scaler, input_data)
+
+    return time_calls(requests, suite.args.repeats, len(applicants), warmup=True), len(applicants)
+
+
+def case_perform_financial_checks(suite):
+    applicants = suite.applicants
+
+    def checks():
+        for applicant in applicants:
+            perform_financial_checks(applicant["LoanAmount"], applicant["Loan_Amount_Term"],
+                                     applicant["ApplicantIncome"], applicant["CoapplicantIncome"])
+
+    return time_calls(checks, suite.args.repeats, len(applicants), warmup=True), len(applicants)
+
+
+def case_analyze_feature_impact(suite):
+    model, scaler = suite.model_bundle[:2]
+    feature_importance, feature_names = suite.model_bundle[-2:]
+    encoder = suite.training_data[1]
+    scaled_inputs = [
+        model_module.predict_loan_approval(model, scaler, create_input_data(applicant, encoder, feature_names))[2]
+        for applicant in suite.applicants
+    ]
+
+    def impacts():
+        for scaled_input in scaled_inputs:
+            model_module.analyze_feature_impact(feature_names, feature_importance, scaled_input)
+
+    return time_calls(impacts, suite.args.repeats, len(scaled_inputs), warmup=True), len(scaled_inputs)
+
+
+def case_what_if_sweep(suite):
+    model, scaler = suite.model_bundle[:2]
+    scorer = LinearScorer.from_estimator(model, scaler, suite.model_bundle[-1], suite.training_data[1])
+    applicants = suite.applicants[:SWEEP_APPLICANTS]
+    n_amounts, n_tenures, n_rates = SWEEP_SHAPE
+    axes = (np.linspace(10_000, 800_000, n_amounts), np.linspace(12, 480, n_tenures), np.linspace(5, 18, n_rates))
+
+    def sweeps():
+        for applicant in applicants:
+            what_if.sweep_applicant(scorer, applicant, *axes)
+
+    return time_calls(sweeps, suite.args.repeats, len(applicants), warmup=True), len(applicants)
+
+
+def case_app_render(suite):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        # The first run imports and loads everything; the timed reruns are what a user's clicks cost.
+        app.run()
+        if app.exception:
+            raise RuntimeError(f"app raised: {app.exception}")
+        return time_calls(app.run, suite.args.repeats), 1
+    finally:
+        os.chdir(cwd)
+
+
+CASES = {name: globals()[f"case_{name}"] for name in DEFAULT_CASES + OPTIONAL_CASES}
+
+
+def compare(results, baseline, default_threshold):
+    """
+    Compare case medians with a baseline run
+
+    Args:
+        results (dict): Output of this suite
+        baseline (dict): Output of an earlier run
+        default_threshold (float): Allowed relative slowdown for cases without their own threshold
+
+    Returns:
+        tuple: (rows, regressed). rows hold (case, baseline median, current median,
+        relative change, status); regressed lists the cases over their threshold.
+    """
+    rows = []
+    regressed = []
+    for name, current in results["cases"].items():
+        previous = baseline.get("cases", {}).get(name)
+        if previous is None:
+            rows.append((name, None, current["median_seconds"], None, "new"))
+            continue
+        change = current["median_seconds"] / previous["median_seconds"] - 1
+        threshold = CASE_THRESHOLDS.get(name, default_threshold)
+        if change > threshold:
+            status = f"REGRESSED (> +{threshold:.0%})"
+            regressed.append(name)
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, previous["median_seconds"], current["median_seconds"], change, status))
+    return rows, regressed
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=DEFAULT_CASES)
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows in the load_data CSV")
+    parser.add_argument("--train-rows", type=int, default=3_000, help="Rows the model is trained on")
+    parser.add_argument("--engine", choices=model_module.TRAINING_ENGINES, default="svc")
+    parser.add_argument("--requests", type=int, default=2_000, help="Applicants per repeat of the per-request cases")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--train-repeats", type=int, default=1, help="Repeats of the cases that train a model")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare with the results of an earlier run")
+    parser.add_argument("--save-baseline", type=Path, help="Also write the results here for later comparisons")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown for cases without their own threshold")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    results = {
+        "metadata": machine_metadata(),
+        "config": {key: value for key, value in vars(args).items()
+                   if key in ("rows", "train_rows", "engine", "requests", "repeats", "train_repeats")},
+        "cases": {},
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        suite = Suite(args, work_dir)
+        for name in args.cases:
+            timings, size = CASES[name](suite)
+            results["cases"][name] = {
+                "size": size,
+                "repeats_seconds": timings,
+                "median_seconds": statistics.median(timings),
+                "min_seconds": min(timings),
+            }
+            print(f"{name:<26} {format_seconds(results['cases'][name]['median_seconds']):>10} per call"
+                  f" (min {format_seconds(min(timings))}, size {size:,})")
+
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(results, indent=2))
+
+    if args.baseline is None:
+        return
+    baseline = json.loads(args.baseline.read_text())
+    mismatched = [key for key in COMPARABLE_METADATA
+                  if baseline.get("metadata", {}).get(key) != results["metadata"][key]]
+    if mismatched:
+        print(f"\nWarning: the baseline was measured with a different {', '.join(mismatched)};"
+              f" timings may not be comparable.")
+    if baseline.get("config") != results["config"]:
+        print("Warning: the baseline used different suite settings; timings may not be comparable.")
+
+    rows, regressed = compare(results, baseline, args.threshold)
+    print(f"\n{'case':<26} | {'baseline':>10} | {'current':>10} | {'change':>7} | status")
+    for name, previous, current, change, status in rows:
+        change_text = "-" if change is None else f"{change:+.0%}"
+        print(f"{name:<26} | {format_seconds(previous):>10} | {format_seconds(current):>10} | {change_text:>7}"
+              f" | {status}")
+    if regressed:
+        sys.exit(f"\n{len(regressed)} case(s) regressed: {', '.join(regressed)}")
+
+
+if __name__ == "__main__":
+    main()
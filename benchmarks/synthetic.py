@@ -0,0 +1,91 @@
+"""
+Synthetic loan applications following the train_u6lujuX_CVtuZ9i.csv schema
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+CATEGORICAL_LEVELS = {
+    "Gender": (["Male", "Female"], [0.81, 0.19]),
+    "Married": (["Yes", "No"], [0.65, 0.35]),
+    "Dependents": (["0", "1", "2", "3+"], [0.58, 0.17, 0.17, 0.08]),
+    "Education": (["Graduate", "Not Graduate"], [0.78, 0.22]),
+    "Self_Employed": (["No", "Yes"], [0.86, 0.14]),
+    "Property_Area": (["Semiurban", "Urban", "Rural"], [0.38, 0.33, 0.29]),
+}
+LOAN_TERMS = ([12, 36, 60, 84, 120, 180, 240, 300, 360, 480], [0.01, 0.01, 0.01, 0.01, 0.01, 0.07, 0.01, 0.02, 0.83, 0.02])
+RAW_COLUMNS = [
+    "Loan_ID", "Gender", "Married", "Dependents", "Education", "Self_Employed", "ApplicantIncome",
+    "CoapplicantIncome", "LoanAmount", "Loan_Amount_Term", "Credit_History", "Property_Area", "Loan_Status",
+]
+MISSING_COLUMNS = ["Gender", "Married", "Dependents", "Self_Employed", "LoanAmount", "Loan_Amount_Term", "Credit_History"]
+
+
+def make_applications(n_rows, seed=42, missing_rate=0.02, include_target=True, include_ids=True, first_id=0):
+    """
+    Generate synthetic loan applications in the raw CSV layout
+
+    Args:
+        n_rows (int): Number of applications to generate
+        seed (int): Random seed for reproducible data
+        missing_rate (float): Share of missing values in columns that have gaps in the real data
+        include_target (bool): Whether to include the Loan_Status column
+        include_ids (bool): Whether to include the Loan_ID column (slow for tens of millions of rows)
+        first_id (int): Number of the first Loan_ID, for generating a file in several parts
+
+    Returns:
+        pandas.DataFrame: Applications with the same columns as the training CSV
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    if include_ids:
+        data["Loan_ID"] = pd.Series(np.arange(first_id, first_id + n_rows)).map("LPS{:08d}".format)
+
+    for col, (levels, weights) in CATEGORICAL_LEVELS.items():
+        codes = rng.choice(len(levels), size=n_rows, p=weights)
+        data[col] = pd.Categorical.from_codes(codes, categories=levels)
+
+    data["ApplicantIncome"] = np.round(rng.lognormal(8.35, 0.6, n_rows)).astype(np.int64)
+    data["CoapplicantIncome"] = np.where(rng.random(n_rows) < 0.45, 0.0, np.round(rng.lognormal(7.4, 0.7, n_rows)))
+    # LoanAmount is stored in thousands in the source data.
+    data["LoanAmount"] = np.clip(np.round(rng.lognormal(4.85, 0.45, n_rows)), 9, 700)
+    data["Loan_Amount_Term"] = rng.choice(LOAN_TERMS[0], size=n_rows, p=LOAN_TERMS[1]).astype(float)
+    data["Credit_History"] = (rng.random(n_rows) < 0.84).astype(float)
+
+    df = pd.DataFrame(data)
+    if include_target:
+        # Approval odds follow credit history the way the real data does.
+        approve_prob = np.where(df["Credit_History"] == 1.0, 0.79, 0.08)
+        df["Loan_Status"] = np.where(rng.random(n_rows) < approve_prob, "Y", "N")
+
+    for col in MISSING_COLUMNS:
+        mask = rng.random(n_rows) < missing_rate
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].where(~mask)
+        else:
+            df.loc[mask, col] = np.nan
+
+    return df[[col for col in RAW_COLUMNS if col in df.columns]]
+
+
+def write_applications_csv(csv_path, n_rows, seed=42, chunk_rows=500_000, **kwargs):
+    """
+    Write synthetic applications to a CSV in chunks, so millions of rows fit in bounded memory
+
+    Args:
+        csv_path (str or Path): Destination CSV
+        n_rows (int): Number of applications to write
+        seed (int): Random seed; each chunk derives its own from it
+        chunk_rows (int): Rows generated and written at a time
+        **kwargs: Passed on to make_applications
+
+    Returns:
+        Path: csv_path
+    """
+    for chunk_index, first_row in enumerate(range(0, n_rows, chunk_rows)):
+        chunk = make_applications(min(chunk_rows, n_rows - first_row), seed=seed + chunk_index,
+                                  first_id=first_row, **kwargs)
+        chunk.to_csv(csv_path, mode="w" if chunk_index == 0 else "a", header=chunk_index == 0, index=False)
+    return Path(csv_path)
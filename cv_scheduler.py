@@ -0,0 +1,258 @@
+"""
+Parallel cross-validated hyperparameter search over a shared training matrix
+
+Replaces GridSearchCV(n_jobs=-1) for the linear SVC. GridSearchCV pickles the
+training matrix into every joblib task and re-derives the folds per
+candidate. Here every worker maps one training matrix from disk, the
+stratified folds are computed once and handed to the workers at start-up, and
+each task is just a (candidate, fold) pair of indices. Given a FeatureStore,
+the workers map its shared float32 training rows read-only and standardize
+each fold slice as they cut it; given an array, the (already scaled) matrix is
+written once to a temporary .npy file that every worker maps copy-on-write.
+
+With halving off, every candidate is scored on every fold with the same folds,
+scorer and tie-breaking as GridSearchCV, so the selected parameters and the
+refitted model are identical. With halving on, candidates are pruned by
+successive halving over folds: all candidates are scored on the first
+min_folds folds, the best 1/eta go on to the next rung with eta times as many
+folds, and so on until the survivors have been scored on every fold. Fold
+scores are cached across rungs, so each (candidate, fold) pair is fitted at
+most once.
+
+Every fit is timed, and the search returns a per-fit and per-phase wall-clock
+breakdown.
+"""
+import math
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from feature_store import FeatureStore, load_feature_store
+import instrumentation
+
+
+# Per-process search state, set once by _init_worker.
+_worker_state = {}
+
+
+def make_folds(y, cv):
+    """
+    Stratified CV folds, identical to GridSearchCV(cv=<int>) for a classifier
+
+    Args:
+        y (array-like): Training labels
+        cv (int): Number of folds
+
+    Returns:
+        list: (train_positions, validation_positions) per fold
+    """
+    from sklearn.model_selection import StratifiedKFold
+
+    y = np.asarray(y)
+    return list(StratifiedKFold(n_splits=cv).split(np.zeros((len(y), 1)), y))
+
+
+def _init_worker(matrix_source, y, folds, estimator, scoring, scaler):
+    from sklearn.metrics import get_scorer
+
+    source_kind, source_path = matrix_source
+    if source_kind == "store":
+        # Read-only views of the shared store; fold slices are copies, so libsvm still gets writable buffers.
+        store = load_feature_store(source_path)
+        if store is None:
+            raise FileNotFoundError(f"Feature store {source_path} was removed before the CV workers mapped it")
+        X = store.X_train
+    else:
+        # Copy-on-write: pages are shared between workers, and libsvm still gets a writable buffer.
+        X = np.load(source_path, mmap_mode="c")
+    _worker_state.update(
+        X=X,
+        y=y,
+        folds=folds,
+        estimator=estimator,
+        scorer=get_scorer(scoring),
+        scaler=scaler,
+    )
+
+
+def _fold_rows(positions):
+    """Training rows at positions, standardized in float64 when the worker maps raw features."""
+    rows = _worker_state["X"][positions]
+    scaler = _worker_state["scaler"]
+    return rows if scaler is None else scaler.transform(rows.astype(np.float64), copy=False)
+
+
+def _fit_and_score(candidate_index, params, fold_index):
+    from sklearn.base import clone
+
+    y = _worker_state["y"]
+    train_positions, validation_positions = _worker_state["folds"][fold_index]
+    estimator = clone(_worker_state["estimator"]).set_params(**params)
+
+    start = time.perf_counter()
+    estimator.fit(_fold_rows(train_positions), y[train_positions])
+    fitted = time.perf_counter()
+    score = _worker_state["scorer"](estimator, _fold_rows(validation_positions), y[validation_positions])
+    return {
+        "candidate": candidate_index,
+        "fold": fold_index,
+        "score": float(score),
+        "fit_seconds": fitted - start,
+        "score_seconds": time.perf_counter() - fitted,
+        "pid": os.getpid(),
+    }
+
+
+def _rung_fold_counts(n_folds, min_folds, eta):
+    """Folds each rung scores its candidates on, ending with all folds."""
+    counts = []
+    folds = max(1, min(min_folds, n_folds))
+    while folds < n_folds:
+        counts.append(folds)
+        folds *= eta
+    return counts + [n_folds]
+
+
+def _best_candidate(candidates, scores, n_folds):
+    # GridSearchCV picks the first candidate with the highest mean score.
+    means = [np.mean([scores[(candidate, fold)] for fold in range(n_folds)]) for candidate in candidates]
+    return candidates[int(np.argmax(means))], float(np.max(means))
+
+
+def search(estimator, param_grid, X, y, cv=5, scoring="f1", halving=False, eta=3, min_folds=1, workers=None,
+           work_dir=None, scaler=None):
+    """
+    Cross-validate every parameter combination in parallel and refit the best one
+
+    Args:
+        estimator: Unfitted scikit-learn estimator
+        param_grid (dict): Parameter name to candidate values, as for GridSearchCV
+        X (numpy.ndarray or FeatureStore): (N, F) training matrix, or a feature store whose
+            X_train rows the workers map directly
+        y (array-like): Training labels
+        cv (int): Number of stratified folds
+        scoring (str): scikit-learn scorer name, as for GridSearchCV
+        halving (bool): Prune candidates by successive halving over folds
+        eta (int): Halving rate; each rung keeps the best 1/eta of its candidates
+        min_folds (int): Folds in the first halving rung
+        workers (int, optional): Worker processes; defaults to the number of CPUs. 1 runs in-process.
+        work_dir (str or Path, optional): Directory for the shared matrix (a temporary one by default)
+        scaler (StandardScaler, optional): Fitted scaler applied to every fold slice (and the refit
+            matrix), for unscaled input such as a feature store
+
+    Returns:
+        tuple: (refitted best estimator, report). The report holds best_params,
+        best_score, the candidate list, per-rung survivors, per-fit timings and
+        the setup/search/refit wall-clock split.
+    """
+    from sklearn.base import clone
+    from sklearn.model_selection import ParameterGrid
+
+    workers = workers or os.cpu_count() or 1
+    candidates = list(ParameterGrid(param_grid))
+    y = np.asarray(y)
+    started = time.perf_counter()
+
+    tmp_dir = tempfile.mkdtemp(dir=work_dir, prefix="cv-search-")
+    try:
+        if isinstance(X, FeatureStore):
+            matrix_source = ("store", str(X.path))
+            X = X.X_train
+        else:
+            X = np.ascontiguousarray(X, dtype=float)
+            matrix_source = ("npy", str(Path(tmp_dir) / "X_train.npy"))
+            np.save(matrix_source[1], X)
+        folds = make_folds(y, cv)
+        worker_args = (matrix_source, y, folds, estimator, scoring, scaler)
+        setup_seconds = time.perf_counter() - started
+
+        scores = {}
+        fits = []
+        rungs = []
+        survivors = list(range(len(candidates)))
+        rung_fold_counts = _rung_fold_counts(cv, min_folds, eta) if halving else [cv]
+
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=worker_args) if workers > 1 else None
+        if executor is None:
+            _init_worker(*worker_args)
+        try:
+            for rung, n_folds in enumerate(rung_fold_counts):
+                tasks = [(candidate, candidates[candidate], fold) for candidate in survivors for fold in range(n_folds)
+                         if (candidate, fold) not in scores]
+                rung_start = time.perf_counter()
+                if executor is None:
+                    results = [_fit_and_score(*task) for task in tasks]
+                else:
+                    results = list(executor.map(_fit_and_score, *zip(*tasks))) if tasks else []
+                for result in results:
+                    result["rung"] = rung
+                    scores[(result["candidate"], result["fold"])] = result["score"]
+                    instrumentation.observe("cv_fit", result["fit_seconds"])
+                fits.extend(results)
+
+                means = {candidate: float(np.mean([scores[(candidate, fold)] for fold in range(n_folds)]))
+                         for candidate in survivors}
+                rungs.append({"folds": n_folds, "candidates": list(survivors), "fits": len(results),
+                              "seconds": time.perf_counter() - rung_start, "mean_scores": means})
+                if n_folds < cv:
+                    # Stable sort keeps grid order among ties, as GridSearchCV's ranking does.
+                    keep = max(1, math.ceil(len(survivors) / eta))
+                    survivors = sorted(survivors, key=lambda candidate: -means[candidate])[:keep]
+                    survivors.sort()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            _worker_state.clear()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    search_seconds = time.perf_counter() - started - setup_seconds
+    best_index, best_score = _best_candidate(survivors, scores, cv)
+
+    refit_start = time.perf_counter()
+    if scaler is not None:
+        X = scaler.transform(np.asarray(X, dtype=np.float64))
+    best_estimator = clone(estimator).set_params(**candidates[best_index]).fit(X, y)
+    refit_seconds = time.perf_counter() - refit_start
+
+    report = {
+        "best_params": candidates[best_index],
+        "best_score": best_score,
+        "candidates": candidates,
+        "rungs": rungs,
+        "fits": fits,
+        "workers": workers,
+        "setup_seconds": setup_seconds,
+        "search_seconds": search_seconds,
+        "refit_seconds": refit_seconds,
+        "fit_seconds_total": sum(fit["fit_seconds"] for fit in fits),
+        "score_seconds_total": sum(fit["score_seconds"] for fit in fits),
+    }
+    return best_estimator, report
+
+
+def format_report(report):
+    """Human-readable summary of a search report, one line per rung and per candidate."""
+    lines = [
+        f"{len(report['fits'])} fits on {report['workers']} worker(s): setup {report['setup_seconds']:.2f}s,"
+        f" search {report['search_seconds']:.2f}s (fit {report['fit_seconds_total']:.2f}s,"
+        f" score {report['score_seconds_total']:.2f}s of worker time), refit {report['refit_seconds']:.2f}s",
+    ]
+    for rung, details in enumerate(report["rungs"]):
+        lines.append(f"rung {rung}: {len(details['candidates'])} candidate(s) x {details['folds']} fold(s),"
+                     f" {details['fits']} new fits in {details['seconds']:.2f}s")
+    per_candidate = {}
+    for fit in report["fits"]:
+        per_candidate.setdefault(fit["candidate"], []).append(fit)
+    for candidate, candidate_fits in sorted(per_candidate.items()):
+        mean_score = np.mean([fit["score"] for fit in candidate_fits])
+        fit_seconds = sum(fit["fit_seconds"] for fit in candidate_fits)
+        lines.append(f"  {report['candidates'][candidate]}: {len(candidate_fits)} fold(s), mean score {mean_score:.4f},"
+                     f" fit {fit_seconds:.2f}s")
+    lines.append(f"best: {report['best_params']} (mean score {report['best_score']:.4f})")
+    return "\n".join(lines)
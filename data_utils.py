@@ -1,112 +1,432 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder
 
+from encoders import CategoricalEncoder
+from features import FEATURE_DTYPE, build_feature_matrix, compute_engineered_features
+from instrumentation import instrumented
 
-def _calculate_emi(loan_amount, tenure_months, annual_interest_rate=8.5):
-    """Estimate monthly EMI using a fixed reference interest rate."""
-    monthly_rate = (annual_interest_rate / 100) / 12
-    if monthly_rate == 0:
-        return loan_amount / max(tenure_months, 1)
-    return loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months / (
-        ((1 + monthly_rate) ** tenure_months) - 1
-    )
 
+DATA_PATH = "train_u6lujuX_CVtuZ9i.csv"
+CATEGORICAL_COLUMNS = ["Gender", "Married", "Dependents", "Education", "Self_Employed", "Property_Area"]
+MODE_FILL_COLUMNS = ["Gender", "Married", "Dependents", "Self_Employed", "Credit_History"]
+MEDIAN_FILL_COLUMNS = ["LoanAmount", "Loan_Amount_Term"]
+# Columns of the processed frame held as int8 by the compact schema; every other column is float32.
+CODE_COLUMNS = CATEGORICAL_COLUMNS + ["Credit_History", "Loan_Status"]
+PROCESSED_CACHE_DIR = Path("saved_models/processed")
+MAX_PROCESSED_CACHES = 2
+# Bump when preprocessing changes so existing on-disk caches are rebuilt.
+PROCESSED_CACHE_VERSION = 2
+# Pin dtypes so every chunk parses the same way (e.g. Dependents stays text without a "3+" row).
+RAW_DTYPES = {
+    **{col: "str" for col in ["Loan_ID", *CATEGORICAL_COLUMNS, "Loan_Status"]},
+    "CoapplicantIncome": "float64",
+    "LoanAmount": "float64",
+    "Loan_Amount_Term": "float64",
+    "Credit_History": "float64",
+}
 
-def load_data():
+
+def compute_fill_values(df, fallback=None):
     """
-    Load and preprocess the dataset for loan approval prediction
+    Compute the missing-value fills used during preprocessing
+
+    Args:
+        df (pandas.DataFrame): Raw applications
+        fallback (dict, optional): Fills for columns with no values in df, e.g. the training set's
+            compute_ingestion_stats fill_values
 
     Returns:
-        tuple: (processed_df, raw_df, label_encoders, original_categorical_values)
+        dict: Column name to mode (categorical) or median (numeric) fill value
+
+    Raises:
+        ValueError: If a column has no values in df and no fallback
     """
-    df = pd.read_csv("train_u6lujuX_CVtuZ9i.csv")
+    fill_values = {}
+    for col in MODE_FILL_COLUMNS + MEDIAN_FILL_COLUMNS:
+        if df[col].notna().any():
+            fill_values[col] = df[col].mode()[0] if col in MODE_FILL_COLUMNS else df[col].median()
+        elif fallback is not None:
+            fill_values[col] = fallback[col]
+        else:
+            raise ValueError(f"{col} has no values to compute a missing-value fill from")
+    return fill_values
 
-    # Make a copy of the dataframe before preprocessing
-    raw_df = df.copy()
 
+def _mode_from_counts(counts):
+    """Return the most frequent value, breaking ties like pandas.Series.mode."""
+    return counts[counts == counts.max()].sort_index().index[0]
+
+
+def _median_from_counts(counts):
+    """Return the exact median of the values summarized by a value-count series."""
+    counts = counts.sort_index()
+    cumulative = counts.cumsum().to_numpy()
+    total = cumulative[-1]
+    lower = counts.index[np.searchsorted(cumulative, (total - 1) // 2, side="right")]
+    upper = counts.index[np.searchsorted(cumulative, total // 2, side="right")]
+    return (lower + upper) / 2
+
+
+def compute_ingestion_stats(csv_path=DATA_PATH, chunksize=100_000):
+    """
+    First pass over a CSV collecting the statistics needed to preprocess it chunk by chunk
+
+    Only value counts are kept in memory, so memory is bounded by the number of distinct
+    values rather than the number of rows.
+
+    Args:
+        csv_path (str or Path): Applications CSV in the training schema
+        chunksize (int): Rows read per chunk
+
+    Returns:
+        dict: fill_values (modes/medians) and categories (values per categorical column)
+    """
+    counts = {col: None for col in MODE_FILL_COLUMNS + MEDIAN_FILL_COLUMNS}
+    categories = {col: {} for col in CATEGORICAL_COLUMNS}
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=RAW_DTYPES):
+        for col in counts:
+            chunk_counts = chunk[col].value_counts()
+            counts[col] = chunk_counts if counts[col] is None else counts[col].add(chunk_counts, fill_value=0)
+        for col in CATEGORICAL_COLUMNS:
+            # dict keys keep first-appearance order, like Series.unique().
+            categories[col].update(dict.fromkeys(chunk[col].dropna().unique()))
+
+    fill_values = {col: _mode_from_counts(counts[col]) for col in MODE_FILL_COLUMNS}
+    fill_values.update({col: _median_from_counts(counts[col]) for col in MEDIAN_FILL_COLUMNS})
+    for col, values in categories.items():
+        if col in fill_values:
+            values.setdefault(fill_values[col], None)
+
+    return {
+        "fill_values": fill_values,
+        "categories": {col: list(values) for col, values in categories.items()},
+    }
+
+
+def build_label_encoders(categories):
+    """
+    Fit one LabelEncoder per categorical column from its known values
+
+    Args:
+        categories (dict): Column name to list of category values
+
+    Returns:
+        dict: Column name to fitted LabelEncoder
+    """
+    # Imported here so the scoring paths that only read data never load scikit-learn.
+    from sklearn.preprocessing import LabelEncoder
+
+    return {col: LabelEncoder().fit(np.asarray(values, dtype=object)) for col, values in categories.items()}
+
+
+def compact_dtypes(columns):
+    """
+    Compact dtypes for the columns of a processed frame
+
+    Args:
+        columns (list): Processed column names
+
+    Returns:
+        dict: int8 for label codes, Credit_History and Loan_Status, FEATURE_DTYPE for the rest
+    """
+    return {col: np.int8 if col in CODE_COLUMNS else FEATURE_DTYPE for col in columns}
+
+
+def preprocess_data(df, fill_values, label_encoders, compact=True):
+    """
+    Fill, rescale, engineer and encode raw applications in place
+
+    Args:
+        df (pandas.DataFrame): Raw applications (a full file or a single chunk)
+        fill_values (dict): Missing-value fills from compute_fill_values or compute_ingestion_stats
+        label_encoders (dict): Fitted label encoders for categorical features
+        compact (bool): Store the result with compact_dtypes instead of int64/float64
+
+    Returns:
+        pandas.DataFrame: The preprocessed dataframe
+
+    Raises:
+        ValueError: If compact is set and a code column is still missing values (e.g. unlabelled rows)
+    """
     # Drop Loan_ID if present
     if 'Loan_ID' in df.columns:
         df.drop("Loan_ID", axis=1, inplace=True)
 
     # Fill missing values
-    df.fillna({
-        "Gender": df["Gender"].mode()[0],
-        "Married": df["Married"].mode()[0],
-        "Dependents": df["Dependents"].mode()[0],
-        "Self_Employed": df["Self_Employed"].mode()[0],
-        "LoanAmount": df["LoanAmount"].median(),
-        "Loan_Amount_Term": df["Loan_Amount_Term"].median(),
-        "Credit_History": df["Credit_History"].mode()[0],
-    }, inplace=True)
+    df.fillna(fill_values, inplace=True)
 
     # Convert training dataset loan amount from thousands to rupees.
     df["LoanAmount"] = df["LoanAmount"] * 1000
-    df["TotalIncome"] = df["ApplicantIncome"] + df["CoapplicantIncome"]
-    df["IncomeToLoanRatio"] = df["TotalIncome"] / df["LoanAmount"].replace(0, pd.NA)
-    df["EMI"] = df.apply(
-        lambda row: _calculate_emi(row["LoanAmount"], row["Loan_Amount_Term"]),
-        axis=1
+
+    # Engineer affordability features for all rows in one vectorized pass.
+    features = compute_engineered_features(
+        df["ApplicantIncome"].to_numpy(),
+        df["CoapplicantIncome"].to_numpy(),
+        df["LoanAmount"].to_numpy(),
+        df["Loan_Amount_Term"].to_numpy(),
     )
-    df["EMIToIncomeRatio"] = df["EMI"] / df["TotalIncome"].replace(0, pd.NA)
-    df["IncomeToLoanRatio"] = df["IncomeToLoanRatio"].fillna(0.0)
-    df["EMIToIncomeRatio"] = df["EMIToIncomeRatio"].fillna(1.0)
+    for name, values in features.items():
+        df[name] = values
+
+    # Encode categorical columns
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = label_encoders[col].transform(df[col])
+
+    # Convert Loan_Status from 'Y'/'N' to 1/0 when the file is labelled
+    if "Loan_Status" in df.columns:
+        df['Loan_Status'] = df['Loan_Status'].map({'Y': 1, 'N': 0})
+
+    if compact:
+        # Codes run from 0 to len(classes_) - 1, so up to 128 categories fit in int8.
+        oversized = [col for col in CATEGORICAL_COLUMNS
+                     if len(label_encoders[col].classes_) - 1 > np.iinfo(np.int8).max]
+        if oversized:
+            raise ValueError(f"Too many categories for int8 codes in {oversized}; use compact=False")
+        # int8 has no NaN, and casting one gives an arbitrary code rather than an error.
+        missing = df[df.columns.intersection(CODE_COLUMNS)].isna().sum()
+        missing = missing[missing > 0].to_dict()
+        if missing:
+            raise ValueError(f"Cannot store missing values as int8 codes (rows per column: {missing}); "
+                             "drop unlabelled applications first or use compact=False")
+        df = df.astype(compact_dtypes(df.columns))
+
+    return df
+
+
+@instrumented("load_data")
+def load_data(csv_path=DATA_PATH, keep_raw=True, compact=True):
+    """
+    Load and preprocess the dataset for loan approval prediction
+
+    Args:
+        csv_path (str or Path): Applications CSV in the training schema
+        keep_raw (bool): Whether to keep an unprocessed copy of the data as raw_df
+        compact (bool): Use the int8/float32 schema (compact_dtypes) for the processed frame
+
+    Returns:
+        tuple: (processed_df, raw_df, label_encoders, original_categorical_values)
+    """
+    df = pd.read_csv(csv_path, dtype=RAW_DTYPES)
+
+    # Make a copy of the dataframe before preprocessing only when the caller needs it
+    raw_df = df.copy() if keep_raw else None
+
+    fill_values = compute_fill_values(df)
+    df.fillna(fill_values, inplace=True)
 
     # Store original values for categorical columns before encoding
     original_categorical_values = {}
-    categorical_cols = ["Gender", "Married", "Dependents", "Education", "Self_Employed", "Property_Area"]
-    for col in categorical_cols:
+    for col in CATEGORICAL_COLUMNS:
         original_categorical_values[col] = df[col].unique()
 
-    # Encode categorical columns
-    label_encoders = {}
-    for col in categorical_cols:
-        le = LabelEncoder()
-        df[col] = le.fit_transform(df[col])
-        label_encoders[col] = le
+    from sklearn.preprocessing import LabelEncoder
 
-    # Convert Loan_Status from 'Y'/'N' to 1/0
-    df['Loan_Status'] = df['Loan_Status'].map({'Y': 1, 'N': 0})
+    label_encoders = {col: LabelEncoder().fit(df[col]) for col in CATEGORICAL_COLUMNS}
+    df = preprocess_data(df, fill_values, label_encoders, compact=compact)
 
     return df, raw_df, label_encoders, original_categorical_values
 
 
+def load_labelled_batch(csv_path, label_encoders, fill_values=None):
+    """
+    Load newly labelled applications for an incremental model update
+
+    The file uses the training CSV layout. Rows without a Loan_Status are
+    skipped, gaps are filled from the batch itself as load_data does (from
+    fill_values for a column the batch leaves entirely blank), and the
+    categorical columns are encoded with the served model's encoders so the
+    codes line up with the training data.
+
+    Args:
+        csv_path (str or Path): Labelled applications CSV in the training schema
+        label_encoders (dict): Encoders the served model was trained with
+        fill_values (dict, optional): Training-set fills from compute_ingestion_stats
+
+    Returns:
+        pandas.DataFrame: Preprocessed batch with the same columns as load_data's frame
+
+    Raises:
+        ValueError: If the batch holds no labelled rows, a category the model has never seen, or a blank
+            column with no fill_values
+    """
+    df = pd.read_csv(csv_path, dtype=RAW_DTYPES)
+    df = df[df["Loan_Status"].isin(["Y", "N"])].reset_index(drop=True)
+    if df.empty:
+        raise ValueError(f"{csv_path} holds no labelled applications")
+    return preprocess_data(df, compute_fill_values(df, fallback=fill_values), label_encoders)
+
+
+def hash_file(path, block_size=1 << 20):
+    """Hex SHA-256 of a file's bytes, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def processed_cache_path(csv_path=DATA_PATH, cache_dir=PROCESSED_CACHE_DIR):
+    """Cache directory for a CSV, keyed by its content hash and the cache format version."""
+    return Path(cache_dir) / f"v{PROCESSED_CACHE_VERSION}-{hash_file(csv_path)[:16]}"
+
+
+def save_processed_cache(df, label_encoders, original_categorical_values, cache_path):
+    """
+    Write a processed frame as one .npy file per column plus a JSON manifest
+
+    The directory is assembled under a temporary name and renamed into place, so
+    readers see either no cache or a complete one.
+
+    Args:
+        df (pandas.DataFrame): Preprocessed dataframe (numeric columns only)
+        label_encoders (dict): Fitted label encoders for categorical features
+        original_categorical_values (dict): Category values in order of first appearance
+        cache_path (str or Path): Destination directory
+    """
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=cache_path.parent, prefix=f".{cache_path.name}.")
+    try:
+        for position, col in enumerate(df.columns):
+            np.save(Path(tmp_dir) / f"{position}.npy", df[col].to_numpy(), allow_pickle=False)
+        manifest = {
+            "columns": df.columns.tolist(),
+            "classes": {col: [str(value) for value in le.classes_] for col, le in label_encoders.items()},
+            "original_categorical_values": {
+                col: [str(value) for value in values] for col, values in original_categorical_values.items()
+            },
+        }
+        with open(Path(tmp_dir) / "manifest.json", "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(tmp_dir, cache_path)
+    except OSError:
+        # Another worker published the same cache first; theirs is identical.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not (cache_path / "manifest.json").exists():
+            raise
+
+
+@instrumented("load_processed_cache")
+def load_processed_cache(cache_path):
+    """
+    Map a cache written by save_processed_cache
+
+    Columns are read-only memory maps, so processes loading the same cache share
+    the page-cache copy instead of each holding their own.
+
+    Args:
+        cache_path (str or Path): Directory written by save_processed_cache
+
+    Returns:
+        tuple: (processed_df, label_encoders, original_categorical_values), or None if the cache is missing
+    """
+    cache_path = Path(cache_path)
+    try:
+        with open(cache_path / "manifest.json") as manifest_file:
+            manifest = json.load(manifest_file)
+    except FileNotFoundError:
+        return None
+
+    columns = {
+        col: np.load(cache_path / f"{position}.npy", mmap_mode="r").view(np.ndarray)
+        for position, col in enumerate(manifest["columns"])
+    }
+    # copy=False keeps one block per memory-mapped column instead of consolidating into a copy.
+    df = pd.DataFrame(columns, copy=False)
+    label_encoders = build_label_encoders(manifest["classes"])
+    original_categorical_values = {
+        col: pd.array(values, dtype="str") for col, values in manifest["original_categorical_values"].items()
+    }
+    # Mark the cache as recently used for eviction.
+    os.utime(cache_path / "manifest.json")
+    return df, label_encoders, original_categorical_values
+
+
+def evict_processed_caches(cache_dir=PROCESSED_CACHE_DIR, keep=MAX_PROCESSED_CACHES):
+    """Delete all but the `keep` most recently used processed-data caches."""
+    def last_used(cache_path):
+        try:
+            return (cache_path / "manifest.json").stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    caches = sorted((path for path in Path(cache_dir).glob("v*-*") if path.is_dir()), key=last_used, reverse=True)
+    for stale_cache in caches[keep:]:
+        shutil.rmtree(stale_cache, ignore_errors=True)
+
+
+def load_data_cached(csv_path=DATA_PATH, cache_dir=PROCESSED_CACHE_DIR):
+    """
+    load_data without the raw copy, backed by an on-disk columnar cache
+
+    The first call for a CSV runs load_data and writes the result to a cache keyed
+    by the CSV's content hash; later calls, from any process, memory-map it.
+
+    Args:
+        csv_path (str or Path): Applications CSV in the training schema
+        cache_dir (str or Path): Directory holding processed-data caches
+
+    Returns:
+        tuple: (processed_df, None, label_encoders, original_categorical_values), as load_data(keep_raw=False)
+    """
+    cache_path = processed_cache_path(csv_path, cache_dir)
+    cached = load_processed_cache(cache_path)
+    if cached is None:
+        df, _, label_encoders, original_categorical_values = load_data(csv_path, keep_raw=False)
+        save_processed_cache(df, label_encoders, original_categorical_values, cache_path)
+        evict_processed_caches(cache_dir)
+        cached = load_processed_cache(cache_path)
+    df, label_encoders, original_categorical_values = cached
+    return df, None, label_encoders, original_categorical_values
+
+
+def iter_processed_chunks(csv_path=DATA_PATH, chunksize=100_000, stats=None, keep_raw=False):
+    """
+    Stream preprocessed chunks of a CSV with bounded memory
+
+    Args:
+        csv_path (str or Path): Applications CSV in the training schema
+        chunksize (int): Rows per chunk
+        stats (dict, optional): Output of compute_ingestion_stats; computed with a first pass if omitted
+        keep_raw (bool): Whether to also yield the unprocessed chunk
+
+    Yields:
+        pandas.DataFrame or tuple: processed chunk, or (processed_chunk, raw_chunk) when keep_raw is set
+    """
+    if stats is None:
+        stats = compute_ingestion_stats(csv_path, chunksize)
+    label_encoders = build_label_encoders(stats["categories"])
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=RAW_DTYPES):
+        raw_chunk = chunk.copy() if keep_raw else None
+        processed = preprocess_data(chunk, stats["fill_values"], label_encoders)
+        yield (processed, raw_chunk) if keep_raw else processed
+
+
+@instrumented("create_input_data")
 def create_input_data(applicant_data, label_encoders, feature_names):
     """
     Create encoded input data from user input for prediction
 
     Args:
         applicant_data (dict): Dictionary containing applicant information
-        label_encoders (dict): Dictionary of label encoders for categorical features
+        label_encoders (dict or CategoricalEncoder): Label encoders for categorical features
         feature_names (list): List of feature names
 
     Returns:
         numpy.ndarray: Encoded input data array
     """
-    import numpy as np
-
-    total_income = applicant_data["ApplicantIncome"] + applicant_data["CoapplicantIncome"]
-    income_to_loan_ratio = total_income / applicant_data["LoanAmount"] if applicant_data["LoanAmount"] > 0 else 0.0
-    estimated_emi = _calculate_emi(applicant_data["LoanAmount"], applicant_data["Loan_Amount_Term"])
-    emi_to_income_ratio = estimated_emi / total_income if total_income > 0 else 1.0
-
-    # Extract values from the applicant_data dictionary
-    input_data = {
-        "Gender": label_encoders["Gender"].transform([applicant_data["Gender"]])[0],
-        "Married": label_encoders["Married"].transform([applicant_data["Married"]])[0],
-        "Dependents": label_encoders["Dependents"].transform([applicant_data["Dependents"]])[0],
-        "Education": label_encoders["Education"].transform([applicant_data["Education"]])[0],
-        "Self_Employed": label_encoders["Self_Employed"].transform([applicant_data["Self_Employed"]])[0],
-        "ApplicantIncome": applicant_data["ApplicantIncome"],
-        "CoapplicantIncome": applicant_data["CoapplicantIncome"],
-        "LoanAmount": applicant_data["LoanAmount"],
-        "Loan_Amount_Term": applicant_data["Loan_Amount_Term"],
-        "Credit_History": applicant_data["Credit_History"],
-        "Property_Area": label_encoders["Property_Area"].transform([applicant_data["Property_Area"]])[0],
-        "TotalIncome": total_income,
-        "IncomeToLoanRatio": income_to_loan_ratio,
-        "EMI": estimated_emi,
-        "EMIToIncomeRatio": emi_to_income_ratio,
-    }
+    if not isinstance(label_encoders, CategoricalEncoder):
+        label_encoders = CategoricalEncoder.from_label_encoders(label_encoders)
 
-    ordered_values = [input_data[col] for col in feature_names]
-    return np.array(ordered_values, dtype=float).reshape(1, -1)
\ No newline at end of file
+    # Encode as a one-row batch so single and bulk scoring share the same code path.
+    columns = {col: [value] for col, value in applicant_data.items()}
+    return build_feature_matrix(columns, label_encoders, feature_names)
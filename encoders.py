@@ -0,0 +1,115 @@
+import numpy as np
+
+
+class CategoricalEncoder:
+    """
+    Lookup-table replacement for a set of fitted LabelEncoders
+
+    Codes match LabelEncoder.transform exactly (the position of the value in the
+    sorted classes_), but encoding is a dict lookup per value with no sklearn
+    input validation. Only NumPy is needed, so the encoder can be pickled into a
+    model artifact and used by lightweight scoring processes.
+    """
+
+    def __init__(self, classes):
+        """
+        Args:
+            classes (dict): Column name to sorted category values (LabelEncoder.classes_)
+        """
+        self.classes = {col: np.asarray(values) for col, values in classes.items()}
+        self.tables = {
+            col: {value: code for code, value in enumerate(values.tolist())}
+            for col, values in self.classes.items()
+        }
+
+    @classmethod
+    def from_label_encoders(cls, label_encoders):
+        """Build an encoder from a dict of fitted LabelEncoders."""
+        return cls({col: encoder.classes_ for col, encoder in label_encoders.items()})
+
+    def __contains__(self, col):
+        return col in self.tables
+
+    def __getstate__(self):
+        # The lookup tables are derived from the classes, so only the classes are pickled.
+        return {"classes": self.classes}
+
+    def __setstate__(self, state):
+        self.__init__(state["classes"])
+
+    def _unseen_error(self, col, values):
+        unseen = sorted({str(value) for value in values})
+        return ValueError(
+            f"Unseen {col} value(s) {unseen[:5]}; expected one of {self.classes[col].tolist()}"
+        )
+
+    def encode(self, col, value):
+        """
+        Encode a single categorical value
+
+        Args:
+            col (str): Categorical column name
+            value: Category value, e.g. "Male"
+
+        Returns:
+            int: Label code for the value
+        """
+        try:
+            return self.tables[col][value]
+        except KeyError:
+            raise self._unseen_error(col, [value]) from None
+        except TypeError:
+            # Unhashable values can never be a known category.
+            raise self._unseen_error(col, [value]) from None
+
+    def encode_row(self, applicant_data):
+        """
+        Encode every categorical field of one applicant
+
+        Args:
+            applicant_data (dict): Applicant fields keyed by column name
+
+        Returns:
+            dict: Column name to label code for each categorical column
+        """
+        return {col: self.encode(col, applicant_data[col]) for col in self.tables}
+
+    def encode_column(self, col, values):
+        """
+        Encode a whole column of categorical values
+
+        Args:
+            col (str): Categorical column name
+            values (array-like): Category values
+
+        Returns:
+            numpy.ndarray: Integer label codes aligned with values
+        """
+        classes = self.classes[col]
+        values = np.asarray(values)
+        if values.dtype.kind == "U" and classes.dtype.kind == "U":
+            # Fixed-width strings can use a C-level binary search over the sorted classes.
+            codes = np.searchsorted(classes, values)
+            codes[codes == len(classes)] = 0
+            unknown = classes[codes] != values
+        else:
+            table = self.tables[col]
+            codes = np.fromiter((table.get(value, -1) for value in values.ravel().tolist()),
+                                dtype=np.int64, count=values.size).reshape(values.shape)
+            unknown = codes < 0
+        if unknown.any():
+            raise self._unseen_error(col, values[unknown])
+        return codes.astype(np.int64, copy=False)
+
+    def decode(self, col, codes):
+        """
+        Map label codes back to the original category values
+
+        Args:
+            col (str): Categorical column name
+            codes (array-like): Integer label codes
+
+        Returns:
+            numpy.ndarray: Category values aligned with codes
+        """
+        return self.classes[col][np.asarray(codes, dtype=np.int64)]
@@ -0,0 +1,211 @@
+"""
+Vectorized per-applicant explanations
+
+For the linear SVM on standardized inputs the decision value splits exactly
+into per-feature contributions, coef_j * (x_j - mean_j) / scale_j. This module
+computes those contributions for N applicants at once, picks each applicant's
+top-k strengths and risks with argpartition, and turns the picks into display
+values or reason codes. Everything is NumPy-only, so batch scoring and the
+scoring service can use it as well as the app.
+
+Drivers come back as (N, k) arrays of feature positions, padded with -1 where
+an applicant has fewer than k strengths (or risks).
+"""
+import numpy as np
+
+
+# User-friendly labels for report-style display
+FEATURE_DISPLAY_NAMES = {
+    "Credit_History": "Credit History",
+    "LoanAmount": "Requested Loan Amount",
+    "EMI": "Estimated EMI",
+    "TotalIncome": "Total Monthly Income",
+    "EMIToIncomeRatio": "EMI to Income Ratio",
+    "Self_Employed": "Employment Type",
+    "CoapplicantIncome": "Co-applicant Income",
+    "Dependents": "Number of Dependents",
+    "ApplicantIncome": "Applicant Income",
+    "Loan_Amount_Term": "Loan Tenure",
+    "Property_Area": "Property Location",
+    "Education": "Education",
+    "Married": "Marital Status",
+    "Gender": "Gender"
+}
+MONEY_FEATURES = {"ApplicantIncome", "CoapplicantIncome", "LoanAmount", "EMI", "TotalIncome"}
+# An EMI of at most 30% of monthly income reads as a strength, otherwise as a risk.
+EMI_STRENGTH_MAX_SHARE = 0.30
+# Total income of at least 3x the EMI reads as a strength, otherwise as a risk.
+INCOME_STRENGTH_MIN_MULTIPLE = 3.0
+TOP_K = 3
+
+
+def feature_contributions(input_data, coef, mean=None, scale=None):
+    """
+    Signed contribution of every feature to each applicant's decision value
+
+    Args:
+        input_data (numpy.ndarray): (N, F) input; already standardized unless mean and scale are given
+        coef (numpy.ndarray): Linear SVM weights on the standardized features (feature_importance)
+        mean (numpy.ndarray, optional): Scaler means, to standardize raw encoded input
+        scale (numpy.ndarray, optional): Scaler scales, to standardize raw encoded input
+
+    Returns:
+        numpy.ndarray: (N, F) contributions
+    """
+    input_data = np.atleast_2d(np.asarray(input_data, dtype=float))
+    if mean is not None:
+        input_data = (input_data - mean) / scale
+    return input_data * np.asarray(coef, dtype=float).ravel()
+
+
+def apply_direction_overrides(contributions, feature_names, total_income, monthly_emi):
+    """
+    Give the EMI and TotalIncome contributions a business-rule sign
+
+    The model's sign for these two features depends on where the applicant sits
+    relative to the training mean, which reads oddly in a report. Their size is
+    kept, but the sign follows the affordability rules instead.
+
+    Args:
+        contributions (numpy.ndarray): (N, F) contributions from feature_contributions
+        feature_names (list): Feature order of the contributions
+        total_income (array-like): Monthly applicant plus co-applicant income per applicant
+        monthly_emi (array-like): Monthly EMI per applicant
+
+    Returns:
+        numpy.ndarray: Adjusted copy of the contributions
+    """
+    total_income = np.asarray(total_income, dtype=float)
+    monthly_emi = np.asarray(monthly_emi, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        is_strength = {
+            "EMI": (total_income > 0) & (monthly_emi / total_income <= EMI_STRENGTH_MAX_SHARE),
+            "TotalIncome": (monthly_emi > 0) & (total_income / monthly_emi >= INCOME_STRENGTH_MIN_MULTIPLE),
+        }
+
+    adjusted = np.array(contributions, dtype=float, copy=True)
+    feature_names = list(feature_names)
+    for feature_name, strength in is_strength.items():
+        if feature_name in feature_names:
+            position = feature_names.index(feature_name)
+            magnitude = np.abs(adjusted[:, position])
+            adjusted[:, position] = np.where(strength, magnitude, -magnitude)
+    return adjusted
+
+
+def _top_k(scores, k):
+    """Positions of the k largest finite scores per row, largest first, padded with -1."""
+    n_rows, n_features = scores.shape
+    k = min(k, n_features)
+    if k == 0:
+        return np.full((n_rows, 0), -1, dtype=np.intp)
+    # argpartition finds each row's k best in O(F); only those k are then sorted.
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1, kind="stable")
+    top = np.take_along_axis(candidates, order, axis=1)
+    top[~np.isfinite(np.take_along_axis(scores, top, axis=1))] = -1
+    return top
+
+
+def top_drivers(contributions, k=TOP_K):
+    """
+    Each applicant's strongest supporting and opposing features
+
+    Args:
+        contributions (numpy.ndarray): (N, F) contributions
+        k (int): Drivers to keep per side
+
+    Returns:
+        tuple: (strengths, risks), each an (N, k) array of feature positions ordered
+        by absolute contribution and padded with -1
+    """
+    contributions = np.atleast_2d(contributions)
+    strengths = _top_k(np.where(contributions > 0, contributions, -np.inf), k)
+    risks = _top_k(np.where(contributions < 0, -contributions, -np.inf), k)
+    return strengths, risks
+
+
+def reason_codes(drivers, feature_names):
+    """
+    Feature names for driver positions, with "" for padding
+
+    Args:
+        drivers (numpy.ndarray): (N, k) positions from top_drivers
+        feature_names (list): Feature order of the contributions
+
+    Returns:
+        numpy.ndarray: (N, k) string array
+    """
+    names = np.asarray(list(feature_names) + [""])
+    # Padding (-1) indexes the trailing empty name.
+    return names[drivers]
+
+
+def _format_values(feature_name, values, encoder):
+    if encoder is not None and feature_name in encoder:
+        return encoder.decode(feature_name, values).astype(object)
+    if feature_name == "Credit_History":
+        return np.where(values == 1.0, "Good", "Poor/Unknown").astype(object)
+    if feature_name in MONEY_FEATURES:
+        return np.array([f"Rs {value:,.2f}" for value in values.tolist()], dtype=object)
+    if feature_name == "Loan_Amount_Term":
+        return np.array([f"{int(value)} months" for value in values.tolist()], dtype=object)
+    if feature_name == "Dependents":
+        return np.array([str(int(value)) if value.is_integer() else str(value) for value in values.tolist()],
+                        dtype=object)
+    return np.array([str(value) for value in values.tolist()], dtype=object)
+
+
+def display_values(input_data, drivers, feature_names, encoder=None):
+    """
+    Human-readable input values for driver positions
+
+    Categorical codes are decoded back to their category, money is shown in
+    rupees and the loan term in months. Values are formatted one feature column
+    at a time, and only for the selected drivers.
+
+    Args:
+        input_data (numpy.ndarray): (N, F) encoded, unscaled input
+        drivers (numpy.ndarray): (N, k) positions from top_drivers
+        feature_names (list): Feature order of the input
+        encoder (CategoricalEncoder, optional): Encoder for the categorical features
+
+    Returns:
+        numpy.ndarray: (N, k) object array of display strings, None for padding
+    """
+    input_data = np.atleast_2d(input_data)
+    values = np.take_along_axis(input_data, np.maximum(drivers, 0), axis=1)
+    shown = np.full(drivers.shape, None, dtype=object)
+    for position in np.unique(drivers[drivers >= 0]).tolist():
+        selected = drivers == position
+        shown[selected] = _format_values(feature_names[position], values[selected], encoder)
+    return shown
+
+
+def display_name(feature_name):
+    """Report label for a feature."""
+    return FEATURE_DISPLAY_NAMES.get(feature_name, feature_name.replace("_", " "))
+
+
+def explain_applicants(input_data, coef, mean, scale, feature_names, total_income=None, monthly_emi=None, k=TOP_K):
+    """
+    Contributions and top-k drivers for a batch of applicants in one pass
+
+    Args:
+        input_data (numpy.ndarray): (N, F) encoded, unscaled input
+        coef (numpy.ndarray): Linear SVM weights on the standardized features
+        mean (numpy.ndarray): Scaler means
+        scale (numpy.ndarray): Scaler scales
+        feature_names (list): Feature order of the input
+        total_income (array-like, optional): Monthly income per applicant, for the direction overrides
+        monthly_emi (array-like, optional): Monthly EMI per applicant, for the direction overrides
+        k (int): Drivers to keep per side
+
+    Returns:
+        dict: contributions (N, F), strengths (N, k) and risks (N, k)
+    """
+    contributions = feature_contributions(input_data, coef, mean, scale)
+    if total_income is not None and monthly_emi is not None:
+        contributions = apply_direction_overrides(contributions, feature_names, total_income, monthly_emi)
+    strengths, risks = top_drivers(contributions, k)
+    return {"contributions": contributions, "strengths": strengths, "risks": risks}
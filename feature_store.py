@@ -0,0 +1,187 @@
+"""
+Shared, memory-mapped training features
+
+The encoded feature matrix and its train/test split live in one compact float32
+buffer on disk. Worker processes map it read-only, so the operating system keeps
+a single copy of the pages however many workers read it.
+
+Layout of matrix.npy, shape (n_rows, n_features + 1):
+
+    rows    [0, n_train)         training rows, in train_model's split order
+            [n_train, n_rows)    test rows, in train_model's split order
+    columns [0, n_features)      features in train_model's column order
+            n_features           Loan_Status (0/1)
+
+float32 represents the integer-valued columns exactly; the engineered ratios
+keep about seven significant digits. The values are those of the compact
+processed frame (data_utils.compact_dtypes).
+
+train_model builds (or maps) the store for its frame and fits the scaler and
+the hold-out split from it, and the cv_scheduler workers map the same file for
+their folds, so a training run holds one shared copy of the features.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+FEATURE_STORE_DIR = Path("saved_models/features")
+MAX_FEATURE_STORES = 2
+TARGET_COLUMN = "Loan_Status"
+
+
+class FeatureStore:
+    """Read-only views of the train/test split over one memory-mapped float32 matrix."""
+
+    def __init__(self, matrix, feature_names, n_train, path=None):
+        self.matrix = matrix
+        self.feature_names = list(feature_names)
+        self.n_train = int(n_train)
+        # Store directory, so other processes can map the same matrix with load_feature_store.
+        self.path = None if path is None else Path(path)
+
+    @property
+    def X(self):
+        return self.matrix[:, :-1]
+
+    @property
+    def y(self):
+        return self.matrix[:, -1]
+
+    @property
+    def X_train(self):
+        return self.matrix[:self.n_train, :-1]
+
+    @property
+    def y_train(self):
+        return self.matrix[:self.n_train, -1]
+
+    @property
+    def X_test(self):
+        return self.matrix[self.n_train:, :-1]
+
+    @property
+    def y_test(self):
+        return self.matrix[self.n_train:, -1]
+
+    def __len__(self):
+        return len(self.matrix)
+
+
+def feature_store_path_for(df, store_dir=FEATURE_STORE_DIR):
+    """Store directory for a preprocessed frame, keyed by its values, columns and the split configuration."""
+    from model import TRAINING_CONFIG
+
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(json.dumps({
+        "columns": df.columns.tolist(),
+        "test_size": TRAINING_CONFIG["test_size"],
+        "random_state": TRAINING_CONFIG["random_state"],
+    }, sort_keys=True).encode())
+    return Path(store_dir) / f"features-{digest.hexdigest()[:16]}"
+
+
+def build_feature_store(df, store_path):
+    """
+    Write the float32 feature matrix for a preprocessed frame
+
+    Rows are written chunk by chunk straight into the memory-mapped output, so
+    building never holds a second full copy of the data. The directory is
+    assembled under a temporary name and renamed into place.
+
+    Args:
+        df (pandas.DataFrame): Preprocessed dataframe with features and Loan_Status
+        store_path (str or Path): Destination directory
+    """
+    from model import train_test_indices
+
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    feature_names = df.drop(TARGET_COLUMN, axis=1).columns.tolist()
+    train_positions, test_positions = train_test_indices(df[TARGET_COLUMN])
+    row_order = np.concatenate([train_positions, test_positions])
+    # Per-column views: the frame is never consolidated into a single copy.
+    column_values = [df[col].to_numpy() for col in feature_names + [TARGET_COLUMN]]
+
+    tmp_dir = tempfile.mkdtemp(dir=store_path.parent, prefix=f".{store_path.name}.")
+    try:
+        matrix = np.lib.format.open_memmap(
+            Path(tmp_dir) / "matrix.npy", mode="w+", dtype=np.float32, shape=(len(df), len(column_values))
+        )
+        for start in range(0, len(row_order), 100_000):
+            rows = row_order[start:start + 100_000]
+            for position, values in enumerate(column_values):
+                matrix[start:start + len(rows), position] = values[rows]
+        matrix.flush()
+        del matrix
+        with open(Path(tmp_dir) / "manifest.json", "w") as manifest_file:
+            json.dump({"feature_names": feature_names, "n_train": len(train_positions)}, manifest_file)
+        os.replace(tmp_dir, store_path)
+    except OSError:
+        # Another worker published the same store first; theirs is identical.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not (store_path / "manifest.json").exists():
+            raise
+
+
+def load_feature_store(store_path):
+    """
+    Map a feature store read-only
+
+    Args:
+        store_path (str or Path): Directory written by build_feature_store
+
+    Returns:
+        FeatureStore: Views over the shared matrix, or None if the store is missing
+    """
+    store_path = Path(store_path)
+    try:
+        with open(store_path / "manifest.json") as manifest_file:
+            manifest = json.load(manifest_file)
+    except FileNotFoundError:
+        return None
+    matrix = np.load(store_path / "matrix.npy", mmap_mode="r")
+    # Mark the store as recently used for eviction.
+    os.utime(store_path / "manifest.json")
+    return FeatureStore(matrix, manifest["feature_names"], manifest["n_train"], store_path)
+
+
+def evict_feature_stores(store_dir=FEATURE_STORE_DIR, keep=MAX_FEATURE_STORES):
+    """Delete all but the `keep` most recently used feature stores."""
+    def last_used(store_path):
+        try:
+            return (store_path / "manifest.json").stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    stores = sorted((path for path in Path(store_dir).glob("features-*") if path.is_dir()), key=last_used,
+                    reverse=True)
+    for stale_store in stores[keep:]:
+        shutil.rmtree(stale_store, ignore_errors=True)
+
+
+def get_or_build_feature_store(df, store_dir=FEATURE_STORE_DIR):
+    """
+    Map the feature store for a preprocessed frame, building it on first use
+
+    Args:
+        df (pandas.DataFrame): Preprocessed dataframe with features and Loan_Status
+        store_dir (str or Path): Directory holding feature stores
+
+    Returns:
+        FeatureStore: Read-only views of the shared matrix
+    """
+    store_path = feature_store_path_for(df, store_dir)
+    store = load_feature_store(store_path)
+    if store is None:
+        build_feature_store(df, store_path)
+        evict_feature_stores(store_dir)
+        store = load_feature_store(store_path)
+    return store
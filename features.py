@@ -0,0 +1,76 @@
+import numpy as np
+
+from financial_utils import ANNUITY_TABLE
+
+
+# Model inputs are float32. Label codes, Credit_History and the whole-rupee amounts are exact
+# in it, and the engineered ratios keep about seven significant digits.
+FEATURE_DTYPE = np.float32
+
+def _calculate_emi(loan_amount, tenure_months, annual_interest_rate=8.5):
+    """Estimate monthly EMI using a fixed reference interest rate (scalars or arrays)."""
+    tenure_months = np.maximum(np.asarray(tenure_months, dtype=float), 1)
+    return np.asarray(loan_amount, dtype=float) * ANNUITY_TABLE.lookup(annual_interest_rate, tenure_months)
+
+
+def compute_engineered_features(applicant_income, coapplicant_income, loan_amount, loan_term,
+                                annual_interest_rate=8.5):
+    """
+    Compute income and EMI features for scalars or whole columns at once
+
+    Args:
+        applicant_income (array-like): Monthly applicant income
+        coapplicant_income (array-like): Monthly co-applicant income
+        loan_amount (array-like): Loan amount in rupees
+        loan_term (array-like): Loan term in months
+        annual_interest_rate (float): Reference annual interest rate in percentage
+
+    Returns:
+        dict: TotalIncome, IncomeToLoanRatio, EMI and EMIToIncomeRatio arrays
+    """
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    total_income = np.asarray(applicant_income, dtype=float) + np.asarray(coapplicant_income, dtype=float)
+    emi = _calculate_emi(loan_amount, loan_term, annual_interest_rate)
+
+    # Guard the denominators so zero loans and zero incomes fall back to neutral ratios.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        income_to_loan_ratio = np.where(loan_amount > 0, total_income / loan_amount, 0.0)
+        emi_to_income_ratio = np.where(total_income > 0, emi / total_income, 1.0)
+
+    return {
+        "TotalIncome": total_income,
+        "IncomeToLoanRatio": income_to_loan_ratio,
+        "EMI": emi,
+        "EMIToIncomeRatio": emi_to_income_ratio,
+    }
+
+
+def build_feature_matrix(columns, encoder, feature_names, dtype=FEATURE_DTYPE):
+    """
+    Build the encoded model input for a batch of applicants
+
+    Args:
+        columns (dict): Column name to array-like of raw applicant values (LoanAmount in rupees)
+        encoder (CategoricalEncoder): Encoder for the categorical columns
+        feature_names (list): Feature order expected by the model
+        dtype: Matrix dtype; float64 reproduces the full-precision features
+
+    Returns:
+        numpy.ndarray: (N, F) array of encoded features
+    """
+    features = compute_engineered_features(
+        columns["ApplicantIncome"],
+        columns["CoapplicantIncome"],
+        columns["LoanAmount"],
+        columns["Loan_Amount_Term"],
+    )
+
+    input_matrix = np.empty((len(features["EMI"]), len(feature_names)), dtype=dtype)
+    for position, col in enumerate(feature_names):
+        if col in features:
+            input_matrix[:, position] = features[col]
+        elif col in encoder:
+            input_matrix[:, position] = encoder.encode_column(col, columns[col])
+        else:
+            input_matrix[:, position] = np.asarray(columns[col], dtype=float)
+    return input_matrix
@@ -1,3 +1,117 @@
+import numpy as np
+
+from instrumentation import instrumented
+
+
+# Policy thresholds shared by the scalar and vectorized checks
+MAX_EMI_TO_INCOME = 0.5  # Rule of thumb: EMI should not exceed 50% of income
+MAX_LOAN_TO_INCOME_RATIO = 0.40
+MAX_DEBT_TO_INCOME_RATIO = 0.43
+
+# Grid served by the annuity-factor table: the app's interest-rate slider and the
+# loan terms that occur in the training data.
+RATE_GRID = (5.0, 18.0, 0.1)
+TERM_GRID = (12, 36, 60, 84, 120, 180, 240, 300, 360, 480)
+
+
+def _emi_factor(interest_rate, tenure_months):
+    """Exact EMI per unit of principal: r(1+r)^n / ((1+r)^n - 1), or 1/n without interest."""
+    monthly_rate = (np.asarray(interest_rate, dtype=float) / 100) / 12
+    tenure_months = np.asarray(tenure_months, dtype=float)
+    growth = (1 + monthly_rate) ** tenure_months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(monthly_rate == 0, 1 / tenure_months, monthly_rate * growth / (growth - 1))
+
+
+class AnnuityTable:
+    """
+    Precomputed annuity factors over a (rate bucket, term) grid
+
+    EMI = principal * factor, and affordable principal = EMI budget / factor, so
+    with the table built once an EMI on the grid is a lookup and a multiply.
+    Rates or terms off the grid fall back to the exact formula, which gives the
+    same results to within floating-point rounding.
+    """
+
+    def __init__(self, rate_grid=RATE_GRID, terms=TERM_GRID):
+        rate_start, rate_stop, rate_step = rate_grid
+        bucket_count = int(round((rate_stop - rate_start) / rate_step)) + 1
+        self.rate_start = rate_start
+        self.rate_step = rate_step
+        self.rates = np.round(rate_start + rate_step * np.arange(bucket_count), 10)
+        self.terms = np.asarray(sorted(terms), dtype=float)
+        self.factors = _emi_factor(self.rates[:, None], self.terms[None, :])
+
+        # Exact-key index for scalar calls and a dense month -> column map (-1 off the grid) for arrays
+        self._factor_index = {
+            (rate, term): factor
+            for rate, row in zip(self.rates.tolist(), self.factors.tolist())
+            for term, factor in zip(self.terms.tolist(), row)
+        }
+        self._term_slots = np.full(int(self.terms[-1]) + 1, -1, dtype=np.intp)
+        self._term_slots[self.terms.astype(np.intp)] = np.arange(len(self.terms))
+
+    def _rate_bucket(self, interest_rate):
+        """Grid row for a single rate, or None when the rate is off the grid."""
+        if not self.rates[0] - 1e-9 <= interest_rate <= self.rates[-1] + 1e-9:
+            return None
+        bucket = round((interest_rate - self.rate_start) / self.rate_step)
+        if 0 <= bucket < len(self.rates) and abs(self.rates[bucket] - interest_rate) <= 1e-9:
+            return bucket
+        return None
+
+    def factor(self, interest_rate, tenure_months):
+        """EMI factor for a single rate and term."""
+        factor = self._factor_index.get((interest_rate, tenure_months))
+        if factor is not None:
+            return factor
+        # Slider values can carry float noise (8.499999...), so retry on the nearest bucket.
+        bucket = self._rate_bucket(interest_rate)
+        if bucket is not None:
+            factor = self._factor_index.get((self.rates[bucket], tenure_months))
+            if factor is not None:
+                return factor
+
+        monthly_rate = (interest_rate / 100) / 12
+        if monthly_rate == 0:
+            return 1 / tenure_months
+        growth = (1 + monthly_rate) ** tenure_months
+        return monthly_rate * growth / (growth - 1)
+
+    def lookup(self, interest_rate, tenure_months):
+        """
+        EMI factors for broadcastable arrays of rates and terms
+
+        Args:
+            interest_rate (array-like): Annual interest rates in percentage
+            tenure_months (array-like): Loan tenures in months
+
+        Returns:
+            numpy.ndarray: Factors with the broadcast shape of the inputs
+        """
+        interest_rate, tenure_months = np.broadcast_arrays(
+            np.asarray(interest_rate, dtype=float), np.asarray(tenure_months, dtype=float)
+        )
+        # The table pays off for one rate across many loans (a lookup along one row). With a
+        # rate per loan, a single vectorized pow beats gathering from the 2-D grid.
+        single_rate = interest_rate.size > 0 and interest_rate.strides == (0,) * interest_rate.ndim
+        bucket = self._rate_bucket(float(interest_rate.flat[0])) if single_rate else None
+        if bucket is None:
+            return _emi_factor(interest_rate, tenure_months)
+
+        with np.errstate(invalid="ignore"):
+            term_slot = np.take(self._term_slots, tenure_months.astype(np.intp), mode="clip")
+        factors = np.array(np.take(self.factors[bucket], term_slot, mode="clip"))
+        off_grid = (term_slot < 0) | (self.terms[term_slot] != tenure_months)
+        if off_grid.any():
+            factors[off_grid] = _emi_factor(interest_rate[off_grid], tenure_months[off_grid])
+        return factors
+
+
+# Built once at import and shared by every EMI and affordability calculation
+ANNUITY_TABLE = AnnuityTable()
+
+
 def calculate_emi(loan_amount, interest_rate, tenure_months):
     """
     Calculate monthly EMI (Equated Monthly Installment)
@@ -10,16 +124,26 @@ def calculate_emi(loan_amount, interest_rate, tenure_months):
     Returns:
         float: Monthly EMI amount
     """
-    # Convert interest rate from % to decimal and make it monthly
-    monthly_interest_rate = (interest_rate / 100) / 12
+    # EMI = P * r * (1+r)^n / ((1+r)^n - 1), with the rate/term factor read from the shared table
+    return loan_amount * ANNUITY_TABLE.factor(interest_rate, tenure_months)
+
 
-    # Calculate EMI using the formula: P * r * (1+r)^n / ((1+r)^n - 1)
-    emi = loan_amount * monthly_interest_rate * (1 + monthly_interest_rate) ** tenure_months / (
-            ((1 + monthly_interest_rate) ** tenure_months) - 1)
+def calculate_emi_batch(loan_amount, interest_rate, tenure_months):
+    """
+    Calculate monthly EMIs for arrays of loans with NumPy broadcasting
+
+    Args:
+        loan_amount (array-like): Loan amounts in currency units
+        interest_rate (array-like): Annual interest rates in percentage
+        tenure_months (array-like): Loan tenures in months
 
-    return emi
+    Returns:
+        numpy.ndarray: Monthly EMI amounts (0% loans repay principal evenly)
+    """
+    return np.asarray(loan_amount, dtype=float) * ANNUITY_TABLE.lookup(interest_rate, tenure_months)
 
 
+@instrumented("financial_checks")
 def perform_financial_checks(loan_amount, loan_term, applicant_income, coapplicant_income, existing_debt=0,
                              interest_rate=8.5):
     """
@@ -50,11 +174,11 @@ def perform_financial_checks(loan_amount, loan_term, applicant_income, coapplica
     debt_to_income_ratio =(total_monthly_debt / monthly_income)  if monthly_income > 0 else float('inf')
 
     # Check if the applicant can afford the monthly EMI
-    affordable = monthly_emi <= (monthly_income * 0.5)  # Rule of thumb: EMI should not exceed 50% of income
+    affordable = monthly_emi <= (monthly_income * MAX_EMI_TO_INCOME)
 
     # Check if ratios are within acceptable limits
-    loan_to_income_ok = loan_to_income_ratio <= 0.40
-    debt_to_income_ok = debt_to_income_ratio <= 0.43
+    loan_to_income_ok = loan_to_income_ratio <= MAX_LOAN_TO_INCOME_RATIO
+    debt_to_income_ok = debt_to_income_ratio <= MAX_DEBT_TO_INCOME_RATIO
 
     return {
         "monthly_emi": monthly_emi,
@@ -67,6 +191,50 @@ def perform_financial_checks(loan_amount, loan_term, applicant_income, coapplica
     }
 
 
+def perform_financial_checks_batch(loan_amount, loan_term, applicant_income, coapplicant_income, existing_debt=0,
+                                   interest_rate=8.5):
+    """
+    Perform the financial feasibility checks for a whole portfolio at once
+
+    All arguments broadcast against each other, so scalars (e.g. one interest
+    rate) can be mixed with per-loan arrays.
+
+    Args:
+        loan_amount (array-like): Loan amounts in rupees
+        loan_term (array-like): Loan terms in months
+        applicant_income (array-like): Monthly incomes of applicants
+        coapplicant_income (array-like): Monthly incomes of co-applicants
+        existing_debt (array-like): Existing monthly debt payments
+        interest_rate (array-like): Annual loan interest rates in percentage
+
+    Returns:
+        dict: Column name to array, with the same keys as perform_financial_checks
+    """
+    monthly_income = np.asarray(applicant_income, dtype=float) + np.asarray(coapplicant_income, dtype=float)
+    monthly_emi = calculate_emi_batch(loan_amount, interest_rate, loan_term)
+    total_monthly_debt = monthly_emi + np.asarray(existing_debt, dtype=float)
+
+    # Zero-income applicants get infinite ratios, as in the scalar checks
+    has_income = monthly_income > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        loan_to_income_ratio = np.where(has_income, monthly_emi / monthly_income, np.inf)
+        debt_to_income_ratio = np.where(has_income, total_monthly_debt / monthly_income, np.inf)
+
+    affordable = monthly_emi <= (monthly_income * MAX_EMI_TO_INCOME)
+    loan_to_income_ok = loan_to_income_ratio <= MAX_LOAN_TO_INCOME_RATIO
+    debt_to_income_ok = debt_to_income_ratio <= MAX_DEBT_TO_INCOME_RATIO
+
+    return {
+        "monthly_emi": monthly_emi,
+        "loan_to_income_ratio": loan_to_income_ratio,
+        "debt_to_income_ratio": debt_to_income_ratio,
+        "loan_to_income_ok": loan_to_income_ok,
+        "debt_to_income_ok": debt_to_income_ok,
+        "affordable": affordable,
+        "financially_feasible": loan_to_income_ok & debt_to_income_ok & affordable,
+    }
+
+
 def calculate_affordable_loan(monthly_income, interest_rate, tenure_months, max_emi_percent=0.3):
     """
     Calculate affordable loan amount based on income
@@ -82,10 +250,22 @@ def calculate_affordable_loan(monthly_income, interest_rate, tenure_months, max_
     """
     max_emi = monthly_income * max_emi_percent
 
-    # Monthly interest rate
-    monthly_rate = (interest_rate / 100) / 12
+    # Invert the EMI formula: principal = EMI / factor (EMI * n for interest-free loans)
+    return max_emi / ANNUITY_TABLE.factor(interest_rate, tenure_months)
+
 
-    # Calculate loan amount using EMI formula (rearranged)
-    loan_amount = max_emi * ((1 - (1 + monthly_rate) ** (-tenure_months)) / monthly_rate)
+def calculate_affordable_loan_batch(monthly_income, interest_rate, tenure_months, max_emi_percent=0.3):
+    """
+    Calculate affordable loan amounts for arrays of applicants
 
-    return loan_amount
+    Args:
+        monthly_income (array-like): Total monthly incomes
+        interest_rate (array-like): Annual interest rates in percentage
+        tenure_months (array-like): Loan tenures in months
+        max_emi_percent (array-like): Maximum share of income for the EMI
+
+    Returns:
+        numpy.ndarray: Affordable loan amounts
+    """
+    max_emi = np.asarray(monthly_income, dtype=float) * np.asarray(max_emi_percent, dtype=float)
+    return max_emi / ANNUITY_TABLE.lookup(interest_rate, tenure_months)
@@ -0,0 +1,417 @@
+"""
+Incremental model updates from newly labelled applications
+
+Folds batches of labelled decisions (in the training CSV layout) into the served
+model without retraining on the full history, and publishes each result as a
+new model version:
+
+    python incremental.py decisions-2026-10-17.csv decisions-2026-10-18.csv
+    python incremental.py decisions-2026-10-18.csv --report
+
+An update costs time proportional to the batch:
+
+- the scaler's mean and variance absorb the batch with StandardScaler.partial_fit,
+  so they stay the exact statistics of every row the model has seen;
+- the SVM weights are carried over to the new scaling without changing the
+  decision function, then SGDClassifier.partial_fit continues the same hinge-loss
+  objective on the batch, its step-size schedule resuming at the number of rows
+  already seen. As in averaged SGD, the new weights are the running average of
+  the iterates, with the current weights standing in for those of the rows
+  already seen;
+- the Platt sigmoid is refitted on a bounded window of recent decision values,
+  each taken before the model learned from that row.
+
+The updated bundle is saved next to the trained one and the trained bundle's
+.head pointer moves to it, so get_or_train_model, the app and the exported
+inference artifact serve it. Training on a changed dataset starts a new chain.
+With --report the same rows are also used for a full retrain, and the two
+models are compared on the trained bundle's hold-out split.
+"""
+import argparse
+import copy
+import hashlib
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_utils import compute_ingestion_stats, load_data_cached, load_labelled_batch
+import instrumentation
+import model as model_module
+from training_worker import TRAINING_LOCK_PATH, FileLock
+
+
+# Everything that changes an update's result belongs here so it feeds the update fingerprint.
+UPDATE_CONFIG = {
+    # Passes over each batch. One pass weighs every new row like each row seen before it.
+    "epochs": 1,
+    # SGD iterates are averaged every this many rows.
+    "average_every": 64,
+    # Most recent out-of-sample decision values the Platt sigmoid is refitted on.
+    "calibration_window": 5_000,
+    # Until the window holds this many rows the current sigmoid is kept.
+    "min_calibration_rows": 500,
+    "random_state": model_module.TRAINING_CONFIG["random_state"],
+}
+DRIFT_TOP_FEATURES = 3
+
+
+def transfer_weights(coef, intercept, old_scaler, new_scaler):
+    """
+    Re-express linear SVM weights for a new feature scaling
+
+    The returned weights give the same decision value on new_scaler-scaled
+    inputs as the originals give on old_scaler-scaled inputs.
+
+    Args:
+        coef (numpy.ndarray): (F,) weights for old_scaler-scaled features
+        intercept (float): Intercept for old_scaler-scaled features
+        old_scaler: Fitted StandardScaler the weights were trained with
+        new_scaler: Fitted StandardScaler to carry the weights over to
+
+    Returns:
+        tuple: (coef, intercept) for new_scaler-scaled features
+    """
+    raw_coef = coef / old_scaler.scale_
+    raw_intercept = intercept - raw_coef @ old_scaler.mean_
+    return raw_coef * new_scaler.scale_, raw_intercept + raw_coef @ new_scaler.mean_
+
+
+def _initial_state(model, batch_labels):
+    """Online state for the first update of a fully trained model."""
+    class_weight = getattr(model, "class_weight_", None)
+    if class_weight is None:
+        # Bundles trained before class weights were recorded: derive them from the batch.
+        from sklearn.utils.class_weight import compute_class_weight
+
+        class_weight = compute_class_weight(model.class_weight, classes=model.classes_, y=batch_labels)
+    return {
+        "class_weight": np.asarray(class_weight, dtype=float),
+        "calibration_decision": np.empty(0),
+        "calibration_labels": np.empty(0, dtype=model.classes_.dtype),
+        "history": [],
+    }
+
+
+def batch_digest(batch):
+    """Content hash of a preprocessed batch."""
+    return hashlib.sha256(pd.util.hash_pandas_object(batch, index=False).to_numpy().tobytes()).hexdigest()[:16]
+
+
+def update_fingerprint(parent_fingerprint, batch, config=UPDATE_CONFIG):
+    """
+    Model version of a parent bundle updated with one batch
+
+    Args:
+        parent_fingerprint (str): Fingerprint of the bundle the update starts from
+        batch (pandas.DataFrame): Preprocessed labelled batch
+        config (dict): Update settings
+
+    Returns:
+        str: Short hex digest, used like compute_model_fingerprint's
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "parent": parent_fingerprint,
+        "batch": batch_digest(batch),
+        "update_config": config,
+    }, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+@instrumentation.instrumented("incremental_update")
+def update_model(model_bundle, batch, config=UPDATE_CONFIG):
+    """
+    Fold one labelled batch into a model bundle
+
+    Args:
+        model_bundle (tuple): Bundle from train_model or from a previous update
+        batch (pandas.DataFrame): Preprocessed labelled batch, e.g. from load_labelled_batch
+        config (dict): Update settings, see UPDATE_CONFIG
+
+    Returns:
+        tuple: (updated bundle, summary). The bundle has train_model's layout, with
+        metrics re-evaluated on the same hold-out split. The summary holds the
+        batch size, the parent model's accuracy on the batch before the update,
+        the largest standardized feature-mean shifts of the batch, whether the
+        sigmoid was refitted and the update time.
+    """
+    from sklearn.linear_model import SGDClassifier
+
+    started = time.perf_counter()
+    model, scaler, X_test, y_test = model_bundle[:4]
+    feature_names = list(model_bundle[-1])
+    X_batch = batch[feature_names].to_numpy(dtype=float)
+    y_batch = batch["Loan_Status"].to_numpy()
+    state = getattr(model, "online_state_", None) or _initial_state(model, y_batch)
+
+    # The parent has not seen these rows, so its decision values are out of sample, like the
+    # out-of-fold values the sgd engine calibrates on.
+    decision_before = model.decision_function(scaler.transform(X_batch))
+    batch_accuracy_before = float(np.mean(model.classes_[(decision_before > 0).astype(int)] == y_batch))
+    mean_shift = (X_batch.mean(axis=0) - scaler.mean_) / scaler.scale_
+
+    rows_before = int(np.max(scaler.n_samples_seen_))
+    new_scaler = copy.deepcopy(scaler).partial_fit(X_batch)
+    coef, intercept = transfer_weights(model.coef_[0], model.intercept_[0], scaler, new_scaler)
+
+    # alpha = 1 / (C * n) makes SGD's objective the SVC objective over every row seen so far.
+    # Seeding coef_/intercept_/t_ makes partial_fit continue from the current solution with the
+    # step size it would have reached after rows_before samples, instead of restarting.
+    sgd = SGDClassifier(loss="hinge", alpha=1.0 / (model.C * (rows_before + len(batch))),
+                        class_weight=dict(zip(model.classes_.tolist(), state["class_weight"])),
+                        shuffle=False, random_state=config["random_state"])
+    sgd.coef_ = coef.reshape(1, -1)
+    sgd.intercept_ = np.array([intercept])
+    sgd.t_ = float(rows_before)
+    X_batch_scaled = new_scaler.transform(X_batch)
+    order = np.random.default_rng(config["random_state"]).permutation(len(batch))
+    coef_sum = coef * rows_before
+    intercept_sum = intercept * rows_before
+    for _ in range(config["epochs"]):
+        for start in range(0, len(batch), config["average_every"]):
+            rows = order[start:start + config["average_every"]]
+            sgd.partial_fit(X_batch_scaled[rows], y_batch[rows], classes=model.classes_)
+            coef_sum = coef_sum + sgd.coef_[0] * len(rows)
+            intercept_sum = intercept_sum + sgd.intercept_[0] * len(rows)
+    averaged_rows = rows_before + config["epochs"] * len(batch)
+    coef, intercept = coef_sum / averaged_rows, intercept_sum / averaged_rows
+
+    window = config["calibration_window"]
+    calibration_decision = np.concatenate([state["calibration_decision"], decision_before])[-window:]
+    calibration_labels = np.concatenate([state["calibration_labels"], y_batch])[-window:]
+    recalibrated = (len(calibration_labels) >= config["min_calibration_rows"]
+                    and len(np.unique(calibration_labels)) == len(model.classes_))
+    if recalibrated:
+        prob_a, prob_b = model_module.fit_platt_sigmoid(calibration_decision, calibration_labels)
+    else:
+        prob_a, prob_b = model.probA_[0], model.probB_[0]
+
+    seconds = time.perf_counter() - started
+    history = state["history"] + [{"rows": len(batch), "batch": batch_digest(batch), "seconds": seconds}]
+    updated_model = model_module.CalibratedLinearSVM(
+        coef, intercept, model.classes_, prob_a, prob_b, C=model.C, class_weight=model.class_weight,
+        class_weight_values=state["class_weight"],
+        online_state={
+            "class_weight": state["class_weight"],
+            "calibration_decision": calibration_decision,
+            "calibration_labels": calibration_labels,
+            "history": history,
+        },
+    )
+
+    # The hold-out split is stored scaled, so map it back through the parent scaler first.
+    X_test_scaled = new_scaler.transform(scaler.inverse_transform(X_test))
+    y_pred, accuracy, precision, recall, f1, conf_matrix = model_module.evaluate_model(updated_model, X_test_scaled,
+                                                                                       y_test)
+    updated_bundle = (
+        updated_model,
+        new_scaler,
+        X_test_scaled,
+        y_test,
+        y_pred,
+        accuracy,
+        precision,
+        recall,
+        f1,
+        conf_matrix,
+        updated_model.coef_[0].copy(),
+        feature_names,
+    )
+
+    top_shifts = np.argsort(-np.abs(mean_shift))[:DRIFT_TOP_FEATURES]
+    summary = {
+        "rows": len(batch),
+        "batch_accuracy_before": batch_accuracy_before,
+        "mean_shift": {feature_names[i]: float(mean_shift[i]) for i in top_shifts},
+        "recalibrated": recalibrated,
+        "seconds": seconds,
+    }
+    return updated_bundle, summary
+
+
+def publish_update(model_bundle, fingerprint, root_fingerprint, label_encoders,
+                   artifact_dir=model_module.MODEL_ARTIFACT_DIR):
+    """
+    Save an updated bundle as a new model version and make it the served one
+
+    Args:
+        model_bundle (tuple): Bundle from update_model
+        fingerprint (str): Its fingerprint, from update_fingerprint
+        root_fingerprint (str): Fingerprint of the trained bundle the chain of updates started from
+        label_encoders (dict): Encoders for the exported inference artifact
+        artifact_dir (str or Path): Directory holding the model bundles
+
+    Returns:
+        Path: The saved bundle
+    """
+    artifact_path = model_module.artifact_path_for(fingerprint, artifact_dir)
+    model_module.save_model_artifact(model_bundle, artifact_path)
+    model_module.export_inference_artifact(model_bundle[0], model_bundle[1], model_bundle[-1], label_encoders,
+                                           model_module.inference_artifact_path(artifact_dir))
+    # Move the pointer last, so readers only ever see a complete bundle.
+    model_module.publish_update_head(root_fingerprint, fingerprint, artifact_dir)
+    model_module.evict_model_artifacts(artifact_dir)
+    return artifact_path
+
+
+def full_retrain_reference(df, batches, engine="svc"):
+    """
+    Retrain from scratch on the rows a chain of updates has seen
+
+    That is the trained bundle's training split of df plus every batch. The
+    hold-out split stays out, so both models can be scored on it.
+
+    Args:
+        df (pandas.DataFrame): Preprocessed training data the chain started from
+        batches (list): Preprocessed labelled batches, in the order they were applied
+        engine (str): Training engine of the trained bundle
+
+    Returns:
+        tuple: (model, scaler, seconds)
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    started = time.perf_counter()
+    train_positions, _ = model_module.train_test_indices(df["Loan_Status"])
+    rows = pd.concat([df.iloc[train_positions], *batches], ignore_index=True)
+    scaler = StandardScaler()
+    X_train = scaler.fit_transform(rows.drop("Loan_Status", axis=1).values)
+    model = model_module.fit_classifier(X_train, rows["Loan_Status"].to_numpy(), engine)
+    return model, scaler, time.perf_counter() - started
+
+
+def drift_report(parent_bundle, updated_bundle, reference, batches, update_seconds):
+    """
+    Compare an incrementally updated model with a full retrain on the same rows
+
+    Args:
+        parent_bundle (tuple): Bundle the updates started from
+        updated_bundle (tuple): Bundle after the updates
+        reference (tuple): (model, scaler, seconds) from full_retrain_reference
+        batches (list): Preprocessed labelled batches the updates applied
+        update_seconds (float): Total time spent in update_model
+
+    Returns:
+        dict: Hold-out and batch metrics per model, incremental-vs-retrain
+        agreement and the time each approach took
+    """
+    from sklearn.metrics import accuracy_score, f1_score
+
+    feature_names = list(updated_bundle[-1])
+    X_holdout = parent_bundle[1].inverse_transform(parent_bundle[2])
+    y_holdout = np.asarray(parent_bundle[3])
+    batch_rows = pd.concat(batches, ignore_index=True)
+    X_batches = batch_rows[feature_names].to_numpy(dtype=float)
+    y_batches = batch_rows["Loan_Status"].to_numpy()
+
+    models = {
+        "parent": parent_bundle[:2],
+        "incremental": updated_bundle[:2],
+        "full_retrain": reference[:2],
+    }
+    metrics = {}
+    holdout_outputs = {}
+    for name, (model, scaler) in models.items():
+        predictions, probabilities, _ = model_module.predict_loan_approval_batch(model, scaler, X_holdout)
+        batch_predictions = model_module.predict_loan_approval_batch(model, scaler, X_batches)[0]
+        holdout_outputs[name] = (predictions, probabilities[:, 1])
+        metrics[name] = {
+            "holdout_accuracy": accuracy_score(y_holdout, predictions),
+            "holdout_f1": f1_score(y_holdout, predictions),
+            "batch_accuracy": accuracy_score(y_batches, batch_predictions),
+        }
+
+    # Compare the weights on one scale: the reference model's standardized features.
+    def reference_scale_weights(model, scaler):
+        return model.coef_[0] / scaler.scale_ * reference[1].scale_
+
+    incremental_weights = reference_scale_weights(*models["incremental"])
+    reference_weights = reference_scale_weights(*models["full_retrain"])
+    probability_gap = np.abs(holdout_outputs["incremental"][1] - holdout_outputs["full_retrain"][1])
+    return {
+        "holdout_rows": len(y_holdout),
+        "batch_rows": len(y_batches),
+        "metrics": metrics,
+        "prediction_agreement": float(np.mean(holdout_outputs["incremental"][0] == holdout_outputs["full_retrain"][0])),
+        "mean_probability_gap": float(probability_gap.mean()),
+        "max_probability_gap": float(probability_gap.max()),
+        "weight_cosine": float(incremental_weights @ reference_weights
+                               / (np.linalg.norm(incremental_weights) * np.linalg.norm(reference_weights))),
+        "update_seconds": update_seconds,
+        "full_retrain_seconds": reference[2],
+    }
+
+
+def format_drift_report(report):
+    """Human-readable drift-vs-full-retrain report."""
+    lines = [
+        f"hold-out: {report['holdout_rows']:,} rows, new batches: {report['batch_rows']:,} rows",
+        f"{'model':<13} | {'hold-out acc':>12} | {'hold-out f1':>11} | {'batch acc':>9}",
+    ]
+    for name, metrics in report["metrics"].items():
+        lines.append(f"{name:<13} | {metrics['holdout_accuracy']:>12.4f} | {metrics['holdout_f1']:>11.4f}"
+                     f" | {metrics['batch_accuracy']:>9.4f}")
+    lines += [
+        f"incremental vs full retrain: {report['prediction_agreement']:.2%} same decisions,"
+        f" approval probability gap mean {report['mean_probability_gap']:.4f}"
+        f" / max {report['max_probability_gap']:.4f}, weight cosine {report['weight_cosine']:.4f}",
+        f"time: incremental {report['update_seconds']:.3f}s, full retrain {report['full_retrain_seconds']:.2f}s",
+    ]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fold newly labelled applications into the served model.")
+    parser.add_argument("batches", nargs="+", help="Labelled applications CSVs in the training schema, oldest first")
+    parser.add_argument("--engine", choices=model_module.TRAINING_ENGINES, default="svc",
+                        help="Engine of the trained model the updates apply to")
+    parser.add_argument("--report", action="store_true",
+                        help="Also retrain from scratch on the same rows and compare the two models")
+    args = parser.parse_args()
+
+    lock = FileLock(TRAINING_LOCK_PATH)
+    if not lock.acquire():
+        raise SystemExit("A training worker holds the lock; try again once it has finished.")
+    try:
+        df, _, label_encoders, _ = load_data_cached()
+        fill_values = compute_ingestion_stats()["fill_values"]
+        root_fingerprint = model_module.compute_model_fingerprint(df, args.engine)
+        parent_path = (model_module.latest_update_path(root_fingerprint)
+                       or model_module.artifact_path_for(root_fingerprint))
+        parent_bundle = model_module.load_model_artifact(parent_path)
+        if parent_bundle is None:
+            raise SystemExit(f"No trained model for the current data; run "
+                             f"`python training_worker.py --engine {args.engine}` first.")
+
+        model_bundle = parent_bundle
+        fingerprint = model_module.fingerprint_from_artifact_path(parent_path)
+        batches = []
+        update_seconds = 0.0
+        for batch_path in args.batches:
+            batch = load_labelled_batch(batch_path, label_encoders, fill_values)
+            model_bundle, summary = update_model(model_bundle, batch)
+            fingerprint = update_fingerprint(fingerprint, batch)
+            publish_update(model_bundle, fingerprint, root_fingerprint, label_encoders)
+            batches.append(batch)
+            update_seconds += summary["seconds"]
+            shifts = ", ".join(f"{name} {shift:+.2f}sd" for name, shift in summary["mean_shift"].items())
+            print(f"{batch_path}: {summary['rows']:,} rows in {summary['seconds'] * 1000:.1f} ms,"
+                  f" accuracy before update {summary['batch_accuracy_before']:.4f},"
+                  f" {'recalibrated' if summary['recalibrated'] else 'sigmoid kept'}; largest mean shifts: {shifts}")
+            print(f"Published model {fingerprint} (hold-out accuracy {model_bundle[5]:.4f}, f1 {model_bundle[8]:.4f})")
+    finally:
+        lock.release()
+
+    if args.report:
+        earlier_updates = (getattr(parent_bundle[0], "online_state_", None) or {}).get("history", [])
+        if earlier_updates:
+            print(f"Note: the served model already included {len(earlier_updates)} earlier batch(es); the full"
+                  f" retrain only covers the training data plus the batches given here.")
+        reference = full_retrain_reference(df, batches, args.engine)
+        print(format_drift_report(drift_report(parent_bundle, model_bundle, reference, batches, update_seconds)))
+
+
+if __name__ == "__main__":
+    main()
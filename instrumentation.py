@@ -0,0 +1,236 @@
+"""
+Opt-in timing and counters for the prediction pipeline
+
+Disabled by default. Set LOAN_APP_METRICS=1 (or call enable()) to record, per
+stage, a call count, the total time and a latency histogram, plus free-form
+counters. Snapshots export as Prometheus text or JSON:
+
+    LOAN_APP_METRICS=1 streamlit run app.py
+
+Set LOAN_APP_PROFILE_DIR=<dir> as well to dump one cProfile stats file per
+request wrapped in profile_request(); inspect them with `python -m pstats`.
+
+When disabled, stage() hands back a shared no-op context manager and
+instrumented functions call straight through after one flag check, so the
+hooks can stay in hot paths.
+"""
+import bisect
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+
+METRICS_ENV_VAR = "LOAN_APP_METRICS"
+PROFILE_DIR_ENV_VAR = "LOAN_APP_PROFILE_DIR"
+METRIC_PREFIX = "loan_app"
+# Histogram bucket upper bounds in seconds, from 50 µs to 60 s.
+BUCKET_BOUNDS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_NULL_CONTEXT = nullcontext()
+_enabled = os.environ.get(METRICS_ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+_profile_dir = os.environ.get(PROFILE_DIR_ENV_VAR) or None
+
+
+class StageStats:
+    """Call count, total seconds and a fixed-bucket latency histogram for one stage."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        # One slot per bound plus the +Inf overflow slot; cumulated only on export.
+        self.bucket_counts = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.bucket_counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+    def quantile(self, q):
+        """Upper bucket bound below which a share q of observations fall (inf if in the overflow)."""
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS + (float("inf"),), self.bucket_counts):
+            seen += count
+            if seen >= target and seen:
+                return bound
+        return 0.0
+
+
+class Registry:
+    """Thread-safe collection of stage statistics and counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.counters = {}
+
+    def observe(self, stage_name, seconds):
+        with self._lock:
+            stats = self.stages.get(stage_name)
+            if stats is None:
+                stats = self.stages[stage_name] = StageStats()
+            stats.observe(seconds)
+
+    def increment(self, counter_name, amount=1):
+        with self._lock:
+            self.counters[counter_name] = self.counters.get(counter_name, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    def to_dict(self):
+        """JSON-ready snapshot of every stage and counter."""
+        with self._lock:
+            return {
+                "stages": {
+                    name: {
+                        "count": stats.count,
+                        "total_seconds": stats.total_seconds,
+                        "mean_seconds": stats.total_seconds / stats.count if stats.count else 0.0,
+                        "max_seconds": stats.max_seconds,
+                        "p50_seconds": stats.quantile(0.5),
+                        "p99_seconds": stats.quantile(0.99),
+                        "buckets": dict(zip([str(bound) for bound in BUCKET_BOUNDS] + ["+Inf"], stats.bucket_counts)),
+                    }
+                    for name, stats in sorted(self.stages.items())
+                },
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def to_prometheus(self):
+        """Snapshot in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            if self.stages:
+                histogram = f"{METRIC_PREFIX}_stage_seconds"
+                lines += [f"# HELP {histogram} Time spent per pipeline stage.", f"# TYPE {histogram} histogram"]
+                for name, stats in sorted(self.stages.items()):
+                    cumulative = 0
+                    for bound, count in zip(BUCKET_BOUNDS + (float("inf"),), stats.bucket_counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f'{histogram}_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+                    lines.append(f'{histogram}_sum{{stage="{name}"}} {stats.total_seconds!r}')
+                    lines.append(f'{histogram}_count{{stage="{name}"}} {stats.count}')
+            for name, value in sorted(self.counters.items()):
+                counter = f"{METRIC_PREFIX}_{name}_total"
+                lines += [f"# TYPE {counter} counter", f"{counter} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def enabled():
+    return _enabled
+
+
+def enable(profile_dir=None):
+    """Turn recording on for this process, optionally with per-request cProfile dumps."""
+    global _enabled, _profile_dir
+    _enabled = True
+    if profile_dir is not None:
+        _profile_dir = str(profile_dir)
+
+
+def disable():
+    global _enabled, _profile_dir
+    _enabled = False
+    _profile_dir = None
+
+
+@contextmanager
+def _timed(stage_name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(stage_name, time.perf_counter() - start)
+
+
+def stage(stage_name):
+    """
+    Context manager timing a block as one observation of stage_name
+
+    Args:
+        stage_name (str): Stage label, e.g. "scaler_transform"
+
+    Returns:
+        Context manager; a shared no-op one while instrumentation is disabled
+    """
+    return _timed(stage_name) if _enabled else _NULL_CONTEXT
+
+
+def instrumented(stage_name):
+    """Decorator timing every call of a function as stage_name."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _timed(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def observe(stage_name, seconds):
+    """Record a duration measured by the caller, for stages that do not fit a with block."""
+    if _enabled:
+        REGISTRY.observe(stage_name, seconds)
+
+
+def increment(counter_name, amount=1):
+    """Add to a counter (exported as <prefix>_<counter_name>_total) when enabled."""
+    if _enabled:
+        REGISTRY.increment(counter_name, amount)
+
+
+@contextmanager
+def profile_request(request_name):
+    """
+    Time a whole request and, in profiling mode, dump its cProfile stats
+
+    Stats go to <profile dir>/<request_name>-<unix ms>-<thread id>.prof.
+
+    Args:
+        request_name (str): Stage label for the request, also used in the file name
+    """
+    if not _enabled:
+        yield
+        return
+    profile_dir = _profile_dir
+    profiler = None
+    if profile_dir is not None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        with _timed(request_name):
+            yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            Path(profile_dir).mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(
+                Path(profile_dir) / f"{request_name}-{time.time_ns() // 1_000_000}-{threading.get_ident()}.prof"
+            )
+
+
+def export_prometheus():
+    """Current metrics as Prometheus text."""
+    return REGISTRY.to_prometheus()
+
+
+def export_json(indent=None):
+    """Current metrics as a JSON document."""
+    return json.dumps(REGISTRY.to_dict(), indent=indent)
@@ -1,64 +1,267 @@
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from importlib import metadata
+
 import numpy as np
 import pandas as pd
 import joblib
 from pathlib import Path
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-from sklearn.model_selection import GridSearchCV
-from sklearn.svm import SVC
-from sklearn.metrics import confusion_matrix, accuracy_score, precision_score, recall_score, f1_score
+
+import cv_scheduler
+from encoders import CategoricalEncoder
+from explanations import feature_contributions
+from feature_store import FEATURE_STORE_DIR, FeatureStore, get_or_build_feature_store
+import instrumentation
+from scorer import INFERENCE_ARTIFACT_PATH, LinearScorer, platt_probabilities
+
+# scikit-learn's training stack (model selection, metrics, solvers) is imported inside the
+# training functions, so processes that only load artifacts and score never pay for it.
+
+
+MODEL_ARTIFACT_DIR = Path("saved_models")
+MAX_CACHED_ARTIFACTS = 3
+PARAM_GRID = {
+    "C": [0.1, 1, 3, 5, 10],
+    "class_weight": [None, "balanced"]
+}
+# Everything that changes the trained model belongs here so it feeds the artifact fingerprint.
+TRAINING_CONFIG = {
+    "test_size": 0.2,
+    "random_state": 42,
+    "cv": 5,
+    "scoring": "f1",
+    "param_grid": PARAM_GRID,
+}
+# Successive halving over CV folds for the "svc_halving" engine (see cv_scheduler.search).
+HALVING_CONFIG = {"eta": 3, "min_folds": 1}
+TRAINING_ENGINES = ("svc", "svc_halving", "sgd")
+
+
+class CalibratedLinearSVM:
+    """
+    Linear SVM trained with SGD plus a separately fitted Platt sigmoid
+
+    Exposes the same coef_/intercept_/probA_/probB_/class_weight_ contract as
+    SVC(kernel="linear", probability=True), so explanations, batch scoring and
+    inference export treat both engines alike. Models produced by incremental
+    updates also carry the state the next update continues from in online_state_.
+    """
+
+    def __init__(self, coef, intercept, classes, prob_a, prob_b, C=None, class_weight=None,
+                 class_weight_values=None, online_state=None):
+        self.coef_ = np.asarray(coef, dtype=float).reshape(1, -1)
+        self.intercept_ = np.asarray(intercept, dtype=float).reshape(1)
+        self.classes_ = np.asarray(classes)
+        self.probA_ = np.array([prob_a], dtype=float)
+        self.probB_ = np.array([prob_b], dtype=float)
+        self.C = C
+        self.class_weight = class_weight
+        # Per-class weights actually applied in training, aligned with classes_.
+        self.class_weight_ = None if class_weight_values is None else np.asarray(class_weight_values, dtype=float)
+        self.online_state_ = online_state
+
+    def decision_function(self, X):
+        return np.asarray(X, dtype=float) @ self.coef_[0] + self.intercept_[0]
+
+    def predict(self, X):
+        return self.classes_[(self.decision_function(X) > 0).astype(int)]
+
+    def predict_proba(self, X):
+        return platt_probabilities(self.decision_function(X), self.probA_[0], self.probB_[0])
+
+    def __repr__(self):
+        return f"CalibratedLinearSVM(C={self.C}, class_weight={self.class_weight!r})"
+
+
+def _make_sgd_svm(class_weight, n_samples, random_state):
+    from sklearn.linear_model import SGDClassifier
+
+    # Averaged SGD on the hinge loss; warm_start lets each C continue from the previous solution.
+    # About 10**6 sample updates are enough for SGD to converge (sklearn user guide heuristic).
+    max_iter = int(np.clip(np.ceil(1e6 / n_samples), 5, 1000))
+    return SGDClassifier(loss="hinge", average=True, class_weight=class_weight, warm_start=True,
+                         max_iter=max_iter, tol=1e-4, random_state=random_state)
+
+
+def fit_platt_sigmoid(decision, y):
+    """Fit P(y=1) = sigmoid(-A * decision + B) and return (A, B) in libsvm's convention."""
+    from sklearn.linear_model import LogisticRegression
+
+    calibrator = LogisticRegression(C=1e6).fit(decision.reshape(-1, 1), y)
+    return -calibrator.coef_[0, 0], calibrator.intercept_[0]
+
+
+def _train_sgd_engine(X_train, y_train, param_grid, cv=5, random_state=42):
+    """
+    Tune and fit a calibrated linear SVM with warm-started SGD C paths
+
+    Each fold walks the C grid from strongest to weakest regularization, warm
+    starting every fit from the previous solution. The out-of-fold decision
+    values of the winning configuration calibrate the Platt sigmoid, so no
+    extra calibration fits are needed.
+    """
+    from sklearn.metrics import f1_score
+    from sklearn.model_selection import StratifiedKFold
+    from sklearn.utils.class_weight import compute_class_weight
+
+    c_values = sorted(param_grid["C"])
+    folds = list(StratifiedKFold(n_splits=cv).split(X_train, y_train))
+
+    best = None
+    for class_weight in param_grid["class_weight"]:
+        fold_scores = {C: [] for C in c_values}
+        oof_decision = {C: np.empty(len(y_train)) for C in c_values}
+        for train_idx, val_idx in folds:
+            sgd = _make_sgd_svm(class_weight, len(train_idx), random_state)
+            for C in c_values:
+                sgd.set_params(alpha=1.0 / (C * len(train_idx)))
+                sgd.fit(X_train[train_idx], y_train[train_idx])
+                decision = sgd.decision_function(X_train[val_idx])
+                oof_decision[C][val_idx] = decision
+                fold_scores[C].append(f1_score(y_train[val_idx], sgd.classes_[(decision > 0).astype(int)]))
+        for C in c_values:
+            mean_score = np.mean(fold_scores[C])
+            if best is None or mean_score > best[0]:
+                best = (mean_score, C, class_weight, oof_decision[C])
+
+    _, best_C, best_class_weight, best_oof_decision = best
+    sgd = _make_sgd_svm(best_class_weight, len(y_train), random_state)
+    for C in c_values[:c_values.index(best_C) + 1]:
+        sgd.set_params(alpha=1.0 / (C * len(y_train)))
+        sgd.fit(X_train, y_train)
+
+    prob_a, prob_b = fit_platt_sigmoid(best_oof_decision, y_train)
+    return CalibratedLinearSVM(sgd.coef_, sgd.intercept_, sgd.classes_, prob_a, prob_b,
+                               C=best_C, class_weight=best_class_weight,
+                               class_weight_values=compute_class_weight(best_class_weight, classes=sgd.classes_,
+                                                                        y=y_train))
+
+
+def train_test_indices(y):
+    """
+    Row positions of the train and test split used by train_model
+
+    The stratified split depends only on the labels, so other consumers (such as
+    the shared feature store) can reproduce it without the feature values.
+
+    Args:
+        y (array-like): Loan_Status labels
+
+    Returns:
+        tuple: (train_positions, test_positions) as integer arrays
+    """
+    from sklearn.model_selection import train_test_split
+
+    return train_test_split(
+        np.arange(len(y)), test_size=TRAINING_CONFIG["test_size"], random_state=TRAINING_CONFIG["random_state"],
+        stratify=y,
+    )
+
+
+def fit_classifier(X_train, y_train, engine="svc", scaler=None):
+    """
+    Tune and fit the linear SVM on scaled training data
+
+    Args:
+        X_train (numpy.ndarray or FeatureStore): (N, F) scaled training matrix, or a feature
+            store whose raw X_train rows are standardized with scaler
+        y_train (numpy.ndarray): Training labels
+        engine (str): Training engine, one of TRAINING_ENGINES (see train_model)
+        scaler (StandardScaler, optional): Fitted scaler, required with a feature store
+
+    Returns:
+        Fitted classifier with coef_, intercept_, probA_ and probB_
+    """
+    from sklearn.exceptions import ConvergenceWarning
+    from sklearn.svm import SVC
+
+    # Tune linear SVM hyperparameters while keeping coefficient-based explainability
+    if engine in ("svc", "svc_halving"):
+        # Same folds, scoring and tie-breaking as GridSearchCV, but the workers map the training
+        # matrix (the shared feature store, when given one) instead of having it pickled per fit.
+        base_model = SVC(kernel="linear", probability=True, random_state=TRAINING_CONFIG["random_state"])
+        halving = HALVING_CONFIG if engine == "svc_halving" else {}
+        model, _ = cv_scheduler.search(base_model, PARAM_GRID, X_train, y_train,
+                                       cv=TRAINING_CONFIG["cv"], scoring=TRAINING_CONFIG["scoring"],
+                                       halving=bool(halving), scaler=scaler, **halving)
+    elif engine == "sgd":
+        if isinstance(X_train, FeatureStore):
+            X_train = scaler.transform(np.asarray(X_train.X_train, dtype=np.float64))
+        # The SGD epoch budget is capped on purpose, so convergence warnings are expected noise.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            model = _train_sgd_engine(X_train, y_train, PARAM_GRID,
+                                      cv=TRAINING_CONFIG["cv"], random_state=TRAINING_CONFIG["random_state"])
+    else:
+        raise ValueError(f"Unknown training engine {engine!r}; expected one of {TRAINING_ENGINES}")
+    return model
 
 
-MODEL_ARTIFACT_PATH = Path("saved_models/loan_model.joblib")
+def evaluate_model(model, X_test, y_test):
+    """
+    Hold-out predictions and the metrics stored in the model bundle
 
+    Args:
+        model: Fitted classifier
+        X_test (numpy.ndarray): Scaled hold-out features
+        y_test (array-like): Hold-out labels
 
-def train_model(df):
+    Returns:
+        tuple: (y_pred, accuracy, precision, recall, f1, conf_matrix)
+    """
+    from sklearn.metrics import confusion_matrix, accuracy_score, precision_score, recall_score, f1_score
+
+    y_pred = model.predict(X_test)
+    return (
+        y_pred,
+        accuracy_score(y_test, y_pred),
+        precision_score(y_test, y_pred),
+        recall_score(y_test, y_pred),
+        f1_score(y_test, y_pred),
+        confusion_matrix(y_test, y_pred),
+    )
+
+
+@instrumentation.instrumented("train_model")
+def train_model(df, engine="svc", store_dir=FEATURE_STORE_DIR):
     """
     Train the loan approval prediction model
 
     Args:
         df (pandas.DataFrame): Preprocessed dataframe with features and target
+        engine (str): "svc" for an exhaustive libsvm grid search, "svc_halving" to prune
+            the grid by successive halving over folds, or "sgd" for the warm-started
+            SGD path with post-hoc Platt calibration (much faster on large data)
+        store_dir (str or Path): Directory holding the shared feature stores
 
     Returns:
         tuple: (model, scaler, X_test, y_test, y_pred, accuracy, precision, recall, f1, conf_matrix, feature_importance, feature_names)
     """
-    # Prepare features and target
-    X = df.drop("Loan_Status", axis=1)
+    from sklearn.preprocessing import StandardScaler
+
+    # Prepare the target; the features are read from the feature store below
     y = df["Loan_Status"]
 
-    # Split into train and test
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42, stratify=y
-    )
+    # Split into train and test. The features come from the shared float32 feature store,
+    # whose rows are already in split order; the CV workers map the same file.
+    train_positions, test_positions = train_test_indices(y)
+    y_train, y_test = y.iloc[train_positions], y.iloc[test_positions]
+    store = get_or_build_feature_store(df, store_dir)
 
-    # Scale features using train-only fit to prevent leakage
-    scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train.values)
-    X_test_scaled = scaler.transform(X_test.values)
+    # Scale features using train-only fit to prevent leakage, in float64 as at prediction time.
+    scaler = StandardScaler().fit(np.asarray(store.X_train, dtype=np.float64))
+    X_test_scaled = scaler.transform(np.asarray(store.X_test, dtype=np.float64))
 
-    # Tune linear SVM hyperparameters while keeping coefficient-based explainability
-    param_grid = {
-        "C": [0.1, 1, 3, 5, 10],
-        "class_weight": [None, "balanced"]
-    }
-    base_model = SVC(kernel="linear", probability=True, random_state=42)
-    grid_search = GridSearchCV(base_model, param_grid=param_grid, scoring="f1", cv=5, n_jobs=-1)
-    grid_search.fit(X_train_scaled, y_train)
-    model = grid_search.best_estimator_
-
-    # Evaluate
-    y_pred = model.predict(X_test_scaled)
-
-    # Calculate metrics
-    accuracy = accuracy_score(y_test, y_pred)
-    precision = precision_score(y_test, y_pred)
-    recall = recall_score(y_test, y_pred)
-    f1 = f1_score(y_test, y_pred)
-    conf_matrix = confusion_matrix(y_test, y_pred)
+    model = fit_classifier(store, y_train.to_numpy(), engine, scaler)
+
+    y_pred, accuracy, precision, recall, f1, conf_matrix = evaluate_model(model, X_test_scaled, y_test)
 
     # Get feature importance from SVM coefficients (linear kernel)
     feature_importance = model.coef_[0].copy()
-    feature_names = X.columns.tolist()
+    feature_names = store.feature_names
 
     return (
         model,
@@ -76,37 +279,272 @@ def train_model(df):
     )
 
 
-def save_model_artifact(model_bundle, artifact_path=MODEL_ARTIFACT_PATH):
-    """Persist trained model bundle to disk."""
+def compute_model_fingerprint(df, engine="svc"):
+    """
+    Fingerprint everything a trained model depends on
+
+    Covers the preprocessed data values, the feature list and dtypes, the
+    training configuration and engine, and the versions of the libraries that
+    produce and read the artifact.
+
+    Args:
+        df (pandas.DataFrame): Preprocessed dataframe with features and target
+        engine (str): Training engine name
+
+    Returns:
+        str: Short hex digest identifying the model version
+    """
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    training_config = {**TRAINING_CONFIG, "engine": engine}
+    if engine == "svc_halving":
+        training_config["halving"] = HALVING_CONFIG
+    digest.update(json.dumps({
+        "columns": df.columns.tolist(),
+        "dtypes": df.dtypes.astype(str).tolist(),
+        "training_config": training_config,
+        "versions": {
+            # Read from package metadata so fingerprinting does not import scikit-learn.
+            "scikit-learn": metadata.version("scikit-learn"),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "joblib": joblib.__version__,
+        },
+    }, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:16]
+
+
+def artifact_path_for(fingerprint, artifact_dir=MODEL_ARTIFACT_DIR):
+    """Path of the model bundle stored for a fingerprint."""
+    return Path(artifact_dir) / f"loan_model-{fingerprint}.joblib"
+
+
+def inference_artifact_path(artifact_dir=MODEL_ARTIFACT_DIR):
+    """Path of the exported inference artifact that belongs with the bundles in artifact_dir."""
+    return Path(artifact_dir) / INFERENCE_ARTIFACT_PATH.name
+
+
+def feature_store_dir(artifact_dir=MODEL_ARTIFACT_DIR):
+    """Directory of the feature stores that belong with the bundles in artifact_dir."""
+    return Path(artifact_dir) / FEATURE_STORE_DIR.name
+
+
+def fingerprint_from_artifact_path(artifact_path):
+    """Model fingerprint embedded in a bundle path from artifact_path_for."""
+    return Path(artifact_path).stem.removeprefix("loan_model-")
+
+
+def update_head_path(fingerprint, artifact_dir=MODEL_ARTIFACT_DIR):
+    """Pointer file naming the latest incremental update published on top of a trained bundle."""
+    return Path(artifact_dir) / f"loan_model-{fingerprint}.head"
+
+
+def latest_update_path(fingerprint, artifact_dir=MODEL_ARTIFACT_DIR):
+    """
+    Bundle of the latest incremental update of a trained model, if one is published
+
+    Args:
+        fingerprint (str): Fingerprint of the fully trained bundle the updates started from
+        artifact_dir (str or Path): Directory holding the model bundles
+
+    Returns:
+        Path: The updated bundle, or None when there is no update or it has been evicted
+    """
+    try:
+        update_fingerprint = update_head_path(fingerprint, artifact_dir).read_text().strip()
+    except FileNotFoundError:
+        return None
+    update_path = artifact_path_for(update_fingerprint, artifact_dir)
+    return update_path if update_path.exists() else None
+
+
+def publish_update_head(fingerprint, update_fingerprint, artifact_dir=MODEL_ARTIFACT_DIR):
+    """Point the trained bundle `fingerprint` at its newest incremental update, atomically."""
+    head_path = update_head_path(fingerprint, artifact_dir)
+    head_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=head_path.parent, prefix=f".{head_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(update_fingerprint)
+        os.replace(tmp_path, head_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def save_model_artifact(model_bundle, artifact_path):
+    """Persist trained model bundle to disk atomically."""
     artifact_path = Path(artifact_path)
     artifact_path.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(model_bundle, artifact_path)
-
+    # Write to a temporary file in the same directory, then rename it into place, so
+    # concurrent readers see either the previous file or the complete new one.
+    fd, tmp_path = tempfile.mkstemp(dir=artifact_path.parent, prefix=f".{artifact_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            joblib.dump(model_bundle, tmp_file)
+        os.replace(tmp_path, artifact_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+@instrumentation.instrumented("artifact_load")
+def load_model_artifact(artifact_path, mmap_mode=None):
+    """
+    Load persisted model bundle if available
 
-def load_model_artifact(artifact_path=MODEL_ARTIFACT_PATH):
-    """Load persisted model bundle if available."""
+    With mmap_mode="c" the arrays inside the bundle (test split, support vectors)
+    are memory-mapped copy-on-write, so processes serving the same bundle share
+    their pages. libsvm needs writable buffers, so use "c" rather than "r" for SVC.
+    """
     artifact_path = Path(artifact_path)
     if not artifact_path.exists():
         return None
-    return joblib.load(artifact_path)
+    return joblib.load(artifact_path, mmap_mode=mmap_mode)
+
+
+def evict_model_artifacts(artifact_dir=MODEL_ARTIFACT_DIR, keep=MAX_CACHED_ARTIFACTS):
+    """Delete all but the `keep` most recently used model bundles."""
+    artifacts = sorted(Path(artifact_dir).glob("loan_model-*.joblib"), key=_last_used, reverse=True)
+    for stale_artifact in artifacts[keep:]:
+        stale_artifact.unlink(missing_ok=True)
+    # Drop update pointers whose bundle is gone; an evicted update falls back to its trained bundle.
+    for head_path in Path(artifact_dir).glob("loan_model-*.head"):
+        if latest_update_path(fingerprint_from_artifact_path(head_path), artifact_dir) is None:
+            head_path.unlink(missing_ok=True)
+
+
+def _last_used(artifact_path):
+    try:
+        return artifact_path.stat().st_mtime
+    except FileNotFoundError:
+        # Another worker evicted it in the meantime.
+        return 0.0
+
+
+def export_inference_artifact(model, scaler, feature_names, label_encoders, artifact_path=INFERENCE_ARTIFACT_PATH):
+    """
+    Write the compact inference artifact used by the pure-NumPy scorer
+
+    Only what scoring needs is kept: scaler mean/scale, the linear SVM weights,
+    its Platt sigmoid parameters and the categorical lookup tables.
 
+    Args:
+        model: Trained linear SVM with probability estimates
+        scaler: Fitted StandardScaler
+        feature_names (list): Feature order used in training
+        label_encoders (dict or CategoricalEncoder): Encoders for categorical features
+        artifact_path (str or Path): Destination .npz file
+
+    Returns:
+        LinearScorer: The exported scorer
+    """
+    if not isinstance(label_encoders, CategoricalEncoder):
+        label_encoders = CategoricalEncoder.from_label_encoders(label_encoders)
+
+    scorer = LinearScorer.from_estimator(model, scaler, feature_names, label_encoders)
+    scorer.save(artifact_path)
+    return scorer
+
+
+def find_serving_artifact(df, artifact_dir=MODEL_ARTIFACT_DIR, engine="svc", fingerprint=None):
+    """
+    Pick the model bundle to serve without training
+
+    Args:
+        df (pandas.DataFrame): Preprocessed dataframe with features and target
+        artifact_dir (str or Path): Directory holding the model bundles
+        engine (str): Training engine name
+        fingerprint (str, optional): compute_model_fingerprint(df, engine), when the caller already has it.
+            Hashing the frame is O(rows), so callers that check often should compute it once.
 
-def get_or_train_model(df, artifact_path=MODEL_ARTIFACT_PATH):
+    Returns:
+        tuple: (artifact_path, is_current). The path is the latest incremental update
+        of the bundle for the current fingerprint, else that bundle when it exists,
+        else the most recently used older bundle, else None.
     """
-    Load a saved model bundle from disk. Train and save if missing or stale.
+    if fingerprint is None:
+        fingerprint = compute_model_fingerprint(df, engine)
+    current_path = latest_update_path(fingerprint, artifact_dir) or artifact_path_for(fingerprint, artifact_dir)
+    if current_path.exists():
+        return current_path, True
+    artifacts = sorted(Path(artifact_dir).glob("loan_model-*.joblib"), key=_last_used, reverse=True)
+    return (artifacts[0] if artifacts else None), False
+
+
+def get_or_train_model(df, artifact_dir=MODEL_ARTIFACT_DIR, engine="svc", max_artifacts=MAX_CACHED_ARTIFACTS,
+                       store_dir=None):
+    """
+    Load the saved model bundle matching the data and configuration. Train and save if missing.
+
+    Bundles are keyed by compute_model_fingerprint, so a change to the data, the
+    training configuration or the library versions trains a new model instead of
+    serving a stale one. The latest incremental update of the matching bundle (see
+    incremental.py) is served in its place. The most recently used bundles are kept on disk.
+    Training maps its features from store_dir, by default the features/ folder of artifact_dir.
     """
     expected_features = df.drop("Loan_Status", axis=1).columns.tolist()
+    fingerprint = compute_model_fingerprint(df, engine)
+    artifact_path = latest_update_path(fingerprint, artifact_dir) or artifact_path_for(fingerprint, artifact_dir)
     model_bundle = load_model_artifact(artifact_path)
-    if model_bundle is not None:
-        saved_feature_names = model_bundle[-1]
-        if list(saved_feature_names) == expected_features:
-            return model_bundle
-
-    model_bundle = train_model(df)
+    if model_bundle is not None and list(model_bundle[-1]) == expected_features:
+        # Touch the bundle so LRU eviction sees it as recently used.
+        os.utime(artifact_path)
+        return model_bundle
+
+    if store_dir is None:
+        store_dir = feature_store_dir(artifact_dir)
+    model_bundle = train_model(df, engine=engine, store_dir=store_dir)
+    artifact_path = artifact_path_for(fingerprint, artifact_dir)
     save_model_artifact(model_bundle, artifact_path)
+    evict_model_artifacts(artifact_dir, keep=max_artifacts)
     return model_bundle
 
 
+def predict_loan_approval_batch(model, scaler, input_data, feature_names=None):
+    """
+    Predict loan approval for many applicants in a single vectorized pass
+
+    Args:
+        model: Trained SVM model
+        scaler: Fitted StandardScaler
+        input_data (numpy.ndarray or pandas.DataFrame): (N, F) encoded applicant data. Compact
+            float32 input is scaled and scored in float64, so a row scores the same alone or in any batch.
+        feature_names (list, optional): Column order to select when input_data is a DataFrame
+
+    Returns:
+        tuple: (predictions, probabilities, scaled_input) as row-aligned arrays
+    """
+    if isinstance(input_data, pd.DataFrame):
+        if feature_names is not None:
+            input_data = input_data[list(feature_names)]
+        input_data = input_data.to_numpy(dtype=float)
+    input_data = np.asarray(input_data, dtype=float)
+    if input_data.ndim == 1:
+        input_data = input_data.reshape(1, -1)
+
+    instrumentation.increment("predicted_rows", len(input_data))
+    # Scale the whole batch at once, keeping feature names when the scaler expects them.
+    with instrumentation.stage("scaler_transform"):
+        if hasattr(scaler, "feature_names_in_"):
+            input_frame = pd.DataFrame(input_data, columns=scaler.feature_names_in_)
+            scaled_input = scaler.transform(input_frame)
+        else:
+            scaled_input = scaler.transform(input_data)
+
+    # One decision-function pass feeds both the labels and the probabilities.
+    with instrumentation.stage("predict"):
+        decision = model.decision_function(scaled_input)
+        predictions = model.classes_[(decision > 0).astype(int)]
+    with instrumentation.stage("predict_proba"):
+        if getattr(model, "probA_", None) is not None and len(model.probA_):
+            probabilities = platt_probabilities(decision, model.probA_[0], model.probB_[0])
+        else:
+            probabilities = model.predict_proba(scaled_input)
+
+    return predictions, probabilities, scaled_input
+
+
 def predict_loan_approval(model, scaler, input_data):
     """
     Predict loan approval using the trained model
@@ -119,18 +557,8 @@ def predict_loan_approval(model, scaler, input_data):
     Returns:
         tuple: (prediction, probability)
     """
-    # Scale the input data with feature names when available.
-    if hasattr(scaler, "feature_names_in_"):
-        input_frame = pd.DataFrame(input_data, columns=scaler.feature_names_in_)
-        scaled_input = scaler.transform(input_frame)
-    else:
-        scaled_input = scaler.transform(input_data)
-
-    # Get prediction and probability
-    prediction = model.predict(scaled_input)[0]
-    probability = model.predict_proba(scaled_input)[0]
-
-    return prediction, probability, scaled_input
+    predictions, probabilities, scaled_input = predict_loan_approval_batch(model, scaler, input_data)
+    return predictions[0], probabilities[0], scaled_input
 
 
 def analyze_feature_impact(feature_names, feature_importance, scaled_input):
@@ -145,13 +573,12 @@ def analyze_feature_impact(feature_names, feature_importance, scaled_input):
     Returns:
         pandas.DataFrame: DataFrame with feature impact analysis
     """
-    input_features = pd.DataFrame(scaled_input, columns=feature_names)
-    feature_impact = input_features.iloc[0] * feature_importance
+    feature_impact = feature_contributions(scaled_input, feature_importance)[0]
 
     feature_impact_df = pd.DataFrame({
         'Feature': feature_names,
         'Impact': feature_impact,
         'Absolute Impact': np.abs(feature_impact)
-    }).sort_values(by='Absolute Impact', ascending=False)
+    }, index=feature_names).sort_values(by='Absolute Impact', ascending=False)
 
     return feature_impact_df
\ No newline at end of file
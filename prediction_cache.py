@@ -0,0 +1,144 @@
+"""
+Process-wide memo of single-applicant assessments
+
+Users often resubmit the same form. Each distinct applicant (plus the policy
+inputs) is assessed once per model version and served from memory afterwards.
+The cache is bounded (least recently used entries are dropped first), entries
+expire after a TTL, and it empties itself the first time it is asked for a
+different model version. One instance is shared by every session in a process,
+so all operations take a lock.
+"""
+import numbers
+import threading
+import time
+from collections import OrderedDict
+
+
+MAX_ENTRIES = 1024
+TTL_SECONDS = 3600.0
+
+
+def normalize_applicant(applicant_data, **policy_inputs):
+    """
+    Hashable, order-independent key for one applicant
+
+    Numbers are compared as floats, so 5000 and 5000.0 share an entry.
+
+    Args:
+        applicant_data (dict): Applicant fields keyed by column name
+        **policy_inputs: Other inputs the assessment depends on, e.g. interest_rate
+
+    Returns:
+        tuple: Sorted (name, value) pairs
+    """
+    fields = {**applicant_data, **policy_inputs}
+    return tuple(
+        (name, float(value) if isinstance(value, numbers.Real) and not isinstance(value, bool) else value)
+        for name, value in sorted(fields.items())
+    )
+
+
+class PredictionCache:
+    """
+    Bounded LRU/TTL cache of assessments keyed by normalized applicant and model version
+
+    Cached values are shared between sessions and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, ttl_seconds=TTL_SECONDS, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._model_version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _sync_model_version(self, model_version):
+        if model_version != self._model_version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._model_version = model_version
+
+    def get(self, key, model_version):
+        """
+        Look up an assessment
+
+        Args:
+            key (tuple): Key from normalize_applicant
+            model_version (str): Fingerprint of the serving model
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            self._sync_model_version(model_version)
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, model_version, value):
+        """Store an assessment, dropping the least recently used entries beyond max_entries."""
+        with self._lock:
+            self._sync_model_version(model_version)
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, model_version, compute):
+        """
+        Return the cached assessment, computing and storing it on a miss
+
+        The computation runs outside the lock, so a slow assessment never blocks
+        other sessions; two sessions missing on the same key at once both compute it.
+
+        Args:
+            key (tuple): Key from normalize_applicant
+            model_version (str): Fingerprint of the serving model
+            compute (callable): Zero-argument function producing the assessment
+
+        Returns:
+            The cached or freshly computed assessment
+        """
+        value = self.get(key, model_version)
+        if value is None:
+            value = compute()
+            self.put(key, model_version, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters and current size, for display or logging."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "model_version": self._model_version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,213 @@
+"""
+Pure-NumPy loan approval scorer
+
+Serving processes load a compact inference artifact written by
+model.export_inference_artifact instead of the full joblib training bundle, so
+scoring needs neither pandas nor scikit-learn.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from encoders import CategoricalEncoder
+from features import build_feature_matrix
+from instrumentation import instrumented
+
+
+INFERENCE_ARTIFACT_PATH = Path("saved_models/loan_scorer.npz")
+_CATEGORY_PREFIX = "categories__"
+
+
+def platt_probabilities(decision, prob_a, prob_b):
+    """
+    Map decision values to class probabilities with libsvm's Platt sigmoid
+
+    Args:
+        decision (numpy.ndarray): Decision values, positive for the second class
+        prob_a (float): Sigmoid slope fitted by the SVC (``probA_``)
+        prob_b (float): Sigmoid offset fitted by the SVC (``probB_``)
+
+    Returns:
+        numpy.ndarray: (N, 2) array of [P(class 0), P(class 1)]
+    """
+    # libsvm scores the first class, so its decision value is the negated sklearn one.
+    f_ab = -decision * prob_a + prob_b
+    exp_term = np.exp(-np.abs(f_ab))
+    negative_prob = np.where(f_ab >= 0, exp_term / (1.0 + exp_term), 1.0 / (1.0 + exp_term))
+    negative_prob = np.clip(negative_prob, 1e-7, 1 - 1e-7)
+    return np.column_stack((negative_prob, 1.0 - negative_prob))
+
+
+class LinearScorer:
+    """
+    Standardize-then-linear-SVM scorer with a Platt sigmoid for probabilities
+
+    The StandardScaler is folded into the SVM weights when the scorer is built:
+    w . ((x - mean) / scale) + b == x . (w / scale) + (b - w . (mean / scale)),
+    so scoring N applicants is one matrix-vector product plus a vectorized sigmoid.
+    The product is always taken in float64, even for the float32 matrices
+    build_feature_matrix produces, so a row scores the same alone or in any batch.
+    """
+
+    def __init__(self, feature_names, mean, scale, coef, intercept, classes, prob_a, prob_b, encoder):
+        self.feature_names = list(feature_names)
+        self.mean = np.asarray(mean, dtype=float)
+        self.scale = np.asarray(scale, dtype=float)
+        self.coef = np.asarray(coef, dtype=float).ravel()
+        self.intercept = float(intercept)
+        self.classes = np.asarray(classes)
+        self.prob_a = float(prob_a)
+        self.prob_b = float(prob_b)
+        self.encoder = encoder
+
+        # Fold the scaler into the hyperplane once, at load time.
+        self.weights = self.coef / self.scale
+        self.bias = self.intercept - float(self.weights @ self.mean)
+
+    @classmethod
+    def from_estimator(cls, model, scaler, feature_names, encoder):
+        """
+        Build a scorer from a fitted linear SVM and its StandardScaler
+
+        Args:
+            model: Trained linear SVM with Platt parameters (probA_/probB_)
+            scaler: Fitted StandardScaler
+            feature_names (list): Feature order used in training
+            encoder (CategoricalEncoder): Encoder for categorical features
+
+        Returns:
+            LinearScorer: Scorer equivalent to predict_loan_approval_batch
+        """
+        if getattr(model, "probA_", None) is None or not len(model.probA_):
+            raise ValueError("Model has no Platt sigmoid parameters; train it with probability=True")
+        return cls(
+            feature_names=feature_names,
+            mean=scaler.mean_,
+            scale=scaler.scale_,
+            coef=model.coef_[0],
+            intercept=model.intercept_[0],
+            classes=model.classes_,
+            prob_a=model.probA_[0],
+            prob_b=model.probB_[0],
+            encoder=encoder,
+        )
+
+    def save(self, artifact_path=INFERENCE_ARTIFACT_PATH):
+        """Write the scorer parameters and encoder tables to a single .npz file."""
+        artifact_path = Path(artifact_path)
+        artifact_path.parent.mkdir(parents=True, exist_ok=True)
+        category_arrays = {
+            _CATEGORY_PREFIX + col: np.asarray(values, dtype=str)
+            for col, values in self.encoder.classes.items()
+        }
+        # Rename a finished temporary file into place so readers never see a partial artifact.
+        fd, tmp_path = tempfile.mkstemp(dir=artifact_path.parent, prefix=f".{artifact_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as artifact_file:
+                np.savez(
+                    artifact_file,
+                    feature_names=np.asarray(self.feature_names, dtype=str),
+                    mean=self.mean,
+                    scale=self.scale,
+                    coef=self.coef,
+                    intercept=np.float64(self.intercept),
+                    classes=self.classes,
+                    prob_a=np.float64(self.prob_a),
+                    prob_b=np.float64(self.prob_b),
+                    **category_arrays,
+                )
+            os.replace(tmp_path, artifact_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def decision_function(self, input_data):
+        """Signed distance to the SVM hyperplane for each row of encoded input."""
+        return np.atleast_2d(np.asarray(input_data, dtype=float)) @ self.weights + self.bias
+
+    def predict(self, input_data):
+        """
+        Score encoded applicants
+
+        Args:
+            input_data (numpy.ndarray): (N, F) encoded input in feature_names order
+
+        Returns:
+            tuple: (predictions, probabilities) as row-aligned arrays
+        """
+        decision = self.decision_function(input_data)
+        predictions = self.classes[(decision > 0).astype(int)]
+        return predictions, platt_probabilities(decision, self.prob_a, self.prob_b)
+
+    def score_applicants(self, columns):
+        """
+        Encode and score raw applicant columns
+
+        Args:
+            columns (dict): Column name to array-like of raw values, as in create_input_data
+
+        Returns:
+            tuple: (predictions, probabilities) as row-aligned arrays
+        """
+        return self.predict(build_feature_matrix(columns, self.encoder, self.feature_names))
+
+
+@instrumented("scorer_load")
+def load_scorer(artifact_path=INFERENCE_ARTIFACT_PATH):
+    """
+    Load a scorer from an inference artifact
+
+    Args:
+        artifact_path (str or Path): Path written by LinearScorer.save
+
+    Returns:
+        LinearScorer: Ready-to-use scorer, or None when the artifact is missing
+    """
+    artifact_path = Path(artifact_path)
+    if not artifact_path.exists():
+        return None
+    with np.load(artifact_path, allow_pickle=False) as artifact:
+        encoder = CategoricalEncoder({
+            name[len(_CATEGORY_PREFIX):]: artifact[name]
+            for name in artifact.files if name.startswith(_CATEGORY_PREFIX)
+        })
+        return LinearScorer(
+            feature_names=artifact["feature_names"].tolist(),
+            mean=artifact["mean"],
+            scale=artifact["scale"],
+            coef=artifact["coef"],
+            intercept=artifact["intercept"],
+            classes=artifact["classes"],
+            prob_a=artifact["prob_a"],
+            prob_b=artifact["prob_b"],
+            encoder=encoder,
+        )
+
+
+def resolve_scorer(artifact_path=INFERENCE_ARTIFACT_PATH):
+    """
+    Load the inference artifact, training and exporting the default one on first use
+
+    Args:
+        artifact_path (str or Path): Path written by LinearScorer.save
+
+    Returns:
+        LinearScorer: Ready-to-use scorer
+
+    Raises:
+        RuntimeError: If the default artifact is missing and another trainer is already running
+        FileNotFoundError: If a non-default artifact is missing
+    """
+    scorer = load_scorer(artifact_path)
+    if scorer is None and Path(artifact_path) == INFERENCE_ARTIFACT_PATH:
+        # Training pulls in pandas and scikit-learn, so only import it when there is no artifact.
+        from training_worker import run_training
+
+        if run_training() is None:
+            raise RuntimeError("A training worker is already running; retry once it has published the model.")
+        scorer = load_scorer(artifact_path)
+    if scorer is None:
+        raise FileNotFoundError(f"Inference artifact not found: {artifact_path}")
+    return scorer
@@ -0,0 +1,329 @@
+"""
+Local HTTP scoring service
+
+Serves the exported model and the financial policy over plain HTTP/1.1 with
+asyncio streams, so other systems can score applicants without going through
+Streamlit:
+
+    python scoring_service.py --port 8765 --max-batch-size 256 --max-wait-ms 1
+
+Endpoints:
+    POST /score    one applicant (JSON object, fields as in the app's applicant_data,
+                   LoanAmount in rupees, optional existing_debt and interest_rate)
+                   or a JSON list of them
+    GET  /metrics  request count, p50/p99 latency, throughput and batch sizes
+    GET  /health   liveness
+
+The inference artifact is loaded once at startup. Requests that arrive within
+the max-wait window are coalesced into one micro-batch and scored with a single
+vectorized pass: build_feature_matrix (the batch form of create_input_data), the
+folded scorer (equivalent to predict_loan_approval) and
+perform_financial_checks_batch.
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from financial_utils import perform_financial_checks_batch
+from scorer import INFERENCE_ARTIFACT_PATH, resolve_scorer
+
+
+APPLICANT_FIELDS = [
+    "Gender", "Married", "Dependents", "Education", "Self_Employed", "ApplicantIncome",
+    "CoapplicantIncome", "LoanAmount", "Loan_Amount_Term", "Credit_History", "Property_Area",
+]
+NUMERIC_FIELDS = ["ApplicantIncome", "CoapplicantIncome", "LoanAmount", "Loan_Amount_Term", "Credit_History"]
+# Optional per-request policy inputs and their defaults (the app's defaults)
+POLICY_DEFAULTS = {"existing_debt": 0.0, "interest_rate": 8.5}
+LATENCY_WINDOW = 10_000
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class ServiceMetrics:
+    """
+    Request latencies and batch sizes for the /metrics endpoint
+
+    Latency percentiles and the recent throughput cover the last LATENCY_WINDOW
+    requests; the counters cover the lifetime of the process.
+    """
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.started_at = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_rows = 0
+        self._latencies = deque(maxlen=window)
+        self._completed_at = deque(maxlen=window)
+
+    def record_request(self, latency_seconds, ok=True):
+        self.requests += 1
+        self.errors += not ok
+        self._latencies.append(latency_seconds)
+        self._completed_at.append(time.perf_counter())
+
+    def record_batch(self, size):
+        self.batches += 1
+        self.batched_rows += size
+
+    def snapshot(self):
+        uptime = time.perf_counter() - self.started_at
+        latencies_ms = np.asarray(self._latencies) * 1000
+        p50, p99 = np.percentile(latencies_ms, [50, 99]) if len(latencies_ms) else (0.0, 0.0)
+        window_seconds = self._completed_at[-1] - self._completed_at[0] if len(self._completed_at) > 1 else 0.0
+        recent_throughput = (len(self._completed_at) - 1) / window_seconds if window_seconds else 0.0
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "uptime_seconds": round(uptime, 3),
+            "latency_p50_ms": round(float(p50), 3),
+            "latency_p99_ms": round(float(p99), 3),
+            "throughput_rps": round(self.requests / uptime, 1) if uptime > 0 else 0.0,
+            "recent_throughput_rps": round(recent_throughput, 1),
+            "batches": self.batches,
+            "mean_batch_size": round(self.batched_rows / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+def parse_applicant(payload, encoder):
+    """
+    Validate one applicant from a request body
+
+    Args:
+        payload (dict): Applicant fields plus optional existing_debt and interest_rate
+        encoder (CategoricalEncoder): Encoder whose categories the applicant must use
+
+    Returns:
+        dict: Applicant fields with numeric values as floats
+
+    Raises:
+        ValueError: If a field is missing, not a finite number or an unseen category
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Each applicant must be a JSON object")
+    missing = [field for field in APPLICANT_FIELDS if field not in payload]
+    if missing:
+        raise ValueError(f"Missing applicant field(s) {missing}")
+
+    applicant = {field: payload[field] for field in APPLICANT_FIELDS}
+    for field in NUMERIC_FIELDS + list(POLICY_DEFAULTS):
+        value = payload.get(field, POLICY_DEFAULTS.get(field))
+        try:
+            applicant[field] = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} must be a number, got {value!r}") from None
+        # float() and json.loads both accept NaN and Infinity, which would come back as invalid JSON.
+        if not math.isfinite(applicant[field]):
+            raise ValueError(f"{field} must be a finite number, got {value!r}")
+    encoder.encode_row(applicant)
+    return applicant
+
+
+def score_batch(applicants, scorer):
+    """
+    Score validated applicants in one vectorized pass
+
+    Args:
+        applicants (list): Applicants from parse_applicant
+        scorer (LinearScorer): Exported model
+
+    Returns:
+        list: One result dict per applicant, in order
+    """
+    columns = {field: [applicant[field] for applicant in applicants] for field in APPLICANT_FIELDS}
+    columns.update({field: np.array(columns[field], dtype=float) for field in NUMERIC_FIELDS})
+    predictions, probabilities = scorer.score_applicants(columns)
+    checks = perform_financial_checks_batch(
+        columns["LoanAmount"],
+        columns["Loan_Amount_Term"],
+        columns["ApplicantIncome"],
+        columns["CoapplicantIncome"],
+        np.array([applicant["existing_debt"] for applicant in applicants]),
+        np.array([applicant["interest_rate"] for applicant in applicants]),
+    )
+
+    results = []
+    for row, prediction in enumerate(predictions.tolist()):
+        row_checks = {name: values[row].item() for name, values in checks.items()}
+        # JSON has no infinity; zero-income ratios are reported as null.
+        row_checks = {name: None if isinstance(value, float) and not math.isfinite(value) else value
+                      for name, value in row_checks.items()}
+        results.append({
+            "model_prediction": prediction,
+            "approval_probability": float(probabilities[row, 1]),
+            "financial_checks": row_checks,
+            "final_approval": prediction == 1 and row_checks["financially_feasible"],
+        })
+    return results
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent scoring requests into micro-batches
+
+    The first queued applicant opens a batch; the batch is scored once it holds
+    max_batch_size applicants or max_wait seconds have passed, whichever comes
+    first. With max_wait=0 only applicants that are already queued are batched.
+    """
+
+    def __init__(self, scorer, metrics, max_batch_size=256, max_wait=0.001):
+        self.scorer = scorer
+        self.metrics = metrics
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = asyncio.Queue()
+        self._batch_full = asyncio.Event()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def submit(self, applicant):
+        """Queue one validated applicant and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((applicant, future))
+        if self._queue.qsize() >= self.max_batch_size:
+            self._batch_full.set()
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() + 1 < self.max_batch_size:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+            self._batch_full.clear()
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            applicants = [applicant for applicant, _ in batch]
+            try:
+                results = score_batch(applicants, self.scorer)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            self.metrics.record_batch(len(batch))
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class ScoringService:
+    """Minimal HTTP/1.1 server (keep-alive, JSON bodies) in front of a MicroBatcher."""
+
+    def __init__(self, scorer, max_batch_size=256, max_wait=0.001):
+        self.scorer = scorer
+        self.metrics = ServiceMetrics()
+        self.batcher = MicroBatcher(scorer, self.metrics, max_batch_size, max_wait)
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        self.batcher.start()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        print(f"Scoring service listening on http://{host}:{port}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self._dispatch(method, target, body)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            # Malformed request lines or clients hanging up mid-request just end the connection.
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, target, body):
+        path = target.split("?", 1)[0]
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            return 200, self.metrics.snapshot()
+        if path != "/score":
+            return 404, {"error": f"Unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST /score"}
+        return await self._score(body)
+
+    async def _score(self, body):
+        start = time.perf_counter()
+        try:
+            payload = json.loads(body)
+            single = isinstance(payload, dict)
+            applicants = [parse_applicant(item, self.scorer.encoder) for item in ([payload] if single else payload)]
+        except (ValueError, TypeError) as exc:
+            self.metrics.record_request(time.perf_counter() - start, ok=False)
+            return 400, {"error": str(exc)}
+
+        try:
+            results = await asyncio.gather(*(self.batcher.submit(applicant) for applicant in applicants))
+        except Exception as exc:
+            self.metrics.record_request(time.perf_counter() - start, ok=False)
+            return 500, {"error": str(exc)}
+        self.metrics.record_request(time.perf_counter() - start)
+        return 200, results[0] if single else results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the loan approval model over HTTP with micro-batching.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--artifact", default=str(INFERENCE_ARTIFACT_PATH), help="Inference artifact (.npz)")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=1.0, help="How long a batch waits to fill up")
+    args = parser.parse_args()
+
+    try:
+        scorer = resolve_scorer(Path(args.artifact))
+    except (FileNotFoundError, RuntimeError) as exc:
+        raise SystemExit(str(exc))
+    service = ScoringService(scorer, max_batch_size=args.max_batch_size, max_wait=args.max_wait_ms / 1000)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from data_utils import load_data  # noqa: E402
+from encoders import CategoricalEncoder  # noqa: E402
+import model as model_module  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def loan_data():
+    """The processed training frame and its encoder, as the app loads them."""
+    df, _, label_encoders, _ = load_data(keep_raw=False)
+    return df, CategoricalEncoder.from_label_encoders(label_encoders)
+
+
+@pytest.fixture(scope="session")
+def store_dir(tmp_path_factory):
+    """Feature-store directory for the tests' training runs, outside saved_models/."""
+    return tmp_path_factory.mktemp("features")
+
+
+@pytest.fixture(scope="session", params=["svc", "sgd"])
+def trained_bundle(request, loan_data, store_dir):
+    """A model bundle trained in memory, so the tests never touch saved_models/."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        return model_module.train_model(loan_data[0], engine=request.param, store_dir=store_dir)
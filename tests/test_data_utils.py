@@ -0,0 +1,106 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_utils import (
+    CATEGORICAL_COLUMNS, CODE_COLUMNS, DATA_PATH, RAW_DTYPES, build_label_encoders, compute_ingestion_stats,
+    load_data, load_labelled_batch, preprocess_data,
+)
+from features import FEATURE_DTYPE
+import model as model_module
+
+
+@pytest.fixture(scope="module")
+def full_width_data():
+    """The processed training frame in the int64/float64 schema."""
+    return load_data(keep_raw=False, compact=False)[0]
+
+
+def test_compact_schema_dtypes(loan_data):
+    df = loan_data[0]
+    for col in df.columns:
+        assert df[col].dtype == (np.int8 if col in CODE_COLUMNS else FEATURE_DTYPE), col
+
+
+def test_compact_schema_keeps_the_full_width_values(loan_data, full_width_data):
+    compact = loan_data[0]
+    assert list(compact.columns) == list(full_width_data.columns)
+    for col in CODE_COLUMNS:
+        np.testing.assert_array_equal(compact[col].to_numpy(dtype=np.int64), full_width_data[col].to_numpy(), col)
+    for col in compact.columns.difference(CODE_COLUMNS):
+        np.testing.assert_array_equal(compact[col].to_numpy(), full_width_data[col].to_numpy(dtype=FEATURE_DTYPE), col)
+
+
+def test_both_schemas_train_the_same_model(loan_data, full_width_data, store_dir):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        compact_bundle = model_module.train_model(loan_data[0], store_dir=store_dir)
+        full_bundle = model_module.train_model(full_width_data, store_dir=store_dir)
+    np.testing.assert_array_equal(compact_bundle[4], full_bundle[4])
+    assert compact_bundle[-1] == full_bundle[-1]
+
+
+@pytest.fixture
+def partly_unlabelled_csv(tmp_path):
+    raw = pd.read_csv(DATA_PATH, dtype=RAW_DTYPES).head(40)
+    raw.loc[[3, 7], "Loan_Status"] = np.nan
+    csv_path = tmp_path / "applications.csv"
+    raw.to_csv(csv_path, index=False)
+    return csv_path
+
+
+def test_compact_schema_rejects_unlabelled_rows(partly_unlabelled_csv):
+    with pytest.raises(ValueError, match=r"'Loan_Status': 2"):
+        load_data(partly_unlabelled_csv, keep_raw=False)
+    df = load_data(partly_unlabelled_csv, keep_raw=False, compact=False)[0]
+    assert df["Loan_Status"].isna().sum() == 2
+
+
+def test_labelled_batch_skips_unlabelled_rows(partly_unlabelled_csv):
+    label_encoders = load_data(keep_raw=False)[2]
+    batch = load_labelled_batch(partly_unlabelled_csv, label_encoders)
+    assert len(batch) == 38
+    assert batch["Loan_Status"].dtype == np.int8
+
+
+def test_blank_batch_column_falls_back_to_training_fills(tmp_path):
+    raw = pd.read_csv(DATA_PATH, dtype=RAW_DTYPES)
+    training_fills = compute_ingestion_stats()["fill_values"]
+    batch = raw.head(5).copy()
+    batch["Self_Employed"] = np.nan
+    batch["Loan_Amount_Term"] = np.nan
+    csv_path = tmp_path / "batch.csv"
+    batch.to_csv(csv_path, index=False)
+    label_encoders = load_data(keep_raw=False)[2]
+
+    with pytest.raises(ValueError, match="Self_Employed"):
+        load_labelled_batch(csv_path, label_encoders)
+    loaded = load_labelled_batch(csv_path, label_encoders, training_fills)
+    self_employed_code = label_encoders["Self_Employed"].transform([training_fills["Self_Employed"]])[0]
+    assert (loaded["Self_Employed"] == self_employed_code).all()
+    assert (loaded["Loan_Amount_Term"] == training_fills["Loan_Amount_Term"]).all()
+    np.testing.assert_array_equal(loaded["Married"], label_encoders["Married"].transform(batch["Married"]))
+
+
+
+def _applications_with_property_areas(n_categories):
+    """Raw applications with one distinct Property_Area per row, and encoders fitted on them."""
+    raw = pd.read_csv(DATA_PATH, dtype=RAW_DTYPES).head(n_categories).reset_index(drop=True)
+    raw["Property_Area"] = [f"area-{position:03d}" for position in range(n_categories)]
+    label_encoders = build_label_encoders({col: raw[col].dropna().unique() for col in CATEGORICAL_COLUMNS})
+    return raw, label_encoders
+
+
+def test_compact_schema_stores_128_categories_as_int8():
+    raw, label_encoders = _applications_with_property_areas(128)
+    df = preprocess_data(raw, compute_ingestion_stats()["fill_values"], label_encoders)
+    assert df["Property_Area"].dtype == np.int8
+    assert df["Property_Area"].max() == 127
+
+
+def test_compact_schema_rejects_129_categories():
+    raw, label_encoders = _applications_with_property_areas(129)
+    with pytest.raises(ValueError, match="Property_Area"):
+        preprocess_data(raw, compute_ingestion_stats()["fill_values"], label_encoders)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from financial_utils import (ANNUITY_TABLE, AnnuityTable, calculate_affordable_loan, calculate_affordable_loan_batch,
+                             calculate_emi, calculate_emi_batch)
+
+
+def exact_factor(interest_rate, tenure_months):
+    """The EMI formula written out per loan, as the code computed it before the table."""
+    monthly_rate = (interest_rate / 100) / 12
+    if monthly_rate == 0:
+        return 1 / tenure_months
+    growth = (1 + monthly_rate) ** tenure_months
+    return monthly_rate * growth / (growth - 1)
+
+
+OFF_GRID_RATES = [0.0, 4.95, 8.55, 8.499999999999, 12.345, 18.5, 24.0]
+OFF_GRID_TERMS = [1, 6, 13, 359, 361, 600]
+
+
+def test_table_covers_the_slider_and_the_data_terms():
+    assert ANNUITY_TABLE.rates[0] == 5.0 and ANNUITY_TABLE.rates[-1] == 18.0
+    assert len(ANNUITY_TABLE.rates) == 131
+    assert 360 in ANNUITY_TABLE.terms
+
+
+def test_scalar_factor_matches_the_exact_formula():
+    rates = ANNUITY_TABLE.rates.tolist() + OFF_GRID_RATES
+    terms = ANNUITY_TABLE.terms.tolist() + OFF_GRID_TERMS
+    for rate in rates:
+        for term in terms:
+            assert ANNUITY_TABLE.factor(rate, term) == pytest.approx(exact_factor(rate, term), rel=1e-12)
+
+
+@pytest.mark.parametrize("rate", [8.5, 5.0, 18.0, 8.55, 0.0])
+def test_lookup_for_one_rate_matches_the_exact_formula(rate):
+    terms = np.array(ANNUITY_TABLE.terms.tolist() + OFF_GRID_TERMS, dtype=float)
+    expected = [exact_factor(rate, term) for term in terms]
+    np.testing.assert_allclose(ANNUITY_TABLE.lookup(rate, terms), expected, rtol=1e-12, atol=0)
+
+
+def test_lookup_with_a_rate_per_loan_matches_the_exact_formula():
+    rng = np.random.default_rng(0)
+    rates = np.round(rng.uniform(0, 20, 500), 2)
+    terms = rng.choice(ANNUITY_TABLE.terms.tolist() + OFF_GRID_TERMS, 500).astype(float)
+    expected = [exact_factor(rate, term) for rate, term in zip(rates, terms)]
+    np.testing.assert_allclose(ANNUITY_TABLE.lookup(rates, terms), expected, rtol=1e-12, atol=0)
+
+
+def test_lookup_broadcasts_a_rate_by_term_grid():
+    rates = np.array([5.0, 8.5, 9.25])
+    terms = np.array([12.0, 100.0, 360.0])
+    factors = ANNUITY_TABLE.lookup(rates[:, None], terms[None, :])
+    assert factors.shape == (3, 3)
+    for i, rate in enumerate(rates):
+        for j, term in enumerate(terms):
+            assert factors[i, j] == pytest.approx(exact_factor(rate, term), rel=1e-12)
+
+
+def test_emi_and_affordability_helpers_use_the_same_factors():
+    assert calculate_emi(100_000, 8.5, 360) == pytest.approx(100_000 * exact_factor(8.5, 360), rel=1e-12)
+    amounts = np.array([50_000.0, 100_000.0, 250_000.0])
+    np.testing.assert_allclose(calculate_emi_batch(amounts, 8.5, 360), amounts * exact_factor(8.5, 360),
+                               rtol=1e-12)
+
+    affordable = calculate_affordable_loan(6_000, 8.5, 360)
+    assert calculate_emi(affordable, 8.5, 360) == pytest.approx(6_000 * 0.3, rel=1e-12)
+    np.testing.assert_allclose(calculate_affordable_loan_batch([6_000, 9_000], 8.5, [360, 180]),
+                               [calculate_affordable_loan(6_000, 8.5, 360), calculate_affordable_loan(9_000, 8.5, 180)],
+                               rtol=1e-12)
+
+
+def test_custom_grid():
+    table = AnnuityTable(rate_grid=(1.0, 2.0, 0.5), terms=(24, 12))
+    np.testing.assert_array_equal(table.rates, [1.0, 1.5, 2.0])
+    np.testing.assert_array_equal(table.terms, [12.0, 24.0])
+    assert table.factor(1.5, 24) == pytest.approx(exact_factor(1.5, 24), rel=1e-12)
@@ -0,0 +1,31 @@
+import shutil
+import warnings
+
+import pytest
+
+import cv_scheduler
+from feature_store import get_or_build_feature_store
+import model as model_module
+
+
+@pytest.fixture(autouse=True)
+def ignore_sklearn_deprecations():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        yield
+
+
+def test_get_or_train_model_keeps_its_feature_store_in_artifact_dir(loan_data, tmp_path):
+    model_module.get_or_train_model(loan_data[0], artifact_dir=tmp_path, engine="sgd")
+    assert model_module.artifact_path_for(model_module.compute_model_fingerprint(loan_data[0], "sgd"),
+                                          tmp_path).exists()
+    assert len(list(model_module.feature_store_dir(tmp_path).glob("features-*"))) == 1
+
+
+def test_search_reports_a_removed_feature_store(loan_data, tmp_path):
+    from sklearn.svm import SVC
+
+    store = get_or_build_feature_store(loan_data[0], tmp_path)
+    shutil.rmtree(store.path)
+    with pytest.raises(FileNotFoundError, match="was removed"):
+        cv_scheduler.search(SVC(kernel="linear"), {"C": [1]}, store, store.y_train, workers=1)
@@ -0,0 +1,78 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import model as model_module
+from scorer import LinearScorer, load_scorer
+
+
+@pytest.fixture
+def scorer(trained_bundle, loan_data):
+    model, scaler = trained_bundle[:2]
+    return LinearScorer.from_estimator(model, scaler, trained_bundle[-1], loan_data[1])
+
+
+@pytest.fixture(autouse=True)
+def ignore_sklearn_deprecations():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        yield
+
+
+def test_folded_scorer_matches_predict_loan_approval(trained_bundle, loan_data, scorer):
+    model, scaler = trained_bundle[:2]
+    features = loan_data[0][trained_bundle[-1]].to_numpy(dtype=float)
+    predictions, probabilities = scorer.predict(features)
+
+    for row, prediction, probability in zip(features, predictions, probabilities):
+        expected_prediction, expected_probability, _ = model_module.predict_loan_approval(
+            model, scaler, row.reshape(1, -1)
+        )
+        assert prediction == expected_prediction
+        np.testing.assert_allclose(probability, expected_probability, rtol=0, atol=1e-9)
+
+
+def test_folded_decision_matches_model(trained_bundle, loan_data, scorer):
+    model, scaler = trained_bundle[:2]
+    features = loan_data[0][trained_bundle[-1]].to_numpy(dtype=float)
+    np.testing.assert_allclose(scorer.decision_function(features),
+                               model.decision_function(scaler.transform(features)), rtol=0, atol=1e-9)
+
+
+def test_saved_artifact_round_trips(trained_bundle, loan_data, scorer, tmp_path):
+    artifact_path = tmp_path / "loan_scorer.npz"
+    scorer.save(artifact_path)
+    loaded = load_scorer(artifact_path)
+    features = loan_data[0][trained_bundle[-1]].to_numpy(dtype=float)
+    np.testing.assert_array_equal(loaded.predict(features)[1], scorer.predict(features)[1])
+    assert loaded.feature_names == scorer.feature_names
+
+
+def test_batch_scoring_does_not_depend_on_batch_composition(trained_bundle, loan_data, scorer):
+    model, scaler = trained_bundle[:2]
+    features = loan_data[0][trained_bundle[-1]].to_numpy(dtype=np.float32)
+    batch_probabilities = scorer.predict(features)[1]
+    model_probabilities = model_module.predict_loan_approval_batch(model, scaler, features)[1]
+    for position, row in enumerate(features[:50]):
+        np.testing.assert_allclose(scorer.predict(row)[1][0], batch_probabilities[position], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(model_module.predict_loan_approval_batch(model, scaler, row)[1][0],
+                                   model_probabilities[position], rtol=0, atol=1e-12)
+
+
+def test_float32_input_scores_like_float64(trained_bundle, loan_data, scorer):
+    features = loan_data[0][trained_bundle[-1]]
+    predictions32, probabilities32 = scorer.predict(features.to_numpy(dtype=np.float32))
+    predictions64, probabilities64 = scorer.predict(features.to_numpy(dtype=np.float64))
+    np.testing.assert_array_equal(predictions32, predictions64)
+    np.testing.assert_array_equal(probabilities32, probabilities64)
+
+
+def test_failed_save_leaves_no_temporary_file(scorer, tmp_path, monkeypatch):
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("scorer.os.replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        scorer.save(tmp_path / "loan_scorer.npz")
+    assert list(tmp_path.iterdir()) == []
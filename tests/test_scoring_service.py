@@ -0,0 +1,45 @@
+import asyncio
+import json
+
+import pytest
+
+from scoring_service import ScoringService, parse_applicant
+
+
+APPLICANT = {
+    "Gender": "Male",
+    "Married": "Yes",
+    "Dependents": "1",
+    "Education": "Graduate",
+    "Self_Employed": "No",
+    "ApplicantIncome": 5000,
+    "CoapplicantIncome": 1500,
+    "LoanAmount": 150_000,
+    "Loan_Amount_Term": 360,
+    "Credit_History": 1.0,
+    "Property_Area": "Semiurban",
+}
+
+
+def test_parse_applicant_converts_numbers(loan_data):
+    applicant = parse_applicant(dict(APPLICANT, LoanAmount="150000"), loan_data[1])
+    assert applicant["LoanAmount"] == 150_000.0
+    assert applicant["interest_rate"] == 8.5
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), "-Infinity", "nan"])
+def test_parse_applicant_rejects_non_finite_numbers(loan_data, value):
+    with pytest.raises(ValueError, match="ApplicantIncome must be a finite number"):
+        parse_applicant(dict(APPLICANT, ApplicantIncome=value), loan_data[1])
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_score_endpoint_rejects_nan_tokens(trained_bundle, loan_data):
+    from scorer import LinearScorer
+
+    scorer = LinearScorer.from_estimator(*trained_bundle[:2], trained_bundle[-1], loan_data[1])
+    body = json.dumps(dict(APPLICANT, interest_rate=float("nan"))).encode()
+    assert b"NaN" in body
+    status, response = asyncio.run(ScoringService(scorer)._dispatch("POST", "/score", body))
+    assert status == 400
+    assert "interest_rate" in response["error"]
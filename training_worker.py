@@ -0,0 +1,144 @@
+"""
+Background model training
+
+Trains and publishes the model bundle (and the inference artifact) outside the
+Streamlit request cycle. Run it directly as a job:
+
+    python training_worker.py --engine svc
+
+or let the app launch it with start_background_training. A file lock in the
+artifact directory guarantees that only one trainer runs at a time.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import model as model_module
+from data_utils import load_data_cached
+
+
+TRAINING_LOCK_PATH = model_module.MODEL_ARTIFACT_DIR / ".training.lock"
+TRAINING_LOG_PATH = model_module.MODEL_ARTIFACT_DIR / "training.log"
+
+
+class FileLock:
+    """
+    Non-blocking exclusive lock on a file, shared across processes
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows. The operating
+    system drops the lock when the holder exits, so a crashed trainer never
+    leaves a stale lock behind.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+
+    def acquire(self):
+        """Try to take the lock; return False immediately if another process holds it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path, "a+")
+        try:
+            if os.name == "nt":
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+
+    def release(self):
+        if self._file is None:
+            return
+        if os.name == "nt":
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    def is_held_elsewhere(self):
+        """Whether another process currently holds the lock."""
+        if not self.acquire():
+            return True
+        self.release()
+        return False
+
+
+def run_training(engine="svc", artifact_dir=model_module.MODEL_ARTIFACT_DIR):
+    """
+    Train (if needed) and publish the model for the current dataset
+
+    Args:
+        engine (str): Training engine passed to train_model
+        artifact_dir (str or Path): Directory holding the model bundles
+
+    Returns:
+        str: Fingerprint of the published model, or None if another trainer is running
+    """
+    lock = FileLock(Path(artifact_dir) / TRAINING_LOCK_PATH.name)
+    if not lock.acquire():
+        return None
+    try:
+        df, _, label_encoders, _ = load_data_cached()
+        model_bundle = model_module.get_or_train_model(df, artifact_dir=artifact_dir, engine=engine)
+        model_module.export_inference_artifact(model_bundle[0], model_bundle[1], model_bundle[-1], label_encoders,
+                                               model_module.inference_artifact_path(artifact_dir))
+        return model_module.compute_model_fingerprint(df, engine)
+    finally:
+        lock.release()
+
+
+def start_background_training(engine="svc"):
+    """
+    Launch the training worker in a detached process unless one is already running
+
+    Args:
+        engine (str): Training engine passed to the worker
+
+    Returns:
+        bool: True if a new worker process was started
+    """
+    if FileLock(TRAINING_LOCK_PATH).is_held_elsewhere():
+        return False
+
+    TRAINING_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    detach = (
+        {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if os.name == "nt"
+        else {"start_new_session": True}
+    )
+    with open(TRAINING_LOG_PATH, "ab") as log_file:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--engine", engine],
+            cwd=Path(__file__).resolve().parent,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            **detach,
+        )
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train and publish the loan approval model.")
+    parser.add_argument("--engine", choices=model_module.TRAINING_ENGINES, default="svc")
+    args = parser.parse_args()
+
+    fingerprint = run_training(engine=args.engine)
+    if fingerprint is None:
+        print("Another training worker holds the lock; nothing to do.")
+    else:
+        print(f"Published model {fingerprint}")
+
+
+if __name__ == "__main__":
+    main()
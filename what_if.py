@@ -0,0 +1,120 @@
+"""
+What-if sweeps over loan amount, tenure and interest rate for one applicant
+
+Rather than rerunning the single-applicant pipeline for every combination a
+user might try, sweep_applicant scores a whole (amount x tenure x rate) grid in
+one pass. The model's EMI features use a fixed reference rate, so the model
+only needs one row per (amount, tenure) pair and its probabilities are shared
+along the rate axis. The financial checks broadcast across all three axes,
+with annuity factors computed once per (tenure, rate) pair.
+
+Scoring goes through the folded LinearScorer, one matrix-vector product for
+the whole grid, so like the scorer this module needs neither pandas nor
+scikit-learn.
+"""
+import numpy as np
+
+from features import build_feature_matrix, compute_engineered_features
+from financial_utils import RATE_GRID, perform_financial_checks_batch
+from instrumentation import instrumented
+
+
+# Default axes: 100 loan amounts, 40 tenures in whole years and the app's interest-rate range in 0.5% steps
+AMOUNT_STEPS = 100
+TENURE_AXIS = np.arange(12, 481, 12, dtype=float)
+RATE_AXIS = np.arange(RATE_GRID[0], RATE_GRID[1] + 1e-9, 0.5)
+MIN_LOAN_AMOUNT = 10_000
+
+
+def default_axes(loan_amount, loan_term, interest_rate):
+    """
+    Sweep axes centred on an application, always containing its own values
+
+    Args:
+        loan_amount (float): Requested loan amount in rupees
+        loan_term (int): Requested loan term in months
+        interest_rate (float): Annual interest rate in percentage
+
+    Returns:
+        tuple: (loan_amounts, tenures, rates) sorted 1-D arrays
+    """
+    top = max(2.0 * loan_amount, 4 * MIN_LOAN_AMOUNT)
+    loan_amounts = np.round(np.linspace(MIN_LOAN_AMOUNT, top, AMOUNT_STEPS), -3)
+    loan_amounts = np.union1d(loan_amounts, [loan_amount])
+    tenures = np.union1d(TENURE_AXIS, [loan_term])
+    rates = np.union1d(np.round(RATE_AXIS, 1), [round(interest_rate, 1)])
+    return loan_amounts, tenures, rates
+
+
+@instrumented("what_if_sweep")
+def sweep_applicant(scorer, applicant_data, loan_amounts, tenures, rates, existing_debt=0):
+    """
+    Score one applicant over every (loan amount, tenure, rate) combination
+
+    Args:
+        scorer (LinearScorer): Scorer for the serving model
+        applicant_data (dict): Applicant fields as passed to create_input_data
+        loan_amounts (array-like): Loan amounts in rupees (axis 0)
+        tenures (array-like): Loan terms in months (axis 1)
+        rates (array-like): Annual interest rates in percentage (axis 2)
+        existing_debt (float): Existing monthly debt payments
+
+    Returns:
+        dict: The axes, plus (amounts, tenures, rates) arrays with the perform_financial_checks keys,
+        approval_probability, model_approves and approvable (model approves and financially feasible)
+    """
+    loan_amounts = np.asarray(loan_amounts, dtype=float)
+    tenures = np.asarray(tenures, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    shape = (len(loan_amounts), len(tenures), len(rates))
+
+    # Encode the applicant once, then overwrite only the loan-dependent columns for each (amount, tenure).
+    feature_names = scorer.feature_names
+    applicant_input = build_feature_matrix({col: [value] for col, value in applicant_data.items()},
+                                           scorer.encoder, feature_names)
+    grid_input = np.repeat(applicant_input, shape[0] * shape[1], axis=0).reshape(shape[0], shape[1], -1)
+    loan_columns = compute_engineered_features(
+        applicant_data["ApplicantIncome"],
+        applicant_data["CoapplicantIncome"],
+        loan_amounts[:, None],
+        tenures[None, :],
+    )
+    loan_columns["LoanAmount"] = loan_amounts[:, None]
+    loan_columns["Loan_Amount_Term"] = tenures[None, :]
+    for position, col in enumerate(feature_names):
+        if col in loan_columns:
+            grid_input[:, :, position] = loan_columns[col]
+
+    predictions, probabilities = scorer.predict(grid_input.reshape(-1, len(feature_names)))
+    model_approves = (predictions == 1).reshape(shape[0], shape[1], 1)
+    approval_probability = probabilities[:, 1].reshape(shape[0], shape[1], 1)
+
+    checks = perform_financial_checks_batch(
+        loan_amounts[:, None, None],
+        tenures[None, :, None],
+        applicant_data["ApplicantIncome"],
+        applicant_data["CoapplicantIncome"],
+        existing_debt,
+        rates[None, None, :],
+    )
+    # Every entry comes back with the full grid shape; the model outputs are read-only broadcasts along rates.
+    sweep = {name: np.broadcast_to(values, shape) for name, values in checks.items()}
+    sweep["approval_probability"] = np.broadcast_to(approval_probability, shape)
+    sweep["model_approves"] = np.broadcast_to(model_approves, shape)
+    sweep["approvable"] = model_approves & sweep["financially_feasible"]
+    sweep.update(loan_amounts=loan_amounts, tenures=tenures, rates=rates)
+    return sweep
+
+
+def max_approvable_amount(sweep):
+    """
+    Largest approvable loan amount for each (tenure, rate) pair of a sweep
+
+    Args:
+        sweep (dict): Result of sweep_applicant
+
+    Returns:
+        numpy.ndarray: (tenures, rates) array of amounts in rupees, NaN where no amount is approvable
+    """
+    largest = np.where(sweep["approvable"], sweep["loan_amounts"][:, None, None], -np.inf).max(axis=0)
+    return np.where(np.isneginf(largest), np.nan, largest)